@@ -0,0 +1,44 @@
+"""This benchmark times stepping many games of Snake at once with the
+BatchSnake, reporting game steps per second for different numbers of games.
+It runs without opening a window.
+
+Usage:
+    python benchmarks/batch_snake_benchmark.py [--games 1 64 1024 8192]
+        [--steps 500] [--size 10 10]"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy  # noqa: E402
+from pygame_gridcalculator.batchsnake import BatchSnake  # noqa: E402
+
+
+def time_steps(games: int, steps: int, size: tuple) -> float:
+    """Returns the game steps per second with random turns."""
+    snake = BatchSnake(games, *size, seed=0)
+    actions = numpy.random.default_rng(0).integers(-1, 4, (steps, games))
+    start = time.perf_counter()
+    for step_actions in actions:
+        snake.step(step_actions)
+    return games * steps / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, nargs="+",
+                        default=[1, 64, 1024, 8192])
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--size", type=int, nargs=2, default=(10, 10))
+    args = parser.parse_args()
+
+    print("{:>8} {:>16}".format("games", "steps / second"))
+    for games in args.games:
+        print("{:>8} {:>16,.0f}".format(
+            games, time_steps(games, args.steps, tuple(args.size))))
+
+
+if __name__ == "__main__":
+    main()
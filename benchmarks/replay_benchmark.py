@@ -0,0 +1,69 @@
+"""This benchmark replays a draw log written by a DrawRecorder as fast as
+possible, reporting frames per second.  Without a log, a synthetic session is
+recorded first.  It runs without opening a window, so it can be used to
+profile drawing away from the game (such as under cProfile).
+
+Usage:
+    python benchmarks/replay_benchmark.py [log] [--frames 300]
+        [--repeat 3]"""
+
+import argparse
+import os
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+from pygame_gridcalculator import GridCalculator  # noqa: E402
+from pygame_gridcalculator.recorder import (  # noqa: E402
+    DrawPlayer,
+    DrawRecorder,
+    RecordingShapeFactory
+)
+
+
+def record_session(path: str, frames: int) -> None:
+    """Records a synthetic session of a 40x30 grid with moving shapes."""
+    surface = pygame.Surface((800, 600))
+    grid = GridCalculator(799, 599, 40, 30)
+    with DrawRecorder(path) as recorder:
+        shape_factory = RecordingShapeFactory(grid, recorder)
+        for frame in range(frames):
+            shape_factory.fill(surface, (255, 255, 255))
+            shape_factory.draw_grid_to_surface(surface, (220, 220, 220))
+            for index in range(200):
+                left, top = (index * 7 + frame) % 40, (index * 3) % 30
+                shape_factory.draw_cell(surface, (index % 255, 100, 150),
+                                        left, top)
+            for index in range(20):
+                shape_factory.draw_circle(surface, (200, 50, 50),
+                                          ((index * 2 + frame / 10) % 40,
+                                           index * 1.5), 6)
+            recorder.frame()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("log", nargs="?")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.log
+        if path is None:
+            path = os.path.join(directory, "session.pgdr")
+            record_session(path, args.frames)
+        print("log size: {:,} bytes".format(os.path.getsize(path)))
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            with DrawPlayer(path) as player:
+                frames = player.play()
+            elapsed = time.perf_counter() - start
+            print("{:,} frames in {:.3f}s ({:,.0f} frames / second)".format(
+                frames, elapsed, frames / elapsed))
+
+
+if __name__ == "__main__":
+    main()
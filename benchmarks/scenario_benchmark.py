@@ -0,0 +1,267 @@
+"""This benchmark runs the examples end to end without opening a window, with
+scripted clicks, key presses and window resizes and a fixed number of frames,
+reporting the p50, p95 and p99 frame times and the peak memory of each.  The
+results are compared against a stored baseline, so regressions in what users
+actually see (such as a ShapeFactory being built every frame or the whole
+display being redrawn) are caught, not only in single methods.
+
+The examples are run unchanged: pygame.display.update is replaced to time
+each frame and post the next frame's scripted events, and their frame rate
+clocks are replaced so they run as fast as possible.  The exit status is 1 if
+any result is slower or bigger than the baseline by more than the tolerance.
+
+Usage:
+    python benchmarks/scenario_benchmark.py [--scenarios snake ...]
+        [--frames 600] [--warmup 10] [--baseline path] [--save-baseline]
+        [--tolerance 0.25]"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        os.pardir, "examples")
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "scenario_baseline.json")
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "peak_kib")
+
+
+def click(pos: tuple) -> list:
+    """Returns the events for a left click at a pixel position."""
+    return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos),
+            pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=pos)]
+
+
+def key(key_code: int) -> list:
+    """Returns the events for pressing and releasing a key."""
+    return [pygame.event.Event(pygame.KEYDOWN, key=key_code, mod=0),
+            pygame.event.Event(pygame.KEYUP, key=key_code, mod=0)]
+
+
+def resize(width: int, height: int) -> list:
+    """Returns a resize of the window, which is made before the event for it
+    is posted."""
+    return [("resize", width, height)]
+
+
+def grid_display_script(frame: int, frames: int, size: tuple) -> list:
+    """Clicks the + button every 10 frames for the first half and the -
+    button for the second, resizing the window in between."""
+    if frame == frames // 3:
+        return resize(400, 300)
+    if frame % 10 != 5:
+        return []
+    expands = min(frame, frames // 2) // 10
+    if frame < frames // 2:
+        return click((5, 5))
+    # The - button is the second cell on the top row of the current grid
+    cells = max(5, 5 + expands - (frame - frames // 2) // 10)
+    return click((int(size[0] * 1.5 / cells), 5))
+
+
+def grid_resize_script(frame: int, frames: int, size: tuple) -> list:
+    """Resizes the window every 150 frames, as the example already resizes
+    its grid every 60."""
+    if frame and frame % 150 == 0:
+        return resize(*((450, 350) if size == (300, 300) else (300, 300)))
+    return []
+
+
+def multiple_grids_script(frame: int, frames: int, size: tuple) -> list:
+    """Resizes the window every 50 frames, including to a size that only
+    leaves 50 pixels for the main grid."""
+    sizes = ((400, 400), (500, 250), (150, 150), (300, 300))
+    if frame and frame % 50 == 0:
+        return resize(*sizes[(frame // 50) % len(sizes)])
+    return []
+
+
+def shapefactory_script(frame: int, frames: int, size: tuple) -> list:
+    """Resizes the window every 100 frames."""
+    if frame and frame % 100 == 0:
+        return resize(*((600, 450) if size == (300, 300) else (300, 300)))
+    return []
+
+
+def snake_script(frame: int, frames: int, size: tuple) -> list:
+    """Turns the snake every 7 frames in a loop it can't run into itself
+    on, and resizes the window every 120 frames."""
+    events = []
+    if frame and frame % 120 == 0:
+        events += resize(*((500, 400) if size == (300, 300) else (300, 300)))
+    if frame % 7 == 3:
+        turns = (pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_DOWN)
+        events += key(turns[(frame // 7) % len(turns)])
+    return events
+
+
+# The scenarios, as the example module, its function and its script
+SCENARIOS = {
+    "grid_display": ("grid_display_example", "grid_display_example",
+                     grid_display_script),
+    "grid_resize": ("grid_resize_example", "grid_resize_example",
+                    grid_resize_script),
+    "multiple_grids": ("multiple_grids_example", "multiple_grids_example",
+                       multiple_grids_script),
+    "shapefactory": ("shapefactory_example", "start_shapes_example",
+                     shapefactory_script),
+    "snake": ("snake_example", "start_snake_example", snake_script)
+}
+
+
+class _NoWaitClock:
+    """Replaces a pygame Clock so examples don't wait between frames."""
+
+    @staticmethod
+    def tick(*args) -> int:
+        return 0
+
+
+class ScenarioRun:
+    """Runs an example for a fixed number of frames, posting its scripted
+    events and timing each frame from one display update to the next."""
+
+    def __init__(self, module_name: str, function_name: str, script,
+                 frames: int):
+        self._module = importlib.import_module(module_name)
+        self._function = getattr(self._module, function_name)
+        self._script = script
+        self._frames = frames
+        self._frame = 0
+        self._mouse = (0, 0)
+        self._last = 0.0
+        self.frame_times = []
+
+    def _post(self, frame: int) -> None:
+        """Posts the scripted events for a frame."""
+        size = pygame.display.get_surface().get_size()
+        for event in self._script(frame, self._frames, size):
+            if isinstance(event, tuple):
+                _, width, height = event
+                pygame.display.set_mode((width, height), pygame.RESIZABLE)
+                event = pygame.event.Event(pygame.VIDEORESIZE,
+                                           size=(width, height), w=width,
+                                           h=height)
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self._mouse = event.pos
+            pygame.event.post(event)
+
+    def _update(self, *args) -> None:
+        """Replaces pygame.display.update, ending each frame."""
+        now = time.perf_counter()
+        if self._frame >= self._frames:
+            return
+        self.frame_times.append(now - self._last)
+        self._frame += 1
+        if self._frame == self._frames:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        else:
+            self._post(self._frame)
+        self._last = time.perf_counter()
+
+    def run(self) -> list:
+        """Runs the example and returns the seconds each frame took."""
+        update, get_pos = pygame.display.update, pygame.mouse.get_pos
+        clock = getattr(self._module, "clock", None)
+        pygame.display.update = self._update
+        # The dummy video driver doesn't move the mouse for posted clicks
+        pygame.mouse.get_pos = lambda: self._mouse
+        if clock is not None:
+            self._module.clock = _NoWaitClock()
+        random.seed(0)
+        pygame.event.clear()
+        try:
+            pygame.display.set_mode((300, 300), pygame.RESIZABLE)
+            self._post(0)
+            self._last = time.perf_counter()
+            self._function()
+        finally:
+            pygame.display.update, pygame.mouse.get_pos = update, get_pos
+            if clock is not None:
+                self._module.clock = clock
+        return self.frame_times
+
+
+def run_scenario(name: str, frames: int, warmup: int) -> dict:
+    """Runs a scenario twice, once for the frame times and once under
+    tracemalloc for the peak memory, as tracing slows every frame down."""
+    module_name, function_name, script = SCENARIOS[name]
+    frame_times = ScenarioRun(module_name, function_name, script,
+                              frames).run()
+    tracemalloc.start()
+    ScenarioRun(module_name, function_name, script, frames).run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    times = sorted(frame_times[warmup:]) or sorted(frame_times)
+    percentiles = statistics.quantiles(times, n=100, method="inclusive") \
+        if len(times) > 1 else times * 99
+    return {"frames": len(frame_times),
+            "p50_ms": round(percentiles[49] * 1e3, 4),
+            "p95_ms": round(percentiles[94] * 1e3, 4),
+            "p99_ms": round(percentiles[98] * 1e3, 4),
+            "peak_kib": round(peak / 1024, 1)}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> bool:
+    """Prints each result against its baseline and returns if any result
+    has regressed by more than the tolerance."""
+    regressed = False
+    print("{:<16}{:>8}".format("scenario", "frames") + "".join(
+        "{:>22}".format(metric) for metric in METRICS))
+    for name, result in results.items():
+        line = "{:<16}{:>8}".format(name, result["frames"])
+        for metric in METRICS:
+            value = result[metric]
+            base = baseline.get(name, {}).get(metric)
+            if base:
+                change = (value - base) / base
+                flag = "!" if change > tolerance else " "
+                regressed = regressed or change > tolerance
+                line += "{:>13.2f} ({:+4.0%}){}".format(value, change, flag)
+            else:
+                line += "{:>22.2f}".format(value)
+        print(line)
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS),
+                        default=list(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    sys.path.insert(0, EXAMPLES)
+    results = {name: run_scenario(name, args.frames, args.warmup)
+               for name in args.scenarios}
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    regressed = compare(results, baseline, args.tolerance)
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w") as file:
+            json.dump(baseline, file, indent=4, sort_keys=True)
+            file.write("\n")
+        print("baseline saved to {}".format(args.baseline))
+    elif regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""This benchmark times drawing a large grid with the TileRenderer using
+different numbers of worker threads, to show how tiled drawing scales across
+cores.  It runs without opening a window.
+
+Usage:
+    python benchmarks/tile_renderer_benchmark.py [--width 7680]
+        [--height 4320] [--cells 480 270] [--tile 32 32] [--frames 10]
+        [--workers 1 2 4 8]"""
+
+import argparse
+import functools
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+from pygame_gridcalculator import GridCalculator  # noqa: E402
+from pygame_gridcalculator.tilerenderer import TileRenderer  # noqa: E402
+
+COLORS = [(200, 80, 80), (80, 200, 80), (80, 80, 200), (200, 200, 80)]
+
+
+def draw_map(size: tuple, grid: GridCalculator) -> pygame.Surface:
+    """Returns a surface with every cell filled, which stands in for the
+    terrain layer a strategy map renders once and reuses every frame."""
+    map_surface = pygame.Surface(size)
+    grid_width, grid_height = grid.size
+    for cell_left in range(grid_width):
+        for cell_top in range(grid_height):
+            pixel_left, pixel_top = grid.position(cell_left, cell_top)
+            pixel_right, pixel_bottom = grid.position(cell_left + 1,
+                                                      cell_top + 1)
+            map_surface.fill(COLORS[(cell_left + cell_top) % len(COLORS)],
+                             (pixel_left, pixel_top, pixel_right - pixel_left,
+                              pixel_bottom - pixel_top))
+    return map_surface
+
+
+def draw_tile(map_surface: pygame.Surface, surface: pygame.Surface,
+              shape_factory, cells: tuple) -> None:
+    """Blits the tile's part of the map and fills its top half as a
+    highlight, so each tile is one large blit and one large fill, which is
+    the drawing that pygame does without holding the GIL."""
+    left, top, width, height = cells
+    surface.blit(map_surface, (0, 0),
+                 pygame.Rect(surface.get_abs_offset(), surface.get_size()))
+    pixel_left, pixel_top = shape_factory.grid.position(left, top)
+    pixel_right, pixel_bottom = shape_factory.grid.position(
+        left + width, top + height // 2)
+    surface.fill((60, 60, 60), (pixel_left, pixel_top,
+                                pixel_right - pixel_left,
+                                pixel_bottom - pixel_top),
+                 special_flags=pygame.BLEND_RGB_ADD)
+
+
+def time_render(surface: pygame.Surface, grid: GridCalculator,
+                tile_size: tuple, workers: int, frames: int) -> float:
+    """Returns the average seconds taken to draw a frame."""
+    draw = functools.partial(draw_tile, draw_map(surface.get_size(), grid))
+    with TileRenderer(grid, tile_size, workers) as renderer:
+        # The first frame builds the tiles, so isn't timed
+        renderer.render(surface, draw, (255, 255, 255), (0, 0, 0))
+        start = time.perf_counter()
+        for _ in range(frames):
+            renderer.render(surface, draw, (255, 255, 255), (0, 0, 0))
+        return (time.perf_counter() - start) / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=7680)
+    parser.add_argument("--height", type=int, default=4320)
+    parser.add_argument("--cells", type=int, nargs=2, default=(480, 270))
+    parser.add_argument("--tile", type=int, nargs=2, default=(32, 32))
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    pygame.init()
+    surface = pygame.Surface((args.width, args.height))
+    grid = GridCalculator(args.width - 1, args.height - 1, *args.cells)
+    print("Surface {}x{}, grid {}x{}, tiles {}x{} cells, {} cores".format(
+        args.width, args.height, *args.cells, *args.tile, os.cpu_count()))
+    print("{:>8} {:>12} {:>8}".format("workers", "ms / frame", "speedup"))
+    baseline = None
+    for workers in args.workers:
+        seconds = time_render(surface, grid, tuple(args.tile), workers,
+                              args.frames)
+        baseline = baseline or seconds
+        print("{:>8} {:>12.1f} {:>7.2f}x".format(workers, seconds * 1000,
+                                                 baseline / seconds))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""This example file shows the FrameLoop running a grid view as an asyncio
+task.  A dot moves around the edge of the grid one cell per simulation step,
+five steps a second however fast the window is drawn, and is drawn between
+cells using the interpolation alpha.  A second coroutine prints the frame
+rate alongside the loop."""
+
+import asyncio
+
+import pygame
+from pygame_gridcalculator import GridCalculator
+from pygame_gridcalculator.frameloop import FrameLoop
+
+GRID_SIZE = 8
+
+pygame.init()
+
+
+def edge_cells() -> list:
+    """Returns the cells around the edge of the grid in clockwise order."""
+    last = GRID_SIZE - 1
+    return [(left, 0) for left in range(last)] + \
+        [(last, top) for top in range(last)] + \
+        [(left, last) for left in range(last, 0, -1)] + \
+        [(0, top) for top in range(last, 0, -1)]
+
+
+async def frame_loop_example() -> None:
+    display = pygame.display.set_mode((400, 400), pygame.RESIZABLE)
+    grid = GridCalculator(display.get_width(), display.get_height(),
+                          GRID_SIZE, GRID_SIZE)
+    path = edge_cells()
+    state = {"previous": 0, "current": 0}
+
+    def update(timestep: float) -> None:
+        # Move the dot on by one cell
+        state["previous"] = state["current"]
+        state["current"] = (state["current"] + 1) % len(path)
+
+    def render(alpha: float) -> None:
+        display.fill((255, 255, 255))
+        grid.draw_grid_to_surface(display)
+        # Draw the dot between its previous and current cell
+        left, top = loop.interpolate(path[state["previous"]],
+                                     path[state["current"]], alpha)
+        loop.shape_factory.draw_circle(display, (200, 50, 50),
+                                       (left + 0.5, top + 0.5),
+                                       grid.width_gap(0, 1) // 3)
+
+    async def report_fps() -> None:
+        frames = 0
+        while loop.running:
+            await asyncio.sleep(1)
+            print("{} frames per second".format(loop.frames - frames))
+            frames = loop.frames
+
+    loop = FrameLoop(update, render, timestep=0.2, fps=60, grid=grid)
+    await asyncio.gather(loop.run(), report_fps())
+
+
+if __name__ == "__main__":
+    asyncio.run(frame_loop_example())
@@ -5,7 +5,7 @@ how shapes scale with the grid."""
 
 import pygame
 import pygame.gfxdraw
-from gridcalculator import GridCalculator
+from pygame_gridcalculator import GridCalculator
 
 pygame.init()
 
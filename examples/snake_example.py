@@ -7,7 +7,7 @@ from enum import Enum
 
 import pygame
 import pygame.time
-from pygame_gridcalculator import GridCalculator, ShapeFactory
+from pygame_gridcalculator import BoundaryPolicy, GridCalculator, ShapeFactory
 
 pygame.init()
 clock = pygame.time.Clock()
@@ -39,24 +39,19 @@ def determine_snake_direction(event: pygame.event, snake_direction: Direction) -
     return snake_direction
 
 
-def determine_snake_position(snake_direction: Direction, snake_head_top: int, snake_head_left: int) -> tuple:
+def determine_snake_position(snake_direction: Direction, snake_head_top: int, snake_head_left: int,
+                             grid: GridCalculator) -> tuple:
     if snake_direction == Direction.UP:
         snake_head_top -= 1
-        if snake_head_top == -1:
-            snake_head_top = 9
     elif snake_direction == Direction.RIGHT:
         snake_head_left += 1
-        if snake_head_left == 10:
-            snake_head_left = 0
     elif snake_direction == Direction.DOWN:
         snake_head_top += 1
-        if snake_head_top == 10:
-            snake_head_top = 0
     elif snake_direction == Direction.LEFT:
         snake_head_left -= 1
-        if snake_head_left == -1:
-            snake_head_left = 9
 
+    # The grid wraps the snake around to the other side when it leaves it
+    snake_head_left, snake_head_top = grid.resolve_cell(snake_head_left, snake_head_top)
     return snake_head_top, snake_head_left
 
 
@@ -84,7 +79,8 @@ def start_snake_example() -> None:
     grid = GridCalculator(full_screen.points_from_right(1),
                           full_screen.points_from_bottom(1), 10, 10,
                           full_screen.points_from_left(1),
-                          full_screen.points_from_top(1))
+                          full_screen.points_from_top(1),
+                          boundary_policy=BoundaryPolicy.WRAP)
     # Game variables
     snake_head_left, snake_head_top = 5, 5
     snake_direction = Direction.DOWN
@@ -118,7 +114,7 @@ def start_snake_example() -> None:
         pygame.draw.rect(display, (255, 255, 255), border)
 
         # Draw snake position
-        get_positions = determine_snake_position(snake_direction, snake_head_top, snake_head_left)
+        get_positions = determine_snake_position(snake_direction, snake_head_top, snake_head_left, grid)
         snake_head_top, snake_head_left = get_positions
 
         # Create the snake head
@@ -1,6 +1,16 @@
 from pygame_gridcalculator.gridcalculator import (
+    BoundaryPolicy,
     GridCalculator,
     GridCalculatorException
 )
 from pygame_gridcalculator.shapefactory import ShapeFactory
-__all__ = ["GridCalculator", "GridCalculatorException", "ShapeFactory"]
+from pygame_gridcalculator.tilegridcalculator import (
+    HexGridCalculator,
+    IsometricGridCalculator
+)
+from pygame_gridcalculator.weightedgridcalculator import (
+    WeightedGridCalculator
+)
+__all__ = ["BoundaryPolicy", "GridCalculator", "GridCalculatorException",
+           "HexGridCalculator", "IsometricGridCalculator", "ShapeFactory",
+           "WeightedGridCalculator"]
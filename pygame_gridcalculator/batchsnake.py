@@ -0,0 +1,233 @@
+import numpy
+import pygame
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+from pygame_gridcalculator.shapefactory import ShapeFactory
+
+# Directions use the same order as the snake example's Direction enum
+UP, RIGHT, DOWN, LEFT = 0, 1, 2, 3
+_LEFT_STEPS = numpy.array([0, 1, 0, -1], dtype=numpy.intp)
+_TOP_STEPS = numpy.array([-1, 0, 1, 0], dtype=numpy.intp)
+
+
+class BatchSnake:
+    """Create a BatchSnake to step many independent games of Snake at once
+       without a display, such as for training agents.
+
+    Every game is held in NumPy arrays and stepped together: the cells of
+    each snake are a ring buffer of flat cell indexes (left * height + top)
+    and an occupancy array marks the cells each snake covers, so moving and
+    collision checks don't depend on the length of the snakes.  As in the
+    snake example, snakes wrap around the grid borders, can't reverse, grow
+    by one cell for each fruit and die when their head moves into any cell
+    of their body.
+
+    Parameters:
+        num_games (int): The number of games to run.
+        grid_width (int): (Optional) The number of cells from left to right
+                          (default = 10).
+        grid_height (int): (Optional) The number of cells from top to bottom
+                           (default = 10).
+        auto_reset (bool): (Optional) If True, games are restarted as soon
+                           as they end, otherwise ended games stop until
+                           reset is called (default = True).
+        seed (int): (Optional) The seed for placing fruit (default = None).
+    """
+
+    def __init__(self, num_games: int, grid_width: int = 10,
+                 grid_height: int = 10, auto_reset: bool = True,
+                 seed: int | None = None):
+        if num_games < 1:
+            raise GridCalculatorException("The number of games must be "
+                                          "greater than 0")
+        if grid_width < 2 or grid_height < 2:
+            raise GridCalculatorException("The grid must be at least 2 cells "
+                                          "wide and high")
+        self._size = (grid_width, grid_height)
+        self._cells = grid_width * grid_height
+        self._auto_reset = auto_reset
+        self._rng = numpy.random.default_rng(seed)
+        self._games = numpy.arange(num_games)
+        self.body = numpy.zeros((num_games, self._cells), dtype=numpy.intp)
+        self.head_index = numpy.zeros(num_games, dtype=numpy.intp)
+        self.length = numpy.zeros(num_games, dtype=numpy.intp)
+        self.direction = numpy.zeros(num_games, dtype=numpy.int8)
+        self.fruit = numpy.zeros(num_games, dtype=numpy.intp)
+        self.occupied = numpy.zeros((num_games, self._cells), dtype=bool)
+        self.alive = numpy.zeros(num_games, dtype=bool)
+        self.scores = numpy.zeros(num_games, dtype=numpy.int64)
+        self.reset()
+
+    def __repr__(self):
+        return "BatchSnake(games={};  grid: width={}, height={})".format(
+            len(self._games), *self._size)
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    @property
+    def size(self) -> tuple:
+        """Returns the size of the grid each game is played on.
+
+        Returns:
+            tuple: The size of the grid (width, height)."""
+        return self._size
+
+    @property
+    def heads(self) -> numpy.ndarray:
+        """Returns the cell of each snake's head.
+
+        Returns:
+            numpy.ndarray: The (left, top) of each head, indexed as
+                           [game, 0 or 1]."""
+        return numpy.stack(numpy.divmod(
+            self.body[self._games, self.head_index], self._size[1]), axis=1)
+
+    def reset(self, games: numpy.ndarray | None = None) -> None:
+        """Restarts games with a single cell snake in the centre of the grid
+        moving down.
+
+        Parameters:
+            games (numpy.ndarray): (Optional) A boolean mask or the indexes
+                                   of the games to restart (default = None,
+                                   every game)."""
+        games = self._games if games is None else self._games[games]
+        if not len(games):
+            return
+        start = (self._size[0] // 2) * self._size[1] + self._size[1] // 2
+        self.occupied[games] = False
+        self.occupied[games, start] = True
+        self.body[games, 0] = start
+        self.head_index[games] = 0
+        self.length[games] = 1
+        self.direction[games] = DOWN
+        self.alive[games] = True
+        self.scores[games] = 0
+        self._place_fruit(games)
+
+    def _place_fruit(self, games: numpy.ndarray) -> None:
+        """Moves the fruit of each game to a random unoccupied cell."""
+        while len(games):
+            cells = self._rng.integers(0, self._cells, len(games))
+            free = ~self.occupied[games, cells]
+            self.fruit[games[free]] = cells[free]
+            games = games[~free]
+
+    def step(self, actions: numpy.ndarray | None = None) -> tuple:
+        """Moves every snake one cell.
+
+        Parameters:
+            actions (numpy.ndarray): (Optional) The direction to turn each
+                                     snake (UP, RIGHT, DOWN or LEFT), or -1
+                                     to keep going.  Turning back on itself
+                                     is ignored (default = None, every snake
+                                     keeps going).
+
+        Returns:
+            tuple: The reward for each game (1 for eating fruit, -1 for
+                   dying and 0 otherwise) and whether each game ended, as
+                   (rewards, done) arrays."""
+        width, height = self._size
+        rewards = numpy.zeros(len(self._games), dtype=numpy.int8)
+        done = numpy.zeros(len(self._games), dtype=bool)
+        if actions is not None:
+            actions = numpy.asarray(actions)
+            turn = (actions >= 0) & (actions != (self.direction + 2) % 4) & \
+                self.alive
+            self.direction[turn] = actions[turn]
+        games = self._games[self.alive]
+        heads = self.body[games, self.head_index[games]]
+        lefts, tops = numpy.divmod(heads, height)
+        directions = self.direction[games]
+        new_heads = ((lefts + _LEFT_STEPS[directions]) % width) * height + \
+            (tops + _TOP_STEPS[directions]) % height
+
+        # Moving into any cell of the body, including the tail, ends the game
+        died = self.occupied[games, new_heads]
+        rewards[games[died]] = -1
+        done[games[died]] = True
+        self.alive[games[died]] = False
+        games, new_heads = games[~died], new_heads[~died]
+
+        ate = new_heads == self.fruit[games]
+        tail_games = games[~ate]
+        tails = self.body[tail_games, (self.head_index[tail_games] -
+                                       self.length[tail_games] + 1) %
+                          self._cells]
+        self.occupied[tail_games, tails] = False
+        self.head_index[games] = (self.head_index[games] + 1) % self._cells
+        self.body[games, self.head_index[games]] = new_heads
+        self.occupied[games, new_heads] = True
+
+        eaten = games[ate]
+        self.length[eaten] += 1
+        self.scores[eaten] += 1
+        rewards[eaten] = 1
+        # A snake filling the whole grid has won
+        won = eaten[self.length[eaten] == self._cells]
+        done[won] = True
+        self.alive[won] = False
+        self._place_fruit(eaten[self.length[eaten] < self._cells])
+
+        if self._auto_reset:
+            self.reset(done)
+        return rewards, done
+
+    def observations(self) -> numpy.ndarray:
+        """Returns the board of every game.
+
+        Returns:
+            numpy.ndarray: The cells of each game indexed as
+                           [game, left, top], with 0 for empty cells, 1 for
+                           the body, 2 for the head and 3 for fruit."""
+        boards = self.occupied.astype(numpy.int8)
+        boards[self._games, self.body[self._games, self.head_index]] = 2
+        boards[self._games, self.fruit] = 3
+        return boards.reshape(len(self._games), *self._size)
+
+    def snake_cells(self, game: int) -> list:
+        """Returns the cells of a single snake from tail to head.
+
+        Parameters:
+            game (int): The index of the game.
+
+        Returns:
+            list: The cells of the snake [(left, top), ...]."""
+        indexes = (self.head_index[game] - numpy.arange(
+            self.length[game])[::-1]) % self._cells
+        lefts, tops = numpy.divmod(self.body[game, indexes], self._size[1])
+        return list(zip(lefts.tolist(), tops.tolist()))
+
+    def render(self, surface: pygame.Surface, grid: GridCalculator,
+               game: int = 0) -> None:
+        """Draws a single game to a surface, in the colors of the snake
+        example.
+
+        Parameters:
+            surface (pygame.Surface): The surface to draw the game on.
+            grid (GridCalculator): The grid to draw the game with, which must
+                                   be the same size as the game.
+            game (int): (Optional) The index of the game to draw
+                        (default = 0)."""
+        if grid.size != self._size:
+            raise GridCalculatorException(
+                "The grid size ({}) must match the game size ({})".format(
+                    grid.size, self._size))
+        shape_factory = ShapeFactory(grid)
+        width, height = self._size
+
+        def cell_rect(left: int, top: int) -> pygame.Rect:
+            return shape_factory.Rect(left, top,
+                                      grid.width_gap(left, left + 1),
+                                      grid.height_gap(top, top + 1))
+
+        pygame.draw.rect(surface, (255, 255, 255), shape_factory.Rect(
+            0, 0, grid.width_gap(0, width), grid.height_gap(0, height)))
+        cells = self.snake_cells(game)
+        for left, top in cells[:-1]:
+            pygame.draw.rect(surface, (100, 200, 100), cell_rect(left, top))
+        pygame.draw.rect(surface, (200, 50, 50),
+                         cell_rect(*divmod(int(self.fruit[game]), height)))
+        pygame.draw.rect(surface, (100, 255, 100), cell_rect(*cells[-1]))
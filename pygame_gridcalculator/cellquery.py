@@ -0,0 +1,186 @@
+import math
+
+import numpy
+from pygame_gridcalculator.gridcalculator import GridCalculator
+
+
+class CellQuery:
+    """Create a CellQuery to find the grid cells covered by shapes specified
+       in grid points, matching the ShapeFactory draw methods without drawing
+       to a surface.
+
+    Results are returned as a (lefts, tops) tuple of NumPy index arrays, so
+    they can be used directly to index per-cell data indexed as [left, top].
+    Cells outside the grid are left out.
+
+    Parameters:
+        grid (GridCalculator): The grid to find cells in.
+    """
+
+    def __init__(self, grid: GridCalculator):
+        self.grid = grid
+
+    def _in_grid(self, lefts: numpy.ndarray,
+                 tops: numpy.ndarray) -> tuple:
+        """Returns only the cells that are inside the grid."""
+        width, height = self.grid.size
+        inside = (lefts >= 0) & (lefts < width) & (tops >= 0) & \
+                 (tops < height)
+        return lefts[inside], tops[inside]
+
+    @staticmethod
+    def _end_cell(point: float, step: int) -> int:
+        """Returns the cell a segment ends in along one axis, treating an end
+        point on a cell border as the end of the previous cell."""
+        cell = math.floor(point)
+        if step > 0 and cell == point:
+            cell -= 1
+        return cell
+
+    @classmethod
+    def _supercover(cls, grid_start_pos: tuple, grid_end_pos: tuple):
+        """Yields every cell a segment passes through, including both cells
+        beside a corner the segment passes exactly through."""
+        left_start, top_start = grid_start_pos
+        left_end, top_end = grid_end_pos
+        left_delta, top_delta = left_end - left_start, top_end - top_start
+        left_step = (left_delta > 0) - (left_delta < 0)
+        top_step = (top_delta > 0) - (top_delta < 0)
+        left = cls._end_cell(left_start, -left_step)
+        top = cls._end_cell(top_start, -top_step)
+        last_left = cls._end_cell(left_end, left_step)
+        last_top = cls._end_cell(top_end, top_step)
+        # The distance along the segment (0 - 1) to the next cell border and
+        # between cell borders on each axis
+        if left_step:
+            left_next = ((left + (left_step > 0)) - left_start) / left_delta
+            left_gap = abs(1 / left_delta)
+        else:
+            left_next = left_gap = math.inf
+        if top_step:
+            top_next = ((top + (top_step > 0)) - top_start) / top_delta
+            top_gap = abs(1 / top_delta)
+        else:
+            top_next = top_gap = math.inf
+        remaining = abs(last_left - left) + abs(last_top - top)
+        yield left, top
+        while remaining > 0:
+            if left_next < top_next:
+                left += left_step
+                left_next += left_gap
+                remaining -= 1
+            elif top_next < left_next:
+                top += top_step
+                top_next += top_gap
+                remaining -= 1
+            else:
+                yield left + left_step, top
+                yield left, top + top_step
+                left += left_step
+                top += top_step
+                left_next += left_gap
+                top_next += top_gap
+                remaining -= 2
+            yield left, top
+
+    def line(self, grid_start_pos: tuple, grid_end_pos: tuple) -> tuple:
+        """Returns the cells a line between two grid points passes through.
+
+        Parameters:
+            grid_start_pos (tuple): The start point in grid positions
+                                    (grid_left, grid_top).
+            grid_end_pos (tuple): The end point in grid positions
+                                  (grid_left, grid_top).
+
+        Returns:
+            tuple: The cells as index arrays (lefts, tops)."""
+        cells = numpy.array(list(self._supercover(grid_start_pos,
+                                                  grid_end_pos)),
+                            dtype=numpy.intp).reshape(-1, 2)
+        return self._in_grid(cells[:, 0], cells[:, 1])
+
+    def lines(self, closed: bool, grid_points: list) -> tuple:
+        """Returns the cells a series of connected lines pass through.
+
+        Parameters:
+            closed (bool): If True, the line between the first and last
+                           points is included.
+            grid_points (list): The list of points in grid positions
+                                (grid_left, grid_top).
+
+        Returns:
+            tuple: The cells as index arrays (lefts, tops)."""
+        points = list(grid_points)
+        if closed and len(points) > 2:
+            points.append(points[0])
+        cells = [cell for start, end in zip(points, points[1:])
+                 for cell in self._supercover(start, end)]
+        if len(points) == 1:
+            cells = list(self._supercover(points[0], points[0]))
+        cells = numpy.unique(numpy.array(cells, dtype=numpy.intp)
+                             .reshape(-1, 2), axis=0)
+        return self._in_grid(cells[:, 0], cells[:, 1])
+
+    def polygon(self, grid_points: list, outline: bool = True) -> tuple:
+        """Returns the cells a polygon covers, being the cells with their
+        centre inside the polygon and, by default, the cells its edges pass
+        through.
+
+        Parameters:
+            grid_points (list): A list of grid points in the format
+                                (grid_left, grid_top).
+            outline (bool): (Optional) If True, the cells the edges pass
+                            through are included (default = True).
+
+        Returns:
+            tuple: The cells as index arrays (lefts, tops)."""
+        points = numpy.asarray(grid_points, dtype=numpy.float64)
+        width, height = self.grid.size
+        left_min = max(int(math.floor(points[:, 0].min())), 0)
+        top_min = max(int(math.floor(points[:, 1].min())), 0)
+        left_max = min(int(math.ceil(points[:, 0].max())), width)
+        top_max = min(int(math.ceil(points[:, 1].max())), height)
+        lefts, tops = numpy.meshgrid(numpy.arange(left_min, left_max),
+                                     numpy.arange(top_min, top_max),
+                                     indexing="ij")
+        centre_lefts, centre_tops = lefts + 0.5, tops + 0.5
+        inside = numpy.zeros(lefts.shape, dtype=bool)
+        # Even-odd rule, counting the edges crossed by a ray from each centre
+        for (left1, top1), (left2, top2) in zip(points,
+                                                numpy.roll(points, -1,
+                                                           axis=0)):
+            if top1 == top2:
+                continue
+            crosses = (top1 > centre_tops) != (top2 > centre_tops)
+            edge_lefts = left1 + (centre_tops - top1) * (left2 - left1) / \
+                (top2 - top1)
+            inside ^= crosses & (centre_lefts < edge_lefts)
+        lefts, tops = lefts[inside], tops[inside]
+        if outline:
+            edge_lefts, edge_tops = self.lines(True, grid_points)
+            cells = numpy.unique(numpy.concatenate([
+                numpy.stack([lefts, tops], axis=1),
+                numpy.stack([edge_lefts, edge_tops], axis=1)]), axis=0)
+            lefts, tops = cells[:, 0], cells[:, 1]
+        return lefts, tops
+
+    def circle(self, grid_center: tuple, radius: float) -> tuple:
+        """Returns the cells with their centre inside a circle.
+
+        Parameters:
+            grid_center (tuple): The center point in grid positions
+                                 (grid_left, grid_top).
+            radius (float): The radius of the circle in grid points.
+
+        Returns:
+            tuple: The cells as index arrays (lefts, tops)."""
+        center_left, center_top = grid_center
+        width, height = self.grid.size
+        lefts = numpy.arange(max(int(math.floor(center_left - radius)), 0),
+                             min(int(math.ceil(center_left + radius)), width))
+        tops = numpy.arange(max(int(math.floor(center_top - radius)), 0),
+                            min(int(math.ceil(center_top + radius)), height))
+        lefts, tops = numpy.meshgrid(lefts, tops, indexing="ij")
+        inside = (lefts + 0.5 - center_left) ** 2 + \
+            (tops + 0.5 - center_top) ** 2 <= radius ** 2
+        return lefts[inside], tops[inside]
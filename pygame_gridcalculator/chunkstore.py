@@ -0,0 +1,355 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+from numpy.lib.format import open_memmap
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+from pygame_gridcalculator.lrucache import LRUCache
+
+
+class ChunkedWorld:
+    """Create a ChunkedWorld to stream per-cell data for a world too large
+       to hold in memory into the cells shown by a GridCalculator.
+
+    The world is stored on disk as a NumPy .npy file of fixed-size square
+    chunks indexed as [chunk_left, chunk_top, left, top], so each chunk is a
+    single contiguous read.  Only the chunks under the view are copied into
+    memory, with the least recently used chunks written back (if changed)
+    and dropped once max_resident_chunks is reached.  The chunks just past
+    the view in the direction it last moved are read in the background so
+    they are ready before they are scrolled into.
+
+    Parameters:
+        path (str): The path of a world file made by ChunkedWorld.create.
+        grid (GridCalculator): The grid for the view.  Its size sets the
+                               number of world cells shown.
+        max_resident_chunks (int): (Optional) The maximum number of chunks
+                                   held in memory (default = 64).
+        prefetch (int): (Optional) The number of chunks past the view to
+                        read ahead in the direction the view is moving, 0 to
+                        turn off reading ahead (default = 1).
+        read_only (bool): (Optional) If True, the world file is opened
+                          read-only and cells can't be set (default = False).
+        fill_value (any): (Optional) The value of view cells outside of the
+                          world (default = 0).
+    """
+
+    def __init__(self, path: str, grid: GridCalculator,
+                 max_resident_chunks: int = 64, prefetch: int = 1,
+                 read_only: bool = False, fill_value=0):
+        if max_resident_chunks < 1:
+            raise GridCalculatorException("The max resident chunks must be "
+                                          "greater than 0")
+        if prefetch < 0:
+            raise GridCalculatorException("The prefetch cannot be less than "
+                                          "0")
+        self._store = open_memmap(path, mode="r" if read_only else "r+")
+        if self._store.ndim != 4 or \
+                self._store.shape[2] != self._store.shape[3]:
+            raise GridCalculatorException(
+                "The world file shape ({}) must be (chunks wide, chunks high, "
+                "chunk size, chunk size)".format(self._store.shape))
+        self.grid = grid
+        self._read_only = read_only
+        self._fill_value = fill_value
+        self._prefetch = prefetch
+        self._chunks = LRUCache(max_resident_chunks)
+        self._dirty = set()
+        self._pending = {}
+        self._executor = None
+        self._camera = None
+        self._direction = (0, 0)
+        self._window = None
+
+    def __repr__(self):
+        return "ChunkedWorld(world: width={}, height={};  chunk size={};  " \
+               "resident chunks={}/{})".format(*self.world_size,
+                                               self.chunk_size,
+                                               len(self._chunks),
+                                               self._chunks.max_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @classmethod
+    def create(cls, path: str, chunks_wide: int, chunks_high: int,
+               chunk_size: int, dtype=numpy.uint8, fill_value=0) -> None:
+        """Creates a world file filled with a single value.
+
+        Parameters:
+            path (str): The path of the world file to create.
+            chunks_wide (int): The number of chunks from left to right.
+            chunks_high (int): The number of chunks from top to bottom.
+            chunk_size (int): The width and height of each chunk in cells.
+            dtype (numpy.dtype): (Optional) The type of the cell data
+                                 (default = numpy.uint8).
+            fill_value (any): (Optional) The starting value of every cell
+                              (default = 0)."""
+        if min(chunks_wide, chunks_high, chunk_size) < 1:
+            raise GridCalculatorException("The chunks wide, chunks high and "
+                                          "chunk size must be greater than 0")
+        store = open_memmap(path, mode="w+", dtype=dtype,
+                            shape=(chunks_wide, chunks_high, chunk_size,
+                                   chunk_size))
+        if fill_value:
+            store[...] = fill_value
+        store.flush()
+        del store
+
+    @property
+    def chunk_size(self) -> int:
+        """Returns the width and height of each chunk in cells.
+
+        Returns:
+            int: The chunk size in cells."""
+        return self._store.shape[2]
+
+    @property
+    def world_size(self) -> tuple:
+        """Returns the size of the world in cells.
+
+        Returns:
+            tuple: The (width, height) of the world in cells."""
+        return self._store.shape[0] * self._store.shape[2], \
+            self._store.shape[1] * self._store.shape[3]
+
+    @property
+    def resident_chunks(self) -> list:
+        """Returns the chunks held in memory from least to most recently
+        used.
+
+        Returns:
+            list: The (chunk_left, chunk_top) of each resident chunk."""
+        return [key for key, _ in self._chunks.items()]
+
+    @property
+    def camera(self) -> tuple | None:
+        """Returns the world cell shown in the top left cell of the view.
+
+        Returns:
+            tuple: The (left, top) world cell, or None before update_view
+                   has been called."""
+        return self._camera
+
+    @property
+    def window(self) -> numpy.ndarray:
+        """Returns the world data for the cells of the view.
+
+        Returns:
+            numpy.ndarray: The data indexed as [left, top] in grid cells."""
+        if self._camera is None:
+            raise GridCalculatorException("update_view must be called before "
+                                          "the window can be used")
+        if self._window is None:
+            self._window = self._build_window()
+        return self._window
+
+    def _check_chunk(self, chunk: tuple) -> bool:
+        """Returns if the chunk is inside the world."""
+        return 0 <= chunk[0] < self._store.shape[0] and \
+            0 <= chunk[1] < self._store.shape[1]
+
+    def _read_chunk(self, chunk: tuple) -> numpy.ndarray:
+        """Copies a chunk from the world file into memory."""
+        return numpy.array(self._store[chunk])
+
+    def _write_chunk(self, chunk: tuple, data: numpy.ndarray) -> None:
+        """Writes a changed chunk back to the world file."""
+        if chunk in self._dirty:
+            self._store[chunk] = data
+            self._dirty.discard(chunk)
+
+    def _resident(self, chunk: tuple, data: numpy.ndarray) -> None:
+        """Adds a chunk to memory, writing back any chunk it evicts."""
+        evicted = self._chunks.put(chunk, data)
+        if evicted is not None:
+            self._write_chunk(*evicted)
+
+    def _load(self, chunk: tuple) -> numpy.ndarray:
+        """Returns a chunk from memory, reading it from the world file (or
+        waiting for it to be read ahead) if it isn't resident."""
+        data = self._chunks.get(chunk)
+        if data is None:
+            future = self._pending.pop(chunk, None)
+            data = future.result() if future is not None \
+                else self._read_chunk(chunk)
+            self._resident(chunk, data)
+        return data
+
+    def _view_chunks(self, camera_left: int, camera_top: int) -> tuple:
+        """Returns the (left, top, right, bottom) chunks the view overlaps
+        (inclusive), which may be outside of the world."""
+        chunk_size = self.chunk_size
+        width, height = self.grid.size
+        return camera_left // chunk_size, camera_top // chunk_size, \
+            (camera_left + width - 1) // chunk_size, \
+            (camera_top + height - 1) // chunk_size
+
+    def _collect_prefetched(self) -> None:
+        """Moves chunks that have finished being read ahead into memory."""
+        for chunk, future in list(self._pending.items()):
+            if future.done():
+                del self._pending[chunk]
+                if chunk not in self._chunks:
+                    self._resident(chunk, future.result())
+
+    def _start_prefetch(self, span: tuple) -> None:
+        """Starts reading the chunks past the view in the direction it is
+        moving."""
+        left, top, right, bottom = span
+        direction_left, direction_top = self._direction
+        if not self._prefetch or direction_left == direction_top == 0:
+            return
+        wanted = set()
+        for step in range(1, self._prefetch + 1):
+            if direction_left:
+                column = right + step if direction_left > 0 else left - step
+                wanted.update((column, row) for row in range(top, bottom + 1))
+            if direction_top:
+                row = bottom + step if direction_top > 0 else top - step
+                wanted.update((column, row)
+                              for column in range(left, right + 1))
+        # Only read ahead into space left after the view's chunks
+        space = self._chunks.max_size - (right - left + 1) * \
+            (bottom - top + 1) - len(self._pending)
+        for chunk in sorted(wanted):
+            if space <= 0:
+                break
+            if self._check_chunk(chunk) and chunk not in self._chunks and \
+                    chunk not in self._pending:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1)
+                self._pending[chunk] = self._executor.submit(
+                    self._read_chunk, chunk)
+                space -= 1
+
+    def wait_for_prefetch(self) -> None:
+        """Waits for the chunks being read ahead to be in memory, such as
+        behind a loading screen."""
+        for future in list(self._pending.values()):
+            future.result()
+        self._collect_prefetched()
+
+    def update_view(self, camera_left: int, camera_top: int) -> None:
+        """Moves the view so the world cell specified is shown in the top
+        left cell of the grid, paging in the chunks it overlaps.
+
+        Parameters:
+            camera_left (int): The left world cell to show at the left of
+                               the grid.
+            camera_top (int): The top world cell to show at the top of the
+                              grid."""
+        span = self._view_chunks(camera_left, camera_top)
+        left, top, right, bottom = span
+        needed = [(column, row) for column in range(left, right + 1)
+                  for row in range(top, bottom + 1)
+                  if self._check_chunk((column, row))]
+        if len(needed) > self._chunks.max_size:
+            raise GridCalculatorException(
+                "The view overlaps {} chunks, which is more than the max "
+                "resident chunks ({})".format(len(needed),
+                                              self._chunks.max_size))
+        if self._camera is not None:
+            self._direction = (
+                (camera_left > self._camera[0]) -
+                (camera_left < self._camera[0]),
+                (camera_top > self._camera[1]) -
+                (camera_top < self._camera[1]))
+        self._collect_prefetched()
+        for chunk in needed:
+            self._load(chunk)
+        self._start_prefetch(span)
+        self._camera = (camera_left, camera_top)
+        self._window = None
+
+    def _build_window(self) -> numpy.ndarray:
+        """Copies the view's cells out of the resident chunks."""
+        chunk_size = self.chunk_size
+        camera_left, camera_top = self._camera
+        width, height = self.grid.size
+        window = numpy.full((width, height), self._fill_value,
+                            dtype=self._store.dtype)
+        left, top, right, bottom = self._view_chunks(camera_left, camera_top)
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                if not self._check_chunk((column, row)):
+                    continue
+                data = self._load((column, row))
+                # The overlap of the chunk and the view in world cells
+                world_left = max(column * chunk_size, camera_left)
+                world_top = max(row * chunk_size, camera_top)
+                world_right = min((column + 1) * chunk_size,
+                                  camera_left + width)
+                world_bottom = min((row + 1) * chunk_size,
+                                   camera_top + height)
+                window[world_left - camera_left:world_right - camera_left,
+                       world_top - camera_top:world_bottom - camera_top] = \
+                    data[world_left - column * chunk_size:
+                         world_right - column * chunk_size,
+                         world_top - row * chunk_size:
+                         world_bottom - row * chunk_size]
+        return window
+
+    def _cell_chunk(self, left: int, top: int) -> tuple:
+        """Returns the chunk and position in the chunk of a world cell."""
+        world_width, world_height = self.world_size
+        if not (0 <= left < world_width and 0 <= top < world_height):
+            raise GridCalculatorException(
+                "The cell provided (({}, {})) isn't in the world (0 - {}, "
+                "0 - {})".format(left, top, world_width - 1,
+                                 world_height - 1))
+        chunk_left, cell_left = divmod(left, self.chunk_size)
+        chunk_top, cell_top = divmod(top, self.chunk_size)
+        return (chunk_left, chunk_top), (cell_left, cell_top)
+
+    def cell(self, left: int, top: int):
+        """Returns the value of a world cell, paging in its chunk if needed.
+
+        Parameters:
+            left (int): The left world cell.
+            top (int): The top world cell.
+
+        Returns:
+            any: The value of the cell."""
+        chunk, position = self._cell_chunk(left, top)
+        return self._load(chunk)[position]
+
+    def set_cell(self, left: int, top: int, value) -> None:
+        """Sets the value of a world cell.  The change is written to the
+        world file when its chunk is evicted or flush is called.
+
+        Parameters:
+            left (int): The left world cell.
+            top (int): The top world cell.
+            value (any): The new value of the cell."""
+        if self._read_only:
+            raise GridCalculatorException("The world is read-only")
+        chunk, position = self._cell_chunk(left, top)
+        self._load(chunk)[position] = value
+        self._dirty.add(chunk)
+        if self._window is not None and self._camera is not None:
+            window_left = left - self._camera[0]
+            window_top = top - self._camera[1]
+            if 0 <= window_left < self._window.shape[0] and \
+                    0 <= window_top < self._window.shape[1]:
+                self._window[window_left, window_top] = value
+
+    def flush(self) -> None:
+        """Writes every changed resident chunk back to the world file."""
+        for chunk, data in self._chunks.items():
+            self._write_chunk(chunk, data)
+        if not self._read_only:
+            self._store.flush()
+
+    def close(self) -> None:
+        """Writes back any changes and stops reading ahead."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._pending.clear()
+        self.flush()
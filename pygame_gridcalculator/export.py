@@ -0,0 +1,100 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import product
+
+import pygame
+from pygame_gridcalculator.gridcalculator import GridCalculatorException
+from pygame_gridcalculator.scene import Scene
+
+_FORMATS = ("png", "raw")
+
+
+def _export_frame(scene_source, frame: int, resolution: tuple,
+                  path: str, image_format: str) -> str:
+    """Draws a single frame at a single resolution and writes it to disk.
+    This runs in a worker process, so only the path is sent back."""
+    scene = scene_source(frame) if callable(scene_source) else scene_source
+    surface = pygame.Surface(resolution)
+    scene.render(surface)
+    if image_format == "png":
+        pygame.image.save(surface, path)
+    else:
+        with open(path, "wb") as raw_file:
+            raw_file.write(pygame.image.tobytes(surface, "RGB"))
+    return path
+
+
+def _init_worker() -> None:
+    """Starts pygame without a display in each worker process."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.font.init()
+
+
+def export_frames(scene_source, resolutions: list, output_dir: str,
+                  frames: list | range = range(1), image_format: str = "png",
+                  max_workers: int | None = None,
+                  max_pending: int | None = None,
+                  filename: str = "frame_{frame:05d}_{width}x{height}.{ext}"
+                  ) -> list:
+    """Draws a scene at several resolutions and frame indexes in worker
+    processes and writes each image to disk.
+
+    Each worker draws and writes its own image, so only file paths are sent
+    back and at most max_pending images are in memory at once.
+
+    Parameters:
+        scene_source (Scene or callable): The Scene to draw for every frame,
+                                          or a module level function called
+                                          with the frame index that returns
+                                          the Scene for that frame.
+        resolutions (list): The (width, height) pixel sizes to draw each
+                            frame at.
+        output_dir (str): The directory to write the images to, which is
+                          created if needed.
+        frames (list): (Optional) The frame indexes to draw
+                       (default = range(1), a single frame 0).
+        image_format (str): (Optional) "png", or "raw" for unpacked RGB
+                            bytes (default = "png").
+        max_workers (int): (Optional) The number of worker processes
+                           (default = None, one per CPU).
+        max_pending (int): (Optional) The most images being drawn or waiting
+                           to be drawn at once (default = None, twice the
+                           number of workers).
+        filename (str): (Optional) The format of each file name, given frame,
+                        width, height and ext.
+
+    Returns:
+        list: The path of each image written, ordered by frame then
+              resolution."""
+    if image_format not in _FORMATS:
+        raise GridCalculatorException(
+            "The image format provided ({}) must be one of {}".format(
+                image_format, ", ".join(_FORMATS)))
+    if not isinstance(scene_source, Scene) and not callable(scene_source):
+        raise GridCalculatorException("The scene source must be a Scene or "
+                                      "a function returning a Scene")
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [(frame, tuple(resolution), os.path.join(
+                output_dir, filename.format(frame=frame,
+                                            width=resolution[0],
+                                            height=resolution[1],
+                                            ext=image_format)))
+            for frame, resolution in product(frames, resolutions)]
+    paths = [path for _, _, path in jobs]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * max_workers
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_worker) as executor:
+        pending = set()
+        for frame, resolution, path in jobs:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+            pending.add(executor.submit(_export_frame, scene_source, frame,
+                                        resolution, path, image_format))
+        for future in pending:
+            future.result()
+    return paths
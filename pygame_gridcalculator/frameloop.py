@@ -0,0 +1,211 @@
+import asyncio
+import inspect
+import time
+from contextlib import nullcontext
+
+import pygame
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+from pygame_gridcalculator.shapefactory import ShapeFactory
+
+
+async def _call(function, *arguments) -> None:
+    """Calls a function, awaiting the result if it is a coroutine."""
+    result = function(*arguments)
+    if inspect.isawaitable(result):
+        await result
+
+
+class FrameLoop:
+    """Create a FrameLoop to run a pygame view as an asyncio task, updating
+       the simulation at a fixed timestep and drawing at the display rate.
+
+    Each frame, the time since the last frame is added to an accumulator and
+    update is called once for every whole timestep in it, so the simulation
+    runs at the same speed however long drawing takes.  render is then called
+    with alpha, the part of a timestep left in the accumulator, to blend the
+    previous and current simulation states.  If drawing falls so far behind
+    that more than max_updates timesteps are due, the extra time is dropped
+    rather than trying to catch up.  Between frames the loop awaits
+    asyncio.sleep, so other coroutines such as asset loading and telemetry
+    keep running.  update and render can be plain functions or coroutines.
+
+    Parameters:
+        update (callable): Called with the timestep in seconds to move the
+                           simulation on by one step.
+        render (callable): Called with alpha (0 - 1) to draw a frame.
+        timestep (float): (Optional) The seconds of simulation each update
+                          covers (default = 0.1).
+        fps (float): (Optional) The most frames to draw each second
+                     (default = 60, or None to draw as often as possible).
+        max_updates (int): (Optional) The most updates to run before drawing
+                           a frame (default = 5).
+        grid (GridCalculator): (Optional) A grid to resize to the window when
+                               it is resized, with a ShapeFactory for
+                               drawing on it (default = None).
+        on_event (callable): (Optional) Called with every pygame event
+                             (default = None).
+        on_resize (callable): (Optional) Called with the new width and height
+                              when the window is resized, instead of resizing
+                              the grid (default = None).
+        flip (bool): (Optional) If True, pygame.display.flip is called after
+                     each frame is drawn (default = True).
+        clock (callable): (Optional) Returns the current time in seconds
+                          (default = time.perf_counter).
+        tracer (FrameTracer): (Optional) A tracer to write each frame and its
+                              events, update, render and display phases to
+                              (default = None).
+    """
+
+    def __init__(self, update, render, timestep: float = 0.1,
+                 fps: float | None = 60, max_updates: int = 5,
+                 grid: GridCalculator | None = None, on_event=None,
+                 on_resize=None, flip: bool = True,
+                 clock=time.perf_counter, tracer=None):
+        if timestep <= 0:
+            raise GridCalculatorException("The timestep must be greater "
+                                          "than 0")
+        if fps is not None and fps <= 0:
+            raise GridCalculatorException("The fps must be greater than 0")
+        if max_updates < 1:
+            raise GridCalculatorException("The max updates must be greater "
+                                          "than 0")
+        self._update = update
+        self._render = render
+        self.timestep = timestep
+        self.fps = fps
+        self.max_updates = max_updates
+        self.grid = grid
+        self.shape_factory = None if grid is None else ShapeFactory(grid)
+        self._on_event = on_event
+        self._on_resize = on_resize
+        self._flip = flip
+        self._clock = clock
+        self.tracer = tracer
+        self._running = False
+        self._frames = 0
+        self._ticks = 0
+        self._alpha = 0.0
+
+    def __repr__(self):
+        return "FrameLoop(timestep={};  fps={};  frames={}, ticks={})".format(
+            self.timestep, self.fps, self._frames, self._ticks)
+
+    @property
+    def running(self) -> bool:
+        """Returns if the loop is running.
+
+        Returns:
+            bool: True while run is running and stop hasn't been called."""
+        return self._running
+
+    @property
+    def frames(self) -> int:
+        """Returns the number of frames drawn.
+
+        Returns:
+            int: The number of times render has been called."""
+        return self._frames
+
+    @property
+    def ticks(self) -> int:
+        """Returns the number of simulation steps run.
+
+        Returns:
+            int: The number of times update has been called."""
+        return self._ticks
+
+    @property
+    def alpha(self) -> float:
+        """Returns how far the last frame drawn was between simulation steps.
+
+        Returns:
+            float: The part of a timestep (0 - 1) passed since the last
+                   update when the last frame was drawn."""
+        return self._alpha
+
+    @staticmethod
+    def interpolate(previous, current, alpha: float):
+        """Returns a value blended between the previous and current
+        simulation states, such as a grid position to draw at.
+
+        Parameters:
+            previous (float or tuple): The value before the last update.
+            current (float or tuple): The value after the last update.
+            alpha (float): The alpha render was called with.
+
+        Returns:
+            float or tuple: The blended value."""
+        if isinstance(previous, tuple):
+            return tuple(start + (end - start) * alpha
+                         for start, end in zip(previous, current))
+        return previous + (current - previous) * alpha
+
+    def stop(self) -> None:
+        """Stops the loop after the current frame."""
+        self._running = False
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Handles a single pygame event.  Quitting stops the loop and
+        resizing the window resizes the grid or calls on_resize.
+
+        Parameters:
+            event (pygame.event.Event): The event to handle."""
+        if event.type == pygame.QUIT:
+            self.stop()
+        elif event.type == pygame.VIDEORESIZE:
+            if self._on_resize is not None:
+                self._on_resize(event.w, event.h)
+            elif self.grid is not None:
+                self.grid.update_pixel_positions(event.w, event.h)
+        if self._on_event is not None:
+            self._on_event(event)
+
+    def _span(self, name: str):
+        """Returns a tracer span for a phase of the frame, or a context
+        manager that does nothing if there is no tracer."""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name)
+
+    async def run(self) -> None:
+        """Runs the loop until stop is called or the window is closed."""
+        self._running = True
+        timestep = self.timestep
+        previous = self._clock()
+        accumulator = 0.0
+        while self._running:
+            frame_start = self._clock()
+            accumulator += frame_start - previous
+            previous = frame_start
+            if self.tracer is not None:
+                self.tracer.begin_frame()
+            if pygame.display.get_init():
+                with self._span("events"):
+                    for event in pygame.event.get():
+                        self.handle_event(event)
+            updates = 0
+            with self._span("update"):
+                while accumulator >= timestep and \
+                        updates < self.max_updates:
+                    await _call(self._update, timestep)
+                    accumulator -= timestep
+                    updates += 1
+                    self._ticks += 1
+            if accumulator >= timestep:
+                # Drop the time that can't be caught up on
+                accumulator %= timestep
+            self._alpha = accumulator / timestep
+            with self._span("render"):
+                await _call(self._render, self._alpha)
+            if self._flip and pygame.display.get_surface() is not None:
+                with self._span("display"):
+                    pygame.display.flip()
+            if self.tracer is not None:
+                self.tracer.end_frame()
+            self._frames += 1
+            delay = 0.0 if self.fps is None else \
+                frame_start + 1 / self.fps - self._clock()
+            await asyncio.sleep(max(delay, 0.0))
@@ -1,3 +1,7 @@
+import math
+from enum import Enum
+from typing import NamedTuple
+
 from pygame import Surface, draw
 
 
@@ -6,10 +10,39 @@ class GridCalculatorException(Exception):
     pass
 
 
+class BoundaryPolicy(Enum):
+    """The ways a GridCalculator can handle points outside of the grid."""
+    RAISE = 1  # Raise a GridCalculatorException
+    CLAMP = 2  # Move the point to the nearest border
+    WRAP = 3  # Wrap the point around to the opposite side of the grid
+
+
+class _Geometry(NamedTuple):
+    """An immutable snapshot of the pixel positions and size of a grid,
+    along with any tables calculated from them."""
+    pixel_start_left: int
+    pixel_start_top: int
+    pixel_end_left: int
+    pixel_end_top: int
+    grid_width_max: int
+    grid_height_max: int
+    cell_width: float
+    cell_height: float
+    version: int
+    tables: object = None
+
+
 class GridCalculator:
     """Create a GridCalculator to map the available pixels on the screen
        against a grid of the users specified size.
 
+    The pixel positions and size of the grid are held in a single immutable
+    snapshot which updates replace in one assignment, and every call reads
+    the snapshot once.  This means the grid can be updated on one thread
+    (such as when handling a resize event) while another thread draws with
+    it, without locks: each call sees either the old or the new geometry and
+    never a mix of both.
+
     Parameters:
         pixel_end_left (int): The right pixel point for use by the grid.
         pixel_end_top (int): The bottom pixel point for use by the grid.
@@ -20,21 +53,20 @@ class GridCalculator:
                                 grid (default = 0).
         pixel_start_top (int): (Optional) The top pixel point for use by the
                                grid (default = 0).
+        boundary_policy (BoundaryPolicy): (Optional) How points outside of
+                                          the grid are handled
+                                          (default = BoundaryPolicy.RAISE).
     """
 
     def __init__(self, pixel_end_left: int, pixel_end_top: int,
                  grid_width_max: int, grid_height_max: int,
-                 pixel_start_left: int = 0, pixel_start_top: int = 0):
+                 pixel_start_left: int = 0, pixel_start_top: int = 0,
+                 boundary_policy: BoundaryPolicy = BoundaryPolicy.RAISE):
         # Create and calculate grid
-        self._check_value_links_are_valid(pixel_end_left, pixel_end_top,
-                                          grid_width_max, grid_height_max,
-                                          pixel_start_left, pixel_start_top)
-        self._pixel_end_left = pixel_end_left
-        self._pixel_end_top = pixel_end_top
-        self._grid_width_max = grid_width_max
-        self._grid_height_max = grid_height_max
-        self._pixel_start_left = pixel_start_left
-        self._pixel_start_top = pixel_start_top
+        self._geometry = None
+        self._set_geometry(pixel_end_left, pixel_end_top, grid_width_max,
+                           grid_height_max, pixel_start_left, pixel_start_top)
+        self.boundary_policy = boundary_policy
 
     @staticmethod
     def _check_value_links_are_valid(pixel_end_left: int, pixel_end_top: int,
@@ -68,6 +100,68 @@ class GridCalculator:
                                                         (pixel_end_top -
                                                          pixel_start_top)))
 
+    def _check_geometry(self, pixel_end_left: int, pixel_end_top: int,
+                        grid_width_max: int, grid_height_max: int,
+                        pixel_start_left: int, pixel_start_top: int) -> None:
+        """Checks every pixel position and grid size value is valid before
+        any of them are used."""
+        self._check_value_links_are_valid(pixel_end_left, pixel_end_top,
+                                          grid_width_max, grid_height_max,
+                                          pixel_start_left, pixel_start_top)
+        if pixel_end_left < 1:
+            raise GridCalculatorException("Pixel end left must be greater "
+                                          "than 1")
+        if pixel_end_top < 1:
+            raise GridCalculatorException("Pixel end top must be greater "
+                                          "than 1")
+        if grid_width_max < 1:
+            raise GridCalculatorException("Grid width must be greater than 1")
+        if grid_height_max < 1:
+            raise GridCalculatorException("Grid height must be greater than 1")
+        if pixel_start_left > pixel_end_left:
+            raise GridCalculatorException("The pixel start left position ({}) "
+                                          "cannot be greater than pixel end "
+                                          "left position ({})".format(
+                                            pixel_start_left,
+                                            pixel_end_left))
+        elif pixel_start_left < 0:
+            raise GridCalculatorException("The pixel start left position ({}) "
+                                          "cannot be less than 0".format(
+                                            pixel_start_left))
+        if pixel_start_top > pixel_end_top:
+            raise GridCalculatorException("The pixel start top position ({}) "
+                                          "cannot be greater than the pixel "
+                                          "end top position ({})".format(
+                                            pixel_start_top,
+                                            pixel_end_top))
+        elif pixel_start_top < 0:
+            raise GridCalculatorException("The pixel start top position ({}) "
+                                          "cannot be less than 0".format(
+                                            pixel_start_top))
+
+    def _set_geometry(self, pixel_end_left: int, pixel_end_top: int,
+                      grid_width_max: int, grid_height_max: int,
+                      pixel_start_left: int, pixel_start_top: int) -> None:
+        """Checks the values provided and replaces the geometry of the grid
+        with them in a single assignment."""
+        self._check_geometry(pixel_end_left, pixel_end_top, grid_width_max,
+                             grid_height_max, pixel_start_left,
+                             pixel_start_top)
+        geometry = _Geometry(
+            pixel_start_left, pixel_start_top, pixel_end_left, pixel_end_top,
+            grid_width_max, grid_height_max,
+            (pixel_end_left - pixel_start_left) / grid_width_max,
+            (pixel_end_top - pixel_start_top) / grid_height_max,
+            0 if self._geometry is None else self._geometry.version + 1)
+        self._geometry = geometry._replace(
+            tables=self._calculate_tables(geometry))
+
+    def _calculate_tables(self, geometry: _Geometry) -> object:
+        """Returns any tables calculated from the geometry, which are kept
+        in the geometry snapshot.  Subclasses override this to precalculate
+        pixel data."""
+        return None
+
     def __repr__(self):
         return "GridCalculator(pixel range: left={}-{}, top={}-{};  " \
                "grid: width={}, height={})".format(
@@ -75,107 +169,71 @@ class GridCalculator:
                     self._pixel_start_top, self._pixel_end_top,
                     self._grid_width_max, self._grid_height_max)
 
-    def _get_width_pixels(self, point_needed: float) -> int:
+    def _get_width_pixels(self, point_needed: float,
+                          geometry: _Geometry) -> int:
         """Calculate the width point based on the value provided."""
-        width = (self._pixel_end_left -
-                 self._pixel_start_left) / self._grid_width_max
-        return self._pixel_start_left + int(width * point_needed)
+        return geometry.pixel_start_left + int(geometry.cell_width *
+                                               point_needed)
 
-    def _get_height_pixels(self, point_needed: float) -> int:
+    def _get_height_pixels(self, point_needed: float,
+                           geometry: _Geometry) -> int:
         """Calculate the height point based on the value provided."""
-        width = (self._pixel_end_top -
-                 self._pixel_start_top) / self._grid_height_max
-        return self._pixel_start_top + int(width * point_needed)
+        return geometry.pixel_start_top + int(geometry.cell_height *
+                                              point_needed)
+
+    def _get_width_cell(self, pixel: int, geometry: _Geometry) -> int:
+        """Calculate the cell containing the width pixel provided."""
+        cell = min(int((pixel - geometry.pixel_start_left) /
+                       geometry.cell_width), geometry.grid_width_max - 1)
+        # Correct for the rounding used when calculating pixels from cells
+        while cell > 0 and self._get_width_pixels(cell, geometry) > pixel:
+            cell -= 1
+        while cell < geometry.grid_width_max - 1 and \
+                self._get_width_pixels(cell + 1, geometry) <= pixel:
+            cell += 1
+        return cell
+
+    def _get_height_cell(self, pixel: int, geometry: _Geometry) -> int:
+        """Calculate the cell containing the height pixel provided."""
+        cell = min(int((pixel - geometry.pixel_start_top) /
+                       geometry.cell_height), geometry.grid_height_max - 1)
+        # Correct for the rounding used when calculating pixels from cells
+        while cell > 0 and self._get_height_pixels(cell, geometry) > pixel:
+            cell -= 1
+        while cell < geometry.grid_height_max - 1 and \
+                self._get_height_pixels(cell + 1, geometry) <= pixel:
+            cell += 1
+        return cell
 
     @property
     def _pixel_end_left(self) -> int:
         """Get pixel end left point for grid."""
-        return self._pix_end_left
-
-    @_pixel_end_left.setter
-    def _pixel_end_left(self, pixel_end_left: int) -> None:
-        """Set pixel end left point for grid."""
-        if pixel_end_left < 1:
-            raise GridCalculatorException("Pixel end left must be greater "
-                                          "than 1")
-        self._pix_end_left = pixel_end_left
+        return self._geometry.pixel_end_left
 
     @property
     def _pixel_end_top(self) -> int:
         """Get pixel end top point for grid."""
-        return self._pix_end_top
-
-    @_pixel_end_top.setter
-    def _pixel_end_top(self, pixel_end_top: int) -> None:
-        """Set pixel end top point for grid."""
-        if pixel_end_top < 1:
-            raise GridCalculatorException("Pixel end top must be greater "
-                                          "than 1")
-        self._pix_end_top = pixel_end_top
+        return self._geometry.pixel_end_top
 
     @property
     def _grid_width_max(self) -> int:
         """Get grid width."""
-        return self._g_width
-
-    @_grid_width_max.setter
-    def _grid_width_max(self, grid_width_max: int) -> None:
-        """Set grid width."""
-        if grid_width_max < 1:
-            raise GridCalculatorException("Grid width must be greater than 1")
-        self._g_width = grid_width_max
+        return self._geometry.grid_width_max
 
     @property
     def _grid_height_max(self) -> int:
         """Get grid height."""
-        return self._g_height
-
-    @_grid_height_max.setter
-    def _grid_height_max(self, grid_height_max: int) -> None:
-        """Set grid height."""
-        if grid_height_max < 1:
-            raise GridCalculatorException("Grid height must be greater than 1")
-        self._g_height = grid_height_max
+        return self._geometry.grid_height_max
 
     @property
     def _pixel_start_left(self) -> int:
         """Get pixel start left position."""
-        return self._pix_start_left
-
-    @_pixel_start_left.setter
-    def _pixel_start_left(self, pixel_start_left: int) -> None:
-        """Set pixel start left position."""
-        if pixel_start_left > self._pixel_end_left:
-            raise GridCalculatorException("The pixel start left position ({}) "
-                                          "cannot be greater than pixel end "
-                                          "left position ({})".format(
-                                            pixel_start_left,
-                                            self._pixel_end_left))
-        elif pixel_start_left < 0:
-            raise GridCalculatorException("The pixel start left position ({}) "
-                                          "cannot be less than 0".format(
-                                            pixel_start_left))
-        self._pix_start_left = pixel_start_left
+        return self._geometry.pixel_start_left
 
     @property
     def _pixel_start_top(self) -> int:
         """Get pixel start top position."""
-        return self._pix_start_top
-
-    @_pixel_start_top.setter
-    def _pixel_start_top(self, pixel_start_top: int) -> None:
-        """Set pixel start top position."""
-        if pixel_start_top > self._pixel_end_top:
-            raise GridCalculatorException("The pixel start top position ({}) "
-                                          "cannot be greater than the pixel "
-                                          "end top position ({})".format(
-                                            pixel_start_top,
-                                            self._pixel_end_top))
-        elif pixel_start_top < 0:
-            raise GridCalculatorException("The pixel start top position ({}) "
-                                          "cannot be less than 0".format(
-                                            pixel_start_top))
-        self._pix_start_top = pixel_start_top
+        return self._geometry.pixel_start_top
 
     @property
     def size(self) -> tuple:
@@ -183,7 +241,8 @@ class GridCalculator:
 
         Returns:
             tuple: The actual size of the grid (width, height)"""
-        return self._grid_width_max, self._grid_height_max
+        geometry = self._geometry
+        return geometry.grid_width_max, geometry.grid_height_max
 
     @property
     def pixel_size(self) -> tuple:
@@ -191,22 +250,77 @@ class GridCalculator:
 
         Returns:
             tuple: The size of the grid in pixels (width, height)"""
-        return (self._pixel_end_left - self._pixel_start_left), \
-               (self._pixel_end_top - self._pixel_start_top)
+        geometry = self._geometry
+        return (geometry.pixel_end_left - geometry.pixel_start_left), \
+               (geometry.pixel_end_top - geometry.pixel_start_top)
 
-    def _error_check_left(self, left_point: float) -> None:
-        """Left point error checking, checks left_point is in grid."""
-        if 0 > left_point or left_point > self._grid_width_max:
+    @property
+    def boundary_policy(self) -> BoundaryPolicy:
+        """Returns how points outside of the grid are handled.
+
+        Returns:
+            BoundaryPolicy: The boundary policy of the grid."""
+        return self._boundary_policy
+
+    @boundary_policy.setter
+    def boundary_policy(self, boundary_policy: BoundaryPolicy) -> None:
+        """Sets how points outside of the grid are handled."""
+        if not isinstance(boundary_policy, BoundaryPolicy):
+            raise GridCalculatorException("The boundary policy ({}) must be "
+                                          "a BoundaryPolicy".format(
+                                            boundary_policy))
+        self._boundary_policy = boundary_policy
+
+    @property
+    def geometry_version(self) -> int:
+        """Returns a counter that increases every time the grid or pixel
+        positions are updated, so cached pixel data can be invalidated.
+
+        Returns:
+            int: The current geometry version of the grid."""
+        return self._geometry.version
+
+    def _apply_boundary_policy(self, point: float, low: float,
+                               high: float) -> float | None:
+        """Returns the point moved into the range low - high based on the
+        boundary policy, or None if the policy is to raise."""
+        if self._boundary_policy is BoundaryPolicy.CLAMP:
+            return min(max(point, low), high)
+        if self._boundary_policy is BoundaryPolicy.WRAP:
+            return low + (point - low) % (high - low)
+        return None
+
+    def _error_check_left(self, left_point: float,
+                          geometry: _Geometry | None = None) -> float:
+        """Left point error checking, checks left_point is in grid and
+        returns the point to use based on the boundary policy."""
+        if geometry is None:
+            geometry = self._geometry
+        if 0 <= left_point <= geometry.grid_width_max:
+            return left_point
+        resolved = self._apply_boundary_policy(left_point, 0,
+                                               geometry.grid_width_max)
+        if resolved is None:
             raise GridCalculatorException(
                 "The left point provided ({}) isn't in the grid "
-                "(0 - {})".format(left_point, self._grid_width_max))
-
-    def _error_check_top(self, top_point: float) -> None:
-        """Top point error checking, checks top_point is in grid"""
-        if 0 > top_point or top_point > self._grid_height_max:
+                "(0 - {})".format(left_point, geometry.grid_width_max))
+        return resolved
+
+    def _error_check_top(self, top_point: float,
+                         geometry: _Geometry | None = None) -> float:
+        """Top point error checking, checks top_point is in grid and returns
+        the point to use based on the boundary policy."""
+        if geometry is None:
+            geometry = self._geometry
+        if 0 <= top_point <= geometry.grid_height_max:
+            return top_point
+        resolved = self._apply_boundary_policy(top_point, 0,
+                                               geometry.grid_height_max)
+        if resolved is None:
             raise GridCalculatorException(
                 "The top point provided ({}) isn't in the grid "
-                "(0 - {})".format(top_point, self._grid_height_max))
+                "(0 - {})".format(top_point, geometry.grid_height_max))
+        return resolved
 
     def update_grid(self, grid_width_max: int, grid_height_max: int) -> None:
         """Recalculates the grid based on the provided width and height.
@@ -216,13 +330,10 @@ class GridCalculator:
                                   border).
             grid_height_max (int): The max height point of the grid (bottom
                                    border)."""
-        self._check_value_links_are_valid(self._pixel_end_left,
-                                          self._pixel_end_top,
-                                          grid_width_max, grid_height_max,
-                                          self._pixel_start_left,
-                                          self._pixel_start_top)
-        self._grid_width_max = grid_width_max
-        self._grid_height_max = grid_height_max
+        geometry = self._geometry
+        self._set_geometry(geometry.pixel_end_left, geometry.pixel_end_top,
+                           grid_width_max, grid_height_max,
+                           geometry.pixel_start_left, geometry.pixel_start_top)
 
     def update_pixel_positions(self, pixel_end_left: int, pixel_end_top: int,
                                pixel_start_left: int = 0,
@@ -236,14 +347,43 @@ class GridCalculator:
                                     the grid (default = 0).
             pixel_start_top (int): (Optional) The top pixel point for use by
                                    the grid (default = 0)."""
-        self._check_value_links_are_valid(pixel_end_left, pixel_end_top,
-                                          self._grid_width_max,
-                                          self._grid_height_max,
-                                          pixel_start_left, pixel_start_top)
-        self._pixel_end_left = pixel_end_left
-        self._pixel_end_top = pixel_end_top
-        self._pixel_start_left = pixel_start_left
-        self._pixel_start_top = pixel_start_top
+        geometry = self._geometry
+        self._set_geometry(pixel_end_left, pixel_end_top,
+                           geometry.grid_width_max, geometry.grid_height_max,
+                           pixel_start_left, pixel_start_top)
+
+    def _new_instance(self) -> "GridCalculator":
+        """Returns a grid of the same type with the settings of this grid
+        but no geometry.  Subclasses with more settings override this to
+        copy them."""
+        grid = object.__new__(type(self))
+        grid._boundary_policy = self._boundary_policy
+        return grid
+
+    def translated(self, pixel_left: int,
+                   pixel_top: int) -> "GridCalculator":
+        """Returns a new grid of the same type and size with its pixel
+        positions moved left and up by the pixels provided, such as to draw
+        part of the grid onto a subsurface starting at that position.  Grid
+        points are rounded to the same pixels as this grid, less the offset.
+        The new grid isn't changed when this grid is updated.
+
+        Parameters:
+            pixel_left (int): The pixels to move the grid left by.
+            pixel_top (int): The pixels to move the grid up by.
+
+        Returns:
+            GridCalculator: A grid of the same type as this grid."""
+        geometry = self._geometry
+        moved = geometry._replace(
+            pixel_start_left=geometry.pixel_start_left - pixel_left,
+            pixel_start_top=geometry.pixel_start_top - pixel_top,
+            pixel_end_left=geometry.pixel_end_left - pixel_left,
+            pixel_end_top=geometry.pixel_end_top - pixel_top,
+            version=0, tables=None)
+        grid = self._new_instance()
+        grid._geometry = moved._replace(tables=grid._calculate_tables(moved))
+        return grid
 
     def top_point(self, point: float) -> int:
         """Returns the pixel position of the top point specified.
@@ -253,8 +393,9 @@ class GridCalculator:
 
         Returns:
             int: The pixel value represented by the top grid point."""
-        self._error_check_top(point)
-        return self._get_height_pixels(point)
+        geometry = self._geometry
+        return self._get_height_pixels(self._error_check_top(point, geometry),
+                                       geometry)
 
     def left_point(self, point: float) -> int:
         """Returns the pixel position of the left point specified.
@@ -264,8 +405,9 @@ class GridCalculator:
 
         Returns:
             int: The pixel value represented by the left grid point."""
-        self._error_check_left(point)
-        return self._get_width_pixels(point)
+        geometry = self._geometry
+        return self._get_width_pixels(self._error_check_left(point, geometry),
+                                      geometry)
 
     def position(self, left_point: float, top_point: float) -> tuple:
         """Returns the pixel positions in the grid of the specified points in
@@ -279,9 +421,16 @@ class GridCalculator:
         Returns:
             tuple: The pixel values represented by the grid points (left, top)
         """
-        self._error_check_left(left_point)
-        self._error_check_top(top_point)
-        return self.left_point(left_point), self.top_point(top_point)
+        return self._position(left_point, top_point, self._geometry)
+
+    def _position(self, left_point: float, top_point: float,
+                  geometry: _Geometry) -> tuple:
+        """Returns the pixel position of the grid points in the geometry
+        provided, so several positions can be read from one snapshot."""
+        return self._get_width_pixels(
+            self._error_check_left(left_point, geometry), geometry), \
+            self._get_height_pixels(
+                self._error_check_top(top_point, geometry), geometry)
 
     def height_gap(self, top_point1: float, top_point2: float) -> int:
         """Returns the pixel gap between two specified grid top points.
@@ -292,13 +441,15 @@ class GridCalculator:
 
         Returns:
             int: The number of pixels between the two top points."""
-        self._error_check_top(top_point1)
-        self._error_check_top(top_point2)
+        geometry = self._geometry
+        top_point1 = self._error_check_top(top_point1, geometry)
+        top_point2 = self._error_check_top(top_point2, geometry)
         if top_point1 > top_point2:
             raise GridCalculatorException("top_point1 is greater than "
                                           "top_point2")
 
-        return self.top_point(top_point2) - self.top_point(top_point1)
+        return self._get_height_pixels(top_point2, geometry) - \
+            self._get_height_pixels(top_point1, geometry)
 
     def width_gap(self, left_point1: float, left_point2: float) -> int:
         """Returns the pixel gap between two specified left points.
@@ -309,13 +460,15 @@ class GridCalculator:
 
         Returns:
             int: The number of pixels between the two left points."""
-        self._error_check_left(left_point1)
-        self._error_check_left(left_point2)
+        geometry = self._geometry
+        left_point1 = self._error_check_left(left_point1, geometry)
+        left_point2 = self._error_check_left(left_point2, geometry)
         if left_point1 > left_point2:
             raise GridCalculatorException("left_point1 is greater than "
                                           "left_point2")
 
-        return self.left_point(left_point2) - self.left_point(left_point1)
+        return self._get_width_pixels(left_point2, geometry) - \
+            self._get_width_pixels(left_point1, geometry)
 
     def square(self, left_start: float, top_start: float, left_end: float,
                top_end: float) -> tuple:
@@ -335,18 +488,21 @@ class GridCalculator:
         Returns:
             tuple: The pixel width and height of the square outlined
                    (width, height)"""
-        self._error_check_left(left_start)
-        self._error_check_top(top_start)
-        self._error_check_left(left_end)
-        self._error_check_top(top_end)
+        geometry = self._geometry
+        left_start = self._error_check_left(left_start, geometry)
+        top_start = self._error_check_top(top_start, geometry)
+        left_end = self._error_check_left(left_end, geometry)
+        top_end = self._error_check_top(top_end, geometry)
         if left_start > left_end:
             raise GridCalculatorException("left_start is greater than "
                                           "left_end")
         if top_start > top_end:
             raise GridCalculatorException("top_start is greater than top_end")
 
-        return self.width_gap(left_start, left_end), self.height_gap(top_start,
-                                                                     top_end)
+        return self._get_width_pixels(left_end, geometry) - \
+            self._get_width_pixels(left_start, geometry), \
+            self._get_height_pixels(top_end, geometry) - \
+            self._get_height_pixels(top_start, geometry)
 
     def points_from_left(self, points: float) -> int:
         """Returns the pixel position from the specified number of points from
@@ -357,7 +513,6 @@ class GridCalculator:
 
         Returns:
             int: The left pixel value represented by the grid point."""
-        self._error_check_left(points)
         return self.left_point(points)
 
     def points_from_top(self, points: float) -> int:
@@ -369,7 +524,6 @@ class GridCalculator:
 
         Returns:
             int: The top pixel value represented by the grid point."""
-        self._error_check_top(points)
         return self.top_point(points)
 
     def points_from_right(self, points: float) -> int:
@@ -381,8 +535,9 @@ class GridCalculator:
 
         Returns:
             int: The left pixel value represented by the grid point."""
-        self._error_check_left(self._grid_width_max - points)
-        return self.left_point(self._grid_width_max - points)
+        geometry = self._geometry
+        return self._get_width_pixels(self._error_check_left(
+            geometry.grid_width_max - points, geometry), geometry)
 
     def points_from_bottom(self, points: float) -> int:
         """Returns the pixel position from the specified number of points from
@@ -393,28 +548,177 @@ class GridCalculator:
 
         Returns:
             int: The top pixel value represented by the grid point."""
-        self._error_check_top(self._grid_height_max - points)
-        return self.top_point(self._grid_height_max - points)
+        geometry = self._geometry
+        return self._get_height_pixels(self._error_check_top(
+            geometry.grid_height_max - points, geometry), geometry)
+
+    def resolve_cell(self, left: int, top: int) -> tuple:
+        """Returns the grid cell specified, with cells outside of the grid
+        handled based on the boundary policy.
+
+        Parameters:
+            left (int): The left grid point of the cell.
+            top (int): The top grid point of the cell.
+
+        Returns:
+            tuple: The grid points of the top left of the cell (left, top).
+        """
+        return self._resolve_cell(left, top, self._geometry)
+
+    def _resolve_cell(self, left: int, top: int,
+                      geometry: _Geometry) -> tuple:
+        """Returns the cell specified moved into the grid based on the
+        boundary policy."""
+        width, height = geometry.grid_width_max, geometry.grid_height_max
+        if 0 <= left < width and 0 <= top < height:
+            return left, top
+        resolved_left = self._apply_boundary_policy(left, 0, width)
+        resolved_top = self._apply_boundary_policy(top, 0, height)
+        if resolved_left is None:
+            raise GridCalculatorException(
+                "The cell provided (({}, {})) isn't in the grid (0 - {}, "
+                "0 - {})".format(left, top, width - 1, height - 1))
+        # Clamping allows the far border, which isn't the start of a cell
+        return min(resolved_left, width - 1), min(resolved_top, height - 1)
+
+    def cell_at(self, pixel_left: int, pixel_top: int) -> tuple:
+        """Returns the grid cell containing the pixel position specified.
+
+        Parameters:
+            pixel_left (int): The left pixel position to look up.
+            pixel_top (int): The top pixel position to look up.
+
+        Returns:
+            tuple: The grid points of the top left of the cell containing the
+                   pixel position (left, top)."""
+        geometry = self._geometry
+        start_left, end_left = geometry.pixel_start_left, \
+            geometry.pixel_end_left
+        start_top, end_top = geometry.pixel_start_top, geometry.pixel_end_top
+        if not start_left <= pixel_left <= end_left:
+            resolved = self._apply_boundary_policy(pixel_left, start_left,
+                                                   end_left)
+            if resolved is None:
+                raise GridCalculatorException(
+                    "The pixel left position provided ({}) isn't in the grid "
+                    "({} - {})".format(pixel_left, start_left, end_left))
+            pixel_left = resolved
+        if not start_top <= pixel_top <= end_top:
+            resolved = self._apply_boundary_policy(pixel_top, start_top,
+                                                   end_top)
+            if resolved is None:
+                raise GridCalculatorException(
+                    "The pixel top position provided ({}) isn't in the grid "
+                    "({} - {})".format(pixel_top, start_top, end_top))
+            pixel_top = resolved
+        return self._pixel_to_cell(pixel_left, pixel_top, geometry)
+
+    def _pixel_to_cell(self, pixel_left: int, pixel_top: int,
+                       geometry: _Geometry) -> tuple:
+        """Returns the cell containing a pixel position inside the grid."""
+        return self._get_width_cell(pixel_left, geometry), \
+            self._get_height_cell(pixel_top, geometry)
+
+    def cells_at(self, pixel_positions: list) -> list:
+        """Returns the grid cells containing each of the pixel positions
+        specified.
+
+        Parameters:
+            pixel_positions (list): The pixel positions to look up
+                                    [(left, top), ...].
+
+        Returns:
+            list: The grid points of the top left of each cell
+                  [(left, top), ...]."""
+        cell_at = self.cell_at
+        return [cell_at(pixel_left, pixel_top)
+                for pixel_left, pixel_top in pixel_positions]
+
+    def cell_center(self, left: int, top: int) -> tuple:
+        """Returns the pixel position of the centre of the cell specified.
+
+        Parameters:
+            left (int): The left grid point of the cell.
+            top (int): The top grid point of the cell.
+
+        Returns:
+            tuple: The pixel values of the centre of the cell (left, top)."""
+        geometry = self._geometry
+        left, top = self._resolve_cell(left, top, geometry)
+        return self._get_width_pixels(left + 0.5, geometry), \
+            self._get_height_pixels(top + 0.5, geometry)
+
+    def cell_vertices(self, left: int, top: int) -> list:
+        """Returns the pixel positions of the corners of the cell specified.
+
+        Parameters:
+            left (int): The left grid point of the cell.
+            top (int): The top grid point of the cell.
+
+        Returns:
+            list: The pixel values of each corner of the cell clockwise from
+                  the top left [(left, top), ...]."""
+        geometry = self._geometry
+        left, top = self._resolve_cell(left, top, geometry)
+        pixel_left = self._get_width_pixels(left, geometry)
+        pixel_right = self._get_width_pixels(left + 1, geometry)
+        pixel_top = self._get_height_pixels(top, geometry)
+        pixel_bottom = self._get_height_pixels(top + 1, geometry)
+        return [(pixel_left, pixel_top), (pixel_right, pixel_top),
+                (pixel_right, pixel_bottom), (pixel_left, pixel_bottom)]
 
     def draw_grid_to_surface(self, surface: Surface,
-                             color: tuple = (0, 0, 0)) -> None:
+                             color: tuple = (0, 0, 0),
+                             min_line_spacing: float = 0,
+                             fill_spacing: float = 0) -> None:
         """Draws the grid to the pygame surface provided.
 
         Parameters:
             surface (pygame.Surface): The surface you want to show the grid
                                       on.
             color (tuple): (Optional) Set the color of the grid
-                           (default = black (0, 0, 0))."""
+                           (default = black (0, 0, 0)).
+            min_line_spacing (float): (Optional) The minimum number of pixels
+                                      between drawn lines.  If the cells are
+                                      smaller than this, only every Nth line
+                                      is drawn along with the border
+                                      (default = 0, draw every line).
+            fill_spacing (float): (Optional) If the cells are smaller than
+                                  this number of pixels, the grid area is
+                                  filled with the color instead of drawing
+                                  lines (default = 0, never fill)."""
+        geometry = self._geometry
+        width_pixels, height_pixels = self._get_width_pixels, \
+            self._get_height_pixels
+        spacing_left, spacing_top = geometry.cell_width, geometry.cell_height
+        left = width_pixels(0, geometry)
+        top = height_pixels(0, geometry)
+        right = width_pixels(geometry.grid_width_max, geometry)
+        bottom = height_pixels(geometry.grid_height_max, geometry)
+        if min(spacing_left, spacing_top) < fill_spacing:
+            draw.rect(surface, color, (left, top, right - left + 1,
+                                       bottom - top + 1))
+            return
         # Draw lines from left to right
-        l_point, t_point = 0, 0
-        while l_point <= self._grid_width_max:
-            draw.line(surface, color,
-                      (self.left_point(l_point), self.points_from_top(0)),
-                      (self.left_point(l_point), self.points_from_bottom(0)))
-            l_point += 1
+        for l_point in self._lines_to_draw(geometry.grid_width_max,
+                                           spacing_left, min_line_spacing):
+            pixel_left = width_pixels(l_point, geometry)
+            draw.line(surface, color, (pixel_left, top), (pixel_left, bottom))
         # Draw lines from top to bottom
-        while t_point <= self._grid_height_max:
-            draw.line(surface, color,
-                      (self.points_from_left(0), self.top_point(t_point)),
-                      (self.points_from_right(0), self.top_point(t_point)))
-            t_point += 1
+        for t_point in self._lines_to_draw(geometry.grid_height_max,
+                                           spacing_top, min_line_spacing):
+            pixel_top = height_pixels(t_point, geometry)
+            draw.line(surface, color, (left, pixel_top), (right, pixel_top))
+
+    @staticmethod
+    def _lines_to_draw(grid_max: int, spacing: float,
+                       min_line_spacing: float) -> range | list:
+        """Returns the grid points to draw lines at, skipping lines so they
+        are at least min_line_spacing pixels apart and keeping the border."""
+        if spacing <= 0 or spacing >= min_line_spacing:
+            return range(grid_max + 1)
+        step = math.ceil(min_line_spacing / spacing)
+        points = list(range(0, grid_max + 1, step))
+        if points[-1] != grid_max:
+            points.append(grid_max)
+        return points
@@ -0,0 +1,360 @@
+import numpy
+import pygame
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+
+# The events routed to the region under the pointer
+_MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+                 pygame.MOUSEBUTTONUP)
+_TOUCH_EVENTS = (pygame.FINGERMOTION, pygame.FINGERDOWN, pygame.FINGERUP)
+# The hover cell when the cell under the mouse needs working out again
+_UNKNOWN = object()
+
+
+class _Region:
+    """A span of cells claimed by a widget, with its handlers."""
+    __slots__ = ("key", "span", "on_event", "on_enter", "on_leave")
+
+    def __init__(self, key, span: tuple, on_event, on_enter, on_leave):
+        self.key = key
+        self.span = span
+        self.on_event = on_event
+        self.on_enter = on_enter
+        self.on_leave = on_leave
+
+
+class RegionRegistry:
+    """Create a RegionRegistry for UI widgets to claim rectangular spans of
+       GridCalculator cells, routing mouse and touch events to the widget
+       under the pointer.
+
+    Each region is given a slot when added, with later regions drawn over
+    earlier ones where they overlap (adding a region again moves it to the
+    top).  Every column and row of the grid holds a bit mask of the slots
+    covering it, so the owner of a cell is the highest bit set in both its
+    column's and row's mask, without checking every region.  Grids of up to
+    max_table_cells cells also keep a table of the owner of every cell, so
+    lookups are a single index.  Hover is tracked from the cell under the
+    pointer, so the owner is only looked up when the pointer moves into
+    another cell.
+
+    Parameters:
+        grid (GridCalculator): The grid the regions are in.
+        max_table_cells (int): (Optional) The most cells a grid can have for
+                               the owner of every cell to be kept in a table,
+                               0 to always use the masks (default = 65536).
+    """
+
+    def __init__(self, grid: GridCalculator, max_table_cells: int = 65536):
+        if max_table_cells < 0:
+            raise GridCalculatorException("The max table cells cannot be "
+                                          "less than 0")
+        self.grid = grid
+        self._max_table_cells = max_table_cells
+        self._regions = {}
+        self._slots = {}
+        self._next_slot = 0
+        self._hovered = None
+        self._hover_cell = _UNKNOWN
+        self._build()
+
+    def __repr__(self):
+        return "RegionRegistry(regions={};  lookup={})".format(
+            len(self._slots), "table" if self.uses_table else "masks")
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key) -> bool:
+        return key in self._slots
+
+    @property
+    def uses_table(self) -> bool:
+        """Returns if the owner of every cell is kept in a table.
+
+        Returns:
+            bool: True if the grid has no more than max_table_cells
+                  cells."""
+        return self._table is not None
+
+    @property
+    def hovered(self):
+        """Returns the region under the mouse.
+
+        Returns:
+            hashable: The key of the region, or None if the mouse isn't over
+                      a region."""
+        return self._hovered
+
+    def _build(self) -> None:
+        """Rebuilds the masks and table for the size of the grid."""
+        width, height = self.grid.size
+        self._size = (width, height)
+        self._geometry_version = self.grid.geometry_version
+        self._columns = [0] * width
+        self._rows = [0] * height
+        self._table = numpy.full((width, height), -1, dtype=numpy.int64) \
+            if width * height <= self._max_table_cells else None
+        for slot in sorted(self._regions):
+            self._claim(slot, self._regions[slot].span)
+        self._hover_cell = _UNKNOWN
+
+    def _check_geometry(self) -> None:
+        """Rebuilds the masks and table if the grid has changed size, and
+        works out the cell under the pointer again if the grid has moved."""
+        if self._geometry_version != self.grid.geometry_version:
+            if self._size != self.grid.size:
+                self._build()
+            self._geometry_version = self.grid.geometry_version
+            self._hover_cell = _UNKNOWN
+
+    def _clipped(self, span: tuple) -> tuple | None:
+        """Returns the (left, top, right, bottom) cells of a span inside the
+        grid (exclusive), or None if none of it is."""
+        left, top, width, height = span
+        right = min(left + width, self._size[0])
+        bottom = min(top + height, self._size[1])
+        left, top = max(left, 0), max(top, 0)
+        if left >= right or top >= bottom:
+            return None
+        return left, top, right, bottom
+
+    def _claim(self, slot: int, span: tuple) -> None:
+        """Adds a slot to the masks and table for the cells of a span."""
+        clipped = self._clipped(span)
+        if clipped is None:
+            return
+        left, top, right, bottom = clipped
+        bit = 1 << slot
+        columns, rows = self._columns, self._rows
+        for column in range(left, right):
+            columns[column] |= bit
+        for row in range(top, bottom):
+            rows[row] |= bit
+        if self._table is not None:
+            # The newest slot is always the highest, so is on top
+            self._table[left:right, top:bottom] = slot
+
+    def _release(self, slot: int, span: tuple) -> None:
+        """Removes a slot from the masks and table, handing its cells to the
+        highest slot left covering each."""
+        clipped = self._clipped(span)
+        if clipped is None:
+            return
+        left, top, right, bottom = clipped
+        bit = ~(1 << slot)
+        columns, rows = self._columns, self._rows
+        for column in range(left, right):
+            columns[column] &= bit
+        for row in range(top, bottom):
+            rows[row] &= bit
+        if self._table is not None:
+            table = self._table
+            for column, row in numpy.argwhere(
+                    table[left:right, top:bottom] == slot):
+                column, row = column + left, row + top
+                table[column, row] = (columns[column] &
+                                      rows[row]).bit_length() - 1
+
+    def _compact(self) -> None:
+        """Renumbers the slots from 0 so the masks don't keep growing as
+        regions are added and removed."""
+        regions = [self._regions[slot] for slot in sorted(self._regions)]
+        self._regions = dict(enumerate(regions))
+        self._slots = {region.key: slot
+                       for slot, region in self._regions.items()}
+        self._next_slot = len(regions)
+        self._build()
+
+    def add(self, key, grid_left: int, grid_top: int, grid_width: int = 1,
+            grid_height: int = 1, on_event=None, on_enter=None,
+            on_leave=None) -> None:
+        """Claims a span of cells for a widget, on top of any regions it
+        overlaps.  Adding a key again moves its region.
+
+        Parameters:
+            key (hashable): The key of the widget.
+            grid_left (int): The left cell of the span.
+            grid_top (int): The top cell of the span.
+            grid_width (int): (Optional) The number of cells the span covers
+                              from left to right (default = 1).
+            grid_height (int): (Optional) The number of cells the span covers
+                               from top to bottom (default = 1).
+            on_event (callable): (Optional) Called as
+                                 on_event(key, event, cell) with the mouse
+                                 and touch events over the span
+                                 (default = None).
+            on_enter (callable): (Optional) Called as on_enter(key, event)
+                                 when the mouse moves over the span
+                                 (default = None).
+            on_leave (callable): (Optional) Called as on_leave(key, event)
+                                 when the mouse moves off the span
+                                 (default = None)."""
+        if grid_width < 1 or grid_height < 1:
+            raise GridCalculatorException(
+                "The grid width ({}) and grid height ({}) must be greater "
+                "than 0".format(grid_width, grid_height))
+        self._check_geometry()
+        if key in self._slots:
+            self.remove(key)
+        slot = self._next_slot
+        self._next_slot += 1
+        span = (grid_left, grid_top, grid_width, grid_height)
+        self._regions[slot] = _Region(key, span, on_event, on_enter,
+                                      on_leave)
+        self._slots[key] = slot
+        self._claim(slot, span)
+        self._hover_cell = _UNKNOWN
+
+    def remove(self, key) -> None:
+        """Removes a widget's region.  No leave event is sent if the mouse
+        is over it.
+
+        Parameters:
+            key (hashable): The key of the widget."""
+        self._check_geometry()
+        slot = self._slots.pop(key)
+        self._release(slot, self._regions.pop(slot).span)
+        if self._hovered == key:
+            self._hovered = None
+        self._hover_cell = _UNKNOWN
+        if self._next_slot > 2 * len(self._slots) + 64:
+            self._compact()
+
+    def clear(self) -> None:
+        """Removes every region."""
+        self._regions.clear()
+        self._slots.clear()
+        self._next_slot = 0
+        self._hovered = None
+        self._build()
+
+    def span(self, key) -> tuple:
+        """Returns the span of cells a widget has claimed.
+
+        Parameters:
+            key (hashable): The key of the widget.
+
+        Returns:
+            tuple: The (left, top, width, height) of the span in cells."""
+        return self._regions[self._slots[key]].span
+
+    def _owner_slot(self, left: int, top: int) -> int:
+        """Returns the slot owning a cell inside the grid, or -1."""
+        if self._table is not None:
+            return self._table.item(left, top)
+        return (self._columns[left] & self._rows[top]).bit_length() - 1
+
+    def owner(self, grid_left: int, grid_top: int):
+        """Returns the widget owning a cell.
+
+        Parameters:
+            grid_left (int): The left cell.
+            grid_top (int): The top cell.
+
+        Returns:
+            hashable: The key of the widget on top at the cell, or None if
+                      no region covers it."""
+        self._check_geometry()
+        if not (0 <= grid_left < self._size[0] and
+                0 <= grid_top < self._size[1]):
+            return None
+        slot = self._owner_slot(grid_left, grid_top)
+        return None if slot < 0 else self._regions[slot].key
+
+    def _cell_at(self, pixel_left: int, pixel_top: int) -> tuple | None:
+        """Returns the cell containing a pixel position, or None if it
+        isn't in the grid."""
+        start_left, start_top = self.grid.position(0, 0)
+        width, height = self.grid.pixel_size
+        if not (start_left <= pixel_left <= start_left + width and
+                start_top <= pixel_top <= start_top + height):
+            return None
+        try:
+            return self.grid.cell_at(pixel_left, pixel_top)
+        except GridCalculatorException:
+            return None
+
+    def owner_at(self, pixel_left: int, pixel_top: int):
+        """Returns the widget under a pixel position.
+
+        Parameters:
+            pixel_left (int): The left pixel position.
+            pixel_top (int): The top pixel position.
+
+        Returns:
+            hashable: The key of the widget, or None if no region is under
+                      the position."""
+        self._check_geometry()
+        cell = self._cell_at(pixel_left, pixel_top)
+        return None if cell is None else self.owner(*cell)
+
+    def _hover(self, cell: tuple | None, event: pygame.event.Event) -> None:
+        """Moves the hover to the region owning a cell, sending leave and
+        enter events if it has changed."""
+        if cell is None:
+            key = None
+        else:
+            slot = self._owner_slot(*cell)
+            key = None if slot < 0 else self._regions[slot].key
+        self._hover_cell = cell
+        if key == self._hovered:
+            return
+        if self._hovered is not None:
+            region = self._regions[self._slots[self._hovered]]
+            if region.on_leave is not None:
+                region.on_leave(self._hovered, event)
+        self._hovered = key
+        if key is not None:
+            region = self._regions[self._slots[key]]
+            if region.on_enter is not None:
+                region.on_enter(key, event)
+
+    def _event_position(self, event: pygame.event.Event) -> tuple | None:
+        """Returns the pixel position of a mouse or touch event, or None for
+        other events."""
+        if event.type in _MOUSE_EVENTS:
+            return event.pos
+        if event.type in _TOUCH_EVENTS:
+            # Touch positions are from 0 - 1 across the window
+            surface = pygame.display.get_surface() \
+                if pygame.display.get_init() else None
+            if surface is None:
+                return None
+            width, height = surface.get_size()
+            return int(event.x * width), int(event.y * height)
+        return None
+
+    def handle_event(self, event: pygame.event.Event):
+        """Routes a mouse or touch event to the widget under it, updating
+        the hover for mouse movement.  Other events are ignored.
+
+        Parameters:
+            event (pygame.event.Event): The event to route.
+
+        Returns:
+            hashable: The key of the widget the event was routed to, or None
+                      if it wasn't over a region."""
+        self._check_geometry()
+        if event.type == pygame.WINDOWLEAVE:
+            self._hover(None, event)
+            return None
+        position = self._event_position(event)
+        if position is None:
+            return None
+        cell = self._cell_at(*position)
+        if event.type in _MOUSE_EVENTS:
+            # The owner is only looked up when the mouse changes cell
+            if cell != self._hover_cell:
+                self._hover(cell, event)
+            key = self._hovered
+        else:
+            key = None if cell is None else self.owner(*cell)
+        if key is None:
+            return None
+        region = self._regions[self._slots[key]]
+        if region.on_event is not None:
+            region.on_event(key, event, cell)
+        return key
@@ -0,0 +1,248 @@
+import hashlib
+import os
+import struct
+import tempfile
+from collections import OrderedDict
+
+import numpy
+import pygame
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+
+_MAGIC = b"PGLC"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBII")
+_SUFFIX = ".layer"
+
+
+def _hash_value(hasher, value) -> None:
+    """Adds a value to a hash along with its type, so values that print the
+    same (such as 1 and "1") don't hash the same."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        data = bytes(value)
+        hasher.update(b"b%d:" % len(data) + data)
+    elif isinstance(value, numpy.ndarray):
+        hasher.update("a{}{}:".format(value.dtype.str,
+                                      value.shape).encode())
+        hasher.update(numpy.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (tuple, list)):
+        hasher.update(b"l%d:" % len(value))
+        for item in value:
+            _hash_value(hasher, item)
+    elif isinstance(value, dict):
+        hasher.update(b"d%d:" % len(value))
+        for key in sorted(value, key=repr):
+            _hash_value(hasher, key)
+            _hash_value(hasher, value[key])
+    elif value is None or isinstance(value, (bool, int, float, str,
+                                             pygame.Color)):
+        text = repr(tuple(value) if isinstance(value, pygame.Color)
+                    else value)
+        hasher.update("{}{}:".format(type(value).__name__,
+                                     len(text)).encode() + text.encode())
+    else:
+        raise GridCalculatorException(
+            "Values of type {} can't be used in a layer key, use numbers, "
+            "strings, bytes, tuples, lists or dicts".format(
+                type(value).__name__))
+
+
+class LayerCache:
+    """Create a LayerCache to keep prerendered static layers, such as grid
+       lines, borders and decorations, on disk between runs.
+
+    Each layer is stored as a file of raw RGBA pixels after a short header,
+    so loading it is a single read and pygame.image.frombuffer, without
+    decoding an image format.  Layers are looked up by a key made from the
+    grid's type and geometry, the layer size, the colours used and a
+    description of the drawing commands, so a layer drawn for a resolution
+    the cache has seen before is loaded rather than drawn again.  Once the
+    layers take up more than max_bytes, the least recently used are
+    deleted.  Layers are written to a temporary file and then renamed, so a
+    layer is never read half written.
+
+    Parameters:
+        directory (str): The directory to keep the layers in, which is
+                         created if it doesn't exist.
+        max_bytes (int): (Optional) The most bytes of layers to keep
+                         (default = 256 MiB).
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        if max_bytes < 1:
+            raise GridCalculatorException("The max bytes must be greater "
+                                          "than 0")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._layers = OrderedDict()
+        self._total_bytes = 0
+        # The last modified times of the files hold the order they were
+        # used in, so it is kept between runs
+        found = []
+        for name in os.listdir(directory):
+            if name.endswith(_SUFFIX):
+                status = os.stat(os.path.join(directory, name))
+                found.append((status.st_mtime_ns, name[:-len(_SUFFIX)],
+                              status.st_size))
+        for _, key, size in sorted(found):
+            self._layers[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    def __repr__(self):
+        return "LayerCache(directory={};  layers={};  bytes={}/{})".format(
+            self._directory, len(self._layers), self._total_bytes,
+            self._max_bytes)
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._layers
+
+    @property
+    def total_bytes(self) -> int:
+        """Returns the size of the layers on disk.
+
+        Returns:
+            int: The total bytes of every layer file."""
+        return self._total_bytes
+
+    @staticmethod
+    def key(grid: GridCalculator, size: tuple, colors=None,
+            commands=None) -> str:
+        """Returns the key of a layer drawn for a grid.
+
+        Parameters:
+            grid (GridCalculator): The grid the layer is drawn for.
+            size (tuple): The (width, height) of the layer in pixels.
+            colors (any): (Optional) The colours the layer is drawn with
+                          (default = None).
+            commands (any): (Optional) A description of what is drawn, such
+                            as the names and values of the draw calls made,
+                            a version string or a recorded draw log
+                            (default = None).
+
+        Colours and commands can be made of numbers, strings, bytes, colours,
+        NumPy arrays, tuples, lists and dicts.
+
+        Returns:
+            str: The hex SHA-256 of the grid's geometry, the size, colours
+                 and commands."""
+        hasher = hashlib.sha256()
+        geometry = grid._geometry
+        _hash_value(hasher, type(grid).__qualname__)
+        # The version only counts updates, so isn't part of the key
+        _hash_value(hasher, tuple(geometry._replace(version=0)))
+        _hash_value(hasher, tuple(size))
+        _hash_value(hasher, colors)
+        _hash_value(hasher, commands)
+        return hasher.hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Returns the path of a layer file."""
+        return os.path.join(self._directory, key + _SUFFIX)
+
+    def _remove(self, key: str) -> None:
+        """Deletes a layer file and forgets it."""
+        self._total_bytes -= self._layers.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        """Deletes the least recently used layers until the cache fits."""
+        while self._total_bytes > self._max_bytes and self._layers:
+            self._remove(next(iter(self._layers)))
+
+    def get(self, key: str) -> pygame.Surface | None:
+        """Loads a layer, marking it as recently used.
+
+        Parameters:
+            key (str): The key of the layer.
+
+        Returns:
+            pygame.Surface: The layer, or None if it isn't cached (or its
+                            file is damaged, in which case it is deleted)."""
+        if key not in self._layers:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                data = bytearray(self._layers[key])
+                read = file.readinto(data)
+        except FileNotFoundError:
+            self._total_bytes -= self._layers.pop(key)
+            return None
+        magic, version, width, height = _HEADER.unpack_from(data) \
+            if read >= _HEADER.size else (None, None, 0, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION or \
+                read != _HEADER.size + width * height * 4:
+            self._remove(key)
+            return None
+        self._layers.move_to_end(key)
+        os.utime(path)
+        return pygame.image.frombuffer(memoryview(data)[_HEADER.size:],
+                                       (width, height), "RGBA")
+
+    def put(self, key: str, surface: pygame.Surface) -> None:
+        """Writes a layer, deleting the least recently used layers if the
+        cache is full.
+
+        Parameters:
+            key (str): The key of the layer.
+            surface (pygame.Surface): The layer to keep."""
+        width, height = surface.get_size()
+        data = _HEADER.pack(_MAGIC, _FORMAT_VERSION, width, height) + \
+            pygame.image.tobytes(surface, "RGBA")
+        if len(data) > self._max_bytes:
+            raise GridCalculatorException(
+                "The layer ({} bytes) is bigger than the max bytes "
+                "({})".format(len(data), self._max_bytes))
+        handle, temporary = tempfile.mkstemp(suffix=".tmp",
+                                             dir=self._directory)
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(data)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.remove(temporary)
+            raise
+        self._total_bytes += len(data) - self._layers.pop(key, 0)
+        self._layers[key] = len(data)
+        self._evict()
+
+    def layer(self, grid: GridCalculator, size: tuple, draw, colors=None,
+              commands=None) -> pygame.Surface:
+        """Loads a layer drawn for a grid, drawing and keeping it first if
+        it isn't cached.
+
+        Parameters:
+            grid (GridCalculator): The grid the layer is drawn for.
+            size (tuple): The (width, height) of the layer in pixels.
+            draw (callable): Called with a transparent surface of the size
+                             provided to draw the layer on.
+            colors (any): (Optional) The colours the layer is drawn with
+                          (default = None).
+            commands (any): (Optional) A description of what draw draws,
+                            which must change whenever draw does
+                            (default = None).
+
+        Returns:
+            pygame.Surface: The layer."""
+        key = self.key(grid, size, colors, commands)
+        surface = self.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            draw(surface)
+            self.put(key, surface)
+        return surface
+
+    def clear(self) -> None:
+        """Deletes every layer."""
+        for key in list(self._layers):
+            self._remove(key)
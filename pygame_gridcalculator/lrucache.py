@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """A size-bounded least recently used cache, used to hold values that
+       are expensive to make again, such as scaled images and rendered text,
+       CellQuery objects and chunks loaded from disk.
+
+    Once the cache is full, storing a new key evicts the least recently used
+    entry.  put returns the evicted entry, so callers that need to release
+    it (such as writing a changed chunk back to disk) can do so.
+
+    Parameters:
+        max_size (int): The maximum number of entries to hold before the least
+                        recently used entry is evicted.
+    """
+
+    def __init__(self, max_size: int):
+        if max_size < 1:
+            raise ValueError("The cache max size must be greater than 0")
+        self._max_size = max_size
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    @property
+    def max_size(self) -> int:
+        """Returns the maximum number of entries held by the cache."""
+        return self._max_size
+
+    def get(self, key, default=None):
+        """Returns the value stored against the key, marking it as recently
+        used, or the default if the key isn't cached."""
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            return default
+        return self._entries[key]
+
+    def put(self, key, value) -> tuple | None:
+        """Stores the value against the key, marking it as recently used and
+        evicting the least recently used entry if the cache is full.
+
+        Parameters:
+            key (hashable): The key to store the value against.
+            value (any): The value to store.
+
+        Returns:
+            tuple: The evicted (key, value) pair, or None if nothing was
+                   evicted."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            return self._entries.popitem(last=False)
+        return None
+
+    def pop(self, key, default=None):
+        """Removes the key from the cache and returns its value, or the
+        default if the key isn't cached."""
+        return self._entries.pop(key, default)
+
+    def items(self) -> list:
+        """Returns the cached (key, value) pairs from least to most recently
+        used."""
+        return list(self._entries.items())
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        self._entries.clear()
@@ -0,0 +1,202 @@
+import numpy
+import pygame
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+
+_REDUCTIONS = ("max", "min", "mean", "any")
+
+
+class Minimap:
+    """Create a Minimap to reduce per-cell grid data down to one value per
+       block of cells, for drawing an overview of a large grid.
+
+    Parameters:
+        data (numpy.ndarray): The per-cell data for the full grid, indexed
+                              as [left, top].
+        minimap_grid (GridCalculator): The grid for the minimap area.  Its
+                                       size sets the number of blocks the
+                                       data is reduced to.
+        reduction (str): (Optional) How each block is reduced, one of "max",
+                         "min", "mean" or "any" (default = "max").
+    """
+
+    def __init__(self, data: numpy.ndarray, minimap_grid: GridCalculator,
+                 reduction: str = "max"):
+        if data.ndim != 2:
+            raise GridCalculatorException("The minimap data must be a 2D "
+                                          "array indexed as [left, top]")
+        if reduction not in _REDUCTIONS:
+            raise GridCalculatorException(
+                "The reduction provided ({}) must be one of {}".format(
+                    reduction, ", ".join(_REDUCTIONS)))
+        self.data = data
+        self.minimap_grid = minimap_grid
+        self._reduction = reduction
+        self._dirty = set()
+        self._surface = None
+        self._surface_key = None
+        self._rebuild()
+
+    def __repr__(self):
+        return "Minimap(data: width={}, height={};  blocks: width={}, " \
+               "height={};  reduction={})".format(*self.data.shape,
+                                                  *self._values.shape,
+                                                  self._reduction)
+
+    def _block_edges(self) -> tuple:
+        """Returns the cell index each block starts at for both axes."""
+        edges = []
+        for cells, blocks in zip(self.data.shape, self.minimap_grid.size):
+            if blocks > cells:
+                raise GridCalculatorException(
+                    "The minimap grid ({}) cannot have more blocks than the "
+                    "data has cells ({})".format(self.minimap_grid.size,
+                                                 self.data.shape))
+            edges.append(numpy.arange(blocks) * cells // blocks)
+        return tuple(edges)
+
+    def _reduce(self, data: numpy.ndarray, left_edges: numpy.ndarray,
+                top_edges: numpy.ndarray) -> numpy.ndarray:
+        """Reduces the data into blocks starting at the edges provided."""
+        if self._reduction == "any":
+            data = data != 0
+            ufunc = numpy.logical_or
+        elif self._reduction == "max":
+            ufunc = numpy.maximum
+        elif self._reduction == "min":
+            ufunc = numpy.minimum
+        else:
+            ufunc = numpy.add
+            data = data.astype(numpy.float64, copy=False)
+        reduced = ufunc.reduceat(ufunc.reduceat(data, left_edges, axis=0),
+                                 top_edges, axis=1)
+        if self._reduction == "mean":
+            widths = numpy.diff(numpy.append(left_edges, data.shape[0]))
+            heights = numpy.diff(numpy.append(top_edges, data.shape[1]))
+            reduced /= numpy.outer(widths, heights)
+        return reduced
+
+    def _rebuild(self) -> None:
+        """Recalculates every block from the full data."""
+        self._left_edges, self._top_edges = self._block_edges()
+        self._values = self._reduce(self.data, self._left_edges,
+                                    self._top_edges)
+        self._blocks = self.minimap_grid.size
+        self._dirty.clear()
+        self._surface = None
+
+    @property
+    def values(self) -> numpy.ndarray:
+        """Returns the reduced block values, refreshing any blocks that
+        contain changed cells.
+
+        Returns:
+            numpy.ndarray: The block values indexed as [left, top]."""
+        self.refresh()
+        return self._values
+
+    def mark_cells_changed(self, lefts, tops) -> None:
+        """Marks cells as changed so the blocks containing them are
+        recalculated on the next refresh.
+
+        Parameters:
+            lefts (array-like): The left grid points of the changed cells.
+            tops (array-like): The top grid points of the changed cells."""
+        block_lefts = numpy.searchsorted(self._left_edges,
+                                         numpy.atleast_1d(lefts),
+                                         side="right") - 1
+        block_tops = numpy.searchsorted(self._top_edges,
+                                        numpy.atleast_1d(tops),
+                                        side="right") - 1
+        self._dirty.update(zip(block_lefts.tolist(), block_tops.tolist()))
+
+    def set_cells(self, lefts, tops, values) -> None:
+        """Updates the data for the cells provided and marks them as changed.
+
+        Parameters:
+            lefts (array-like): The left grid points of the cells.
+            tops (array-like): The top grid points of the cells.
+            values (array-like): The new values for the cells."""
+        self.data[lefts, tops] = values
+        self.mark_cells_changed(lefts, tops)
+
+    def refresh(self) -> None:
+        """Recalculates the blocks containing changed cells, or every block
+        if the minimap grid has been resized."""
+        if self._blocks != self.minimap_grid.size:
+            self._rebuild()
+            return
+        if not self._dirty:
+            return
+        if len(self._dirty) * 4 > self._values.size:
+            self._rebuild()
+            return
+        left_ends = numpy.append(self._left_edges, self.data.shape[0])
+        top_ends = numpy.append(self._top_edges, self.data.shape[1])
+        for block_left, block_top in self._dirty:
+            block = self.data[left_ends[block_left]:left_ends[block_left + 1],
+                              top_ends[block_top]:top_ends[block_top + 1]]
+            self._values[block_left, block_top] = self._reduce(
+                block, numpy.zeros(1, dtype=numpy.intp),
+                numpy.zeros(1, dtype=numpy.intp))[0, 0]
+        self._dirty.clear()
+        self._surface = None
+
+    def to_surface(self, low_color: tuple = (0, 0, 0),
+                   high_color: tuple = (255, 255, 255),
+                   value_range: tuple | None = None) -> pygame.Surface:
+        """Returns a surface with one pixel per block, colored between the
+        low and high colors by the block value.
+
+        Parameters:
+            low_color (tuple): (Optional) The color for the lowest value
+                               (default = black (0, 0, 0)).
+            high_color (tuple): (Optional) The color for the highest value
+                                (default = white (255, 255, 255)).
+            value_range (tuple): (Optional) The (low, high) values to map to
+                                 the colors (default = None, the lowest and
+                                 highest block values).
+
+        Returns:
+            pygame.Surface: A pygame.Surface object."""
+        values = self.values.astype(numpy.float64)
+        low, high = value_range if value_range is not None else \
+            (values.min(), values.max())
+        scale = (values - low) / (high - low) if high != low else \
+            numpy.zeros_like(values)
+        scale = numpy.clip(scale, 0, 1)[..., numpy.newaxis]
+        low_color = numpy.asarray(low_color[:3], dtype=numpy.float64)
+        high_color = numpy.asarray(high_color[:3], dtype=numpy.float64)
+        pixels = low_color + scale * (high_color - low_color)
+        return pygame.surfarray.make_surface(pixels.astype(numpy.uint8))
+
+    def draw(self, surface: pygame.Surface, low_color: tuple = (0, 0, 0),
+             high_color: tuple = (255, 255, 255),
+             value_range: tuple | None = None) -> pygame.Rect:
+        """Draws the minimap on to the surface provided, scaled to fit the
+        minimap grid.  The scaled minimap is reused until a block value, the
+        colors or the minimap grid changes.
+
+        Parameters:
+            surface (pygame.Surface): The surface to draw the minimap on to.
+            low_color (tuple): (Optional) The color for the lowest value
+                               (default = black (0, 0, 0)).
+            high_color (tuple): (Optional) The color for the highest value
+                                (default = white (255, 255, 255)).
+            value_range (tuple): (Optional) The (low, high) values to map to
+                                 the colors (default = None, the lowest and
+                                 highest block values).
+
+        Returns:
+            pygame.Rect: A pygame.Rect object."""
+        self.refresh()
+        key = (self.minimap_grid.geometry_version, tuple(low_color),
+               tuple(high_color), value_range)
+        if self._surface is None or self._surface_key != key:
+            self._surface = pygame.transform.scale(
+                self.to_surface(low_color, high_color, value_range),
+                self.minimap_grid.pixel_size)
+            self._surface_key = key
+        return surface.blit(self._surface, self.minimap_grid.position(0, 0))
@@ -0,0 +1,161 @@
+import math
+
+import numpy
+from pygame_gridcalculator.cellquery import CellQuery
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+from pygame_gridcalculator.lrucache import LRUCache
+from pygame_gridcalculator.scene import Scene
+
+
+class SceneRasterizer:
+    """Create a SceneRasterizer to turn the draw commands of a Scene into an
+       array with one value per grid cell, without drawing any pixels.
+
+    Each command marks the cells it covers, found with a CellQuery, with
+    later commands drawn over earlier ones.  Rects and text mark every cell
+    in their span, lines mark every cell they pass through, and filled
+    polygons and circles mark the cells with their centre inside the shape.
+    Grid lines aren't cell content, so are left out.
+
+    With a palette, colors not in the palette are still opaque, so they hide
+    the palette colors drawn under them and the cells hold 0, as for the
+    background.  One-hot channels mark every palette color drawn in a cell
+    rather than only the color on top, so nothing is hidden from them and
+    colors not in the palette are left out.
+
+    Parameters:
+        palette (list): (Optional) The colors to look for.  If provided, each
+                        cell holds the palette index + 1 of the color drawn
+                        in it, with 0 for background and colors not in the
+                        palette (default = None, each cell holds the RGB
+                        color drawn in it).
+        one_hot (bool): (Optional) If True and a palette is provided, each
+                        cell holds one boolean channel per palette color,
+                        marking every palette color drawn in the cell
+                        (default = False).
+        query_cache_size (int): (Optional) The number of grid sizes to keep
+                                a CellQuery for (default = 16).
+    """
+
+    def __init__(self, palette: list | None = None, one_hot: bool = False,
+                 query_cache_size: int = 16):
+        if one_hot and not palette:
+            raise GridCalculatorException("A palette must be provided for "
+                                          "one-hot observations")
+        self._palette = None if palette is None else \
+            {tuple(color)[:3]: index for index, color in enumerate(palette)}
+        self._one_hot = one_hot
+        self._queries = LRUCache(query_cache_size)
+
+    def __repr__(self):
+        return "SceneRasterizer(palette={}, one_hot={})".format(
+            None if self._palette is None else len(self._palette),
+            self._one_hot)
+
+    def _query(self, size: tuple) -> CellQuery:
+        """Returns a CellQuery for a grid of the size provided."""
+        query = self._queries.get(size)
+        if query is None:
+            # CellQuery only uses the grid size, so one pixel per cell is
+            # enough
+            query = CellQuery(GridCalculator(size[0], size[1], *size))
+            self._queries.put(size, query)
+        return query
+
+    @staticmethod
+    def _span_cells(size: tuple, grid_left: float, grid_top: float,
+                    grid_width: float, grid_height: float,
+                    outline: bool = False) -> tuple:
+        """Returns the cells in a span of grid points, or only the cells on
+        its edge if outline is True."""
+        left = max(math.floor(grid_left), 0)
+        top = max(math.floor(grid_top), 0)
+        right = min(math.ceil(grid_left + grid_width), size[0])
+        bottom = min(math.ceil(grid_top + grid_height), size[1])
+        lefts, tops = numpy.meshgrid(numpy.arange(left, right),
+                                     numpy.arange(top, bottom),
+                                     indexing="ij")
+        if outline:
+            edge = (lefts == left) | (lefts == right - 1) | \
+                (tops == top) | (tops == bottom - 1)
+            return lefts[edge], tops[edge]
+        return lefts.ravel(), tops.ravel()
+
+    def _command_cells(self, query: CellQuery, name: str,
+                       arguments: tuple) -> tuple | None:
+        """Returns the color of a command and the cells it covers, or None
+        for commands that don't cover cells."""
+        size = query.grid.size
+        if name in ("draw_rect", "draw_text"):
+            if name == "draw_rect":
+                color, grid_left, grid_top, grid_width, grid_height, \
+                    width = arguments
+            else:
+                _, color, grid_left, grid_top, grid_width, grid_height, \
+                    _, _ = arguments
+                width = 0
+            return color, self._span_cells(size, grid_left, grid_top,
+                                           grid_width, grid_height, width > 0)
+        if name == "draw_line":
+            color, grid_start_pos, grid_end_pos, _ = arguments
+            return color, query.line(grid_start_pos, grid_end_pos)
+        if name == "draw_lines":
+            color, closed, grid_points, _ = arguments
+            return color, query.lines(closed, grid_points)
+        if name == "draw_polygon":
+            color, grid_points, width = arguments
+            if width > 0:
+                return color, query.lines(True, grid_points)
+            return color, query.polygon(grid_points)
+        if name == "draw_circle":
+            color, grid_center, radius, width = arguments
+            lefts, tops = query.circle(grid_center, radius)
+            if width > 0:
+                # Outlines keep the cells within a cell of the edge
+                ring = (lefts + 0.5 - grid_center[0]) ** 2 + \
+                    (tops + 0.5 - grid_center[1]) ** 2 > \
+                    max(radius - 1, 0) ** 2
+                lefts, tops = lefts[ring], tops[ring]
+            return color, (lefts, tops)
+        return None
+
+    def rasterize(self, scene: Scene) -> numpy.ndarray:
+        """Returns the cell-resolution observation of a scene.
+
+        Parameters:
+            scene (Scene): The scene to rasterize.
+
+        Returns:
+            numpy.ndarray: The observation indexed as [left, top] for palette
+                           indexes, or [left, top, channel] for RGB colors and
+                           one-hot palettes."""
+        width, height = scene.size
+        if self._palette is None:
+            cells = numpy.zeros((width, height, 3), dtype=numpy.uint8)
+        elif self._one_hot:
+            cells = numpy.zeros((width, height, len(self._palette)),
+                                dtype=bool)
+        else:
+            cells = numpy.zeros((width, height), dtype=numpy.int16)
+        query = self._query(scene.size)
+        commands = scene.commands
+        if scene.background is not None:
+            commands.insert(0, ("draw_rect", (scene.background, 0, 0,
+                                              width, height, 0)))
+        for name, arguments in commands:
+            covered = self._command_cells(query, name, arguments)
+            if covered is None:
+                continue
+            color, (lefts, tops) = covered
+            color = tuple(color)[:3]
+            if self._palette is None:
+                cells[lefts, tops] = color
+            elif self._one_hot:
+                if color in self._palette:
+                    cells[lefts, tops, self._palette[color]] = True
+            else:
+                cells[lefts, tops] = self._palette.get(color, -1) + 1
+        return cells
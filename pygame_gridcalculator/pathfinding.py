@@ -0,0 +1,308 @@
+import heapq
+import math
+from collections import deque
+
+import numpy
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+
+_STRAIGHT = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_DIAGONAL = ((-1, -1), (1, -1), (-1, 1), (1, 1))
+
+
+class PathFinder:
+    """Create a PathFinder to find routes between the cells of a
+       GridCalculator.
+
+    Cells are indexed as (left, top) grid points.  Each cell has a cost for
+    moving into it, where a cost of 0 or less marks the cell as impassable.
+
+    Parameters:
+        grid (GridCalculator): The grid to find routes across.
+        costs (numpy.ndarray): (Optional) The cost of moving into each cell,
+                               indexed as [left, top] (default = None, every
+                               cell costs 1).
+        diagonal (bool): (Optional) If True, routes can move diagonally
+                         between cells as long as they don't cut the corner
+                         of an impassable cell (default = False).
+    """
+
+    def __init__(self, grid: GridCalculator,
+                 costs: numpy.ndarray | None = None, diagonal: bool = False):
+        self.grid = grid
+        self._diagonal = diagonal
+        self.set_costs(costs)
+
+    def __repr__(self):
+        return "PathFinder(grid: width={}, height={};  diagonal={})".format(
+            *self._size, self._diagonal)
+
+    def set_costs(self, costs: numpy.ndarray | None) -> None:
+        """Replaces the cost of moving into each cell.
+
+        Parameters:
+            costs (numpy.ndarray): The cost of moving into each cell, indexed
+                                   as [left, top], or None for every cell to
+                                   cost 1."""
+        size = self.grid.size
+        if costs is None:
+            costs = numpy.ones(size)
+        costs = numpy.asarray(costs, dtype=numpy.float64)
+        if costs.shape != size:
+            raise GridCalculatorException(
+                "The costs shape ({}) must match the grid size ({})".format(
+                    costs.shape, size))
+        # The costs are padded with a border of impassable cells so
+        # neighbours can be found without bounds checks
+        padded = numpy.zeros((size[0] + 2, size[1] + 2))
+        padded[1:-1, 1:-1] = numpy.where(costs > 0, costs, 0)
+        self._size = size
+        self._stride = size[1] + 2
+        self._costs = padded.ravel().tolist()
+        passable = padded[padded > 0]
+        self._min_cost = float(passable.min()) if passable.size else 1.0
+        self._uniform = bool(passable.size and
+                             (passable == passable[0]).all())
+
+    def set_cost(self, left: int, top: int, cost: float) -> None:
+        """Updates the cost of moving into a single cell.
+
+        Parameters:
+            left (int): The left grid point of the cell.
+            top (int): The top grid point of the cell.
+            cost (float): The cost of moving into the cell, 0 or less for
+                          impassable."""
+        index = self._index((left, top))
+        cost = max(float(cost), 0.0)
+        if cost != self._costs[index]:
+            self._costs[index] = cost
+            self._uniform = False
+            if 0 < cost < self._min_cost:
+                self._min_cost = cost
+
+    def _check_size(self) -> None:
+        """Raises an error if the grid has been resized since the costs were
+        set, as they no longer match its cells."""
+        if self.grid.size != self._size:
+            raise GridCalculatorException(
+                "The grid size ({}) has changed since the costs were set "
+                "({}), set_costs must be called with costs for the new "
+                "size".format(self.grid.size, self._size))
+
+    def _index(self, cell: tuple) -> int:
+        """Returns the padded list index for the cell provided."""
+        left, top = cell
+        if not (0 <= left < self._size[0] and 0 <= top < self._size[1]):
+            raise GridCalculatorException(
+                "The cell provided ({}) isn't in the grid (0 - {}, "
+                "0 - {})".format(cell, self._size[0] - 1, self._size[1] - 1))
+        return (left + 1) * self._stride + top + 1
+
+    def _cell(self, index: int) -> tuple:
+        """Returns the (left, top) cell for the padded list index."""
+        left, top = divmod(index, self._stride)
+        return left - 1, top - 1
+
+    def _neighbours(self) -> list:
+        """Returns the (index offset, step length, corner offsets) for each
+        move allowed between cells."""
+        stride = self._stride
+        moves = [(left * stride + top, 1.0, ()) for left, top in _STRAIGHT]
+        if self._diagonal:
+            moves += [(left * stride + top, math.sqrt(2),
+                       (left * stride, top)) for left, top in _DIAGONAL]
+        return moves
+
+    def _heuristic(self, goal_index: int):
+        """Returns a function estimating the cost from a padded index to the
+        goal, which never overestimates the cost of the cheapest route."""
+        goal_left, goal_top = divmod(goal_index, self._stride)
+        stride, min_cost = self._stride, self._min_cost
+        diagonal = self._diagonal
+        diagonal_step = (math.sqrt(2) - 2) * min_cost
+
+        def heuristic(index: int) -> float:
+            left, top = divmod(index, stride)
+            left, top = abs(left - goal_left), abs(top - goal_top)
+            if diagonal:
+                return min_cost * (left + top) + \
+                    diagonal_step * min(left, top)
+            return min_cost * (left + top)
+
+        return heuristic
+
+    def _path(self, came_from: dict, index: int) -> list:
+        """Returns the cells of the route ending at the padded index."""
+        path = [index]
+        while index in came_from:
+            index = came_from[index]
+            path.append(index)
+        return [self._cell(index) for index in reversed(path)]
+
+    def find_path(self, start: tuple, goal: tuple) -> list:
+        """Returns the cheapest route between two cells using A*.
+
+        Parameters:
+            start (tuple): The cell to start from (left, top).
+            goal (tuple): The cell to finish at (left, top).
+
+        Returns:
+            list: The cells on the route including the start and goal
+                  [(left, top), ...], or an empty list if there is no route.
+        """
+        self._check_size()
+        start_index, goal_index = self._index(start), self._index(goal)
+        costs = self._costs
+        if costs[start_index] <= 0 or costs[goal_index] <= 0:
+            return []
+        heuristic = self._heuristic(goal_index)
+        moves = self._neighbours()
+        distances = {start_index: 0.0}
+        came_from = {}
+        open_set = [(heuristic(start_index), 0.0, start_index)]
+        while open_set:
+            _, distance, index = heapq.heappop(open_set)
+            if index == goal_index:
+                return self._path(came_from, index)
+            if distance > distances[index]:
+                continue
+            for offset, step, corners in moves:
+                neighbour = index + offset
+                cost = costs[neighbour]
+                if cost <= 0 or (corners and (costs[index + corners[0]] <= 0
+                                              or costs[index + corners[1]]
+                                              <= 0)):
+                    continue
+                new_distance = distance + cost * step
+                if new_distance < distances.get(neighbour, math.inf):
+                    distances[neighbour] = new_distance
+                    came_from[neighbour] = index
+                    heapq.heappush(open_set, (new_distance +
+                                              heuristic(neighbour),
+                                              new_distance, neighbour))
+        return []
+
+    def _breadth_first(self, starts: list, distances: list) -> None:
+        """Fills in the distances from the start indexes where every move
+        costs the same and there are no diagonal moves."""
+        costs = self._costs
+        offsets = [offset for offset, _, _ in self._neighbours()]
+        queue = deque(starts)
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + costs[index]
+            for offset in offsets:
+                neighbour = index + offset
+                if costs[neighbour] > 0 and distances[neighbour] == math.inf:
+                    distances[neighbour] = distance
+                    queue.append(neighbour)
+
+    def _distances(self, sources: list, to_sources: bool) -> list:
+        """Returns the padded list of distances from (or to) the nearest
+        source cell, using a breadth-first search where every move costs the
+        same and Dijkstra's algorithm otherwise."""
+        costs = self._costs
+        distances = [math.inf] * len(costs)
+        starts = [index for index in map(self._index, sources)
+                  if costs[index] > 0]
+        for index in starts:
+            distances[index] = 0.0
+        if self._uniform and not self._diagonal:
+            self._breadth_first(starts, distances)
+            return distances
+        moves = self._neighbours()
+        open_set = [(0.0, index) for index in starts]
+        heapq.heapify(open_set)
+        while open_set:
+            distance, index = heapq.heappop(open_set)
+            if distance > distances[index]:
+                continue
+            for offset, step, corners in moves:
+                neighbour = index + offset
+                cost = costs[neighbour]
+                if cost <= 0 or (corners and (costs[index + corners[0]] <= 0
+                                              or costs[index + corners[1]]
+                                              <= 0)):
+                    continue
+                # Moving towards the sources costs the cell being moved into,
+                # which is the cell the search is expanding from
+                new_distance = distance + (costs[index] if to_sources
+                                           else cost) * step
+                if new_distance < distances[neighbour]:
+                    distances[neighbour] = new_distance
+                    heapq.heappush(open_set, (new_distance, neighbour))
+        return distances
+
+    def _unpad(self, distances: list) -> numpy.ndarray:
+        """Returns the padded list as an array indexed as [left, top]."""
+        return numpy.array(distances).reshape(
+            self._size[0] + 2, self._size[1] + 2)[1:-1, 1:-1]
+
+    def distance_map(self, sources: list) -> numpy.ndarray:
+        """Returns the cost of the cheapest route from the nearest source
+        cell to every cell.
+
+        Parameters:
+            sources (list): The cells to measure from [(left, top), ...].
+
+        Returns:
+            numpy.ndarray: The distances indexed as [left, top], with
+                           numpy.inf for cells that can't be reached."""
+        self._check_size()
+        return self._unpad(self._distances(sources, False))
+
+    def flow_field(self, goals: list) -> numpy.ndarray:
+        """Returns the direction to move from every cell to follow the
+        cheapest route to the nearest goal, so many agents can share one
+        search.
+
+        Parameters:
+            goals (list): The cells to route to [(left, top), ...].
+
+        Returns:
+            numpy.ndarray: The (left, top) step to take from each cell,
+                           indexed as [left, top, 0 or 1].  Goals and cells
+                           that can't reach a goal have a step of (0, 0)."""
+        self._check_size()
+        width, height = self._size
+        distances = numpy.array(self._distances(goals, True)).reshape(
+            width + 2, height + 2)
+        costs = numpy.array(self._costs).reshape(width + 2, height + 2)
+        passable = costs > 0
+        moves = [(left, top, 1.0) for left, top in _STRAIGHT]
+        if self._diagonal:
+            moves += [(left, top, math.sqrt(2)) for left, top in _DIAGONAL]
+        best = numpy.full((width, height), math.inf)
+        field = numpy.zeros((width, height, 2), dtype=numpy.int8)
+        for left, top, step in moves:
+            # The cost of a route through a neighbour includes moving into it
+            neighbour = distances[1 + left:width + 1 + left,
+                                  1 + top:height + 1 + top] + \
+                costs[1 + left:width + 1 + left,
+                      1 + top:height + 1 + top] * step
+            better = neighbour < best
+            if left and top:
+                better &= passable[1 + left:width + 1 + left, 1:-1] & \
+                          passable[1:-1, 1 + top:height + 1 + top]
+            best = numpy.where(better, neighbour, best)
+            field[better] = (left, top)
+        # Goals and cells that can't reach a goal stay where they are
+        field[numpy.isin(distances[1:-1, 1:-1], (0, math.inf))] = (0, 0)
+        return field
+
+    def to_pixels(self, path: list, centre: bool = True) -> list:
+        """Returns the pixel positions for the cells on a route.
+
+        Parameters:
+            path (list): The cells on the route [(left, top), ...].
+            centre (bool): (Optional) If True, the centre of each cell is
+                           returned rather than its top left corner
+                           (default = True).
+
+        Returns:
+            list: The pixel positions of the cells [(left, top), ...]."""
+        offset = 0.5 if centre else 0
+        return [self.grid.position(left + offset, top + offset)
+                for left, top in path]
@@ -0,0 +1,754 @@
+import struct
+import zlib
+
+import pygame
+from pygame_gridcalculator.gridcalculator import (
+    BoundaryPolicy,
+    GridCalculator,
+    GridCalculatorException
+)
+from pygame_gridcalculator.shapefactory import ShapeFactory
+from pygame_gridcalculator.tilegridcalculator import (
+    HexGridCalculator,
+    IsometricGridCalculator
+)
+from pygame_gridcalculator.weightedgridcalculator import (
+    WeightedGridCalculator
+)
+
+_MAGIC = b"PGDR"
+_FORMAT_VERSION = 3
+_COMPRESSED = 1
+
+# Record types, each written as a single byte before the record
+_GEOMETRY, _USE_GRID, _SURFACE, _FRAME, _IMAGE, _FILL, _GRID, _LINE, \
+    _LINES, _AALINE, _AALINES, _POLYGON, _CELL, _CIRCLE, _TEXT, \
+    _BLIT, _VIEW = range(1, 18)
+
+# Grid kinds stored with each geometry record
+_PLAIN, _POINTY_HEX, _FLAT_HEX, _ISOMETRIC, _WEIGHTED = range(5)
+
+_HEADER = struct.Struct("<4sBB")
+_OPCODE = struct.Struct("<B")
+_GEOMETRY_VALUES = struct.Struct("<HBBiiiiii")
+_INDEX = struct.Struct("<H")
+_COUNT = struct.Struct("<I")
+_SURFACE_VALUES = struct.Struct("<HiiIB")  # Size, flags and bit size
+_VIEW_VALUES = struct.Struct("<HHiiii")  # Parent index and Rect
+_IMAGE_VALUES = struct.Struct("<Iii")
+_COMMAND = struct.Struct("<H4B")  # Surface index and RGBA color
+_GRID_VALUES = struct.Struct("<dd")
+_LINE_VALUES = struct.Struct("<ddddh")
+_FLAG_WIDTH = struct.Struct("<Bh")
+_CELL_VALUES = struct.Struct("<iih")
+_CIRCLE_VALUES = struct.Struct("<dddhB")
+_SPAN = struct.Struct("<dddd")
+_TEXT_VALUES = struct.Struct("<iiB")
+_BLIT_VALUES = struct.Struct("<IddddBB")
+_FIXED_PIXELS = struct.Struct("<id")  # Fixed sizes can be part pixels
+_NO_STRING = 0xFFFFFFFF
+
+
+def _pack_string(text: str | None) -> bytes:
+    """Packs a string with its length, or None as a missing length."""
+    if text is None:
+        return _COUNT.pack(_NO_STRING)
+    data = text.encode("utf-8")
+    return _COUNT.pack(len(data)) + data
+
+
+def _pack_points(points: list) -> bytes:
+    """Packs a list of grid points with their count."""
+    flat = [value for point in points for value in point]
+    return _COUNT.pack(len(points)) + struct.pack(
+        "<{}d".format(len(flat)), *flat)
+
+
+class DrawRecorder:
+    """Create a DrawRecorder to write the draw commands of a
+       RecordingShapeFactory to a compact binary log, which a DrawPlayer can
+       replay without the game that drew them.
+
+    Each command is written as a single byte record type followed by its
+    values packed with struct, with grid points as doubles so a replay
+    draws exactly the same pixels.  The geometry of each grid is written
+    before the first command drawn with it and again whenever it changes,
+    surfaces are written as their size, per pixel alpha flag and bit size,
+    subsurfaces are written as their parent and Rect within it so draws
+    through them reach the parent, and images are written once and then
+    referred to by index.  Records
+    are buffered until the end of each frame and then written, compressed
+    with zlib if required, so logs can be recorded for long sessions without
+    holding them in memory.
+
+    Parameters:
+        file (str or file): The path of the file to write, or a binary file
+                            object opened for writing.
+        compress (bool): (Optional) If True, the log is compressed with zlib
+                         (default = True).
+    """
+
+    def __init__(self, file, compress: bool = True):
+        self._owns_file = isinstance(file, str)
+        self._file = open(file, "wb") if self._owns_file else file
+        self._compressor = zlib.compressobj() if compress else None
+        self._file.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION,
+                                      _COMPRESSED if compress else 0))
+        self._buffer = bytearray()
+        # Grids, surfaces and images are held with their index so their ids
+        # can't be reused by other objects while recording
+        self._grids = {}
+        self._surfaces = {}
+        self._views = {}
+        self._surface_count = 0
+        self._images = {}
+        self._current_grid = None
+        self._frames = 0
+        self._closed = False
+
+    def __repr__(self):
+        return "DrawRecorder(frames={};  grids={}, surfaces={}, " \
+               "images={})".format(self._frames, len(self._grids),
+                                   len(self._surfaces), len(self._images))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def frames(self) -> int:
+        """Returns the number of frames recorded.
+
+        Returns:
+            int: The number of times frame has been called."""
+        return self._frames
+
+    def _geometry_record(self, index: int, grid: GridCalculator) -> bytes:
+        """Returns the record describing the grid provided."""
+        geometry = grid._geometry
+        if isinstance(grid, WeightedGridCalculator):
+            kind = _WEIGHTED
+        elif isinstance(grid, HexGridCalculator):
+            kind = _POINTY_HEX if grid.pointy else _FLAT_HEX
+        elif isinstance(grid, IsometricGridCalculator):
+            kind = _ISOMETRIC
+        else:
+            kind = _PLAIN
+        record = _OPCODE.pack(_GEOMETRY) + _GEOMETRY_VALUES.pack(
+            index, kind, grid.boundary_policy.value, geometry.pixel_end_left,
+            geometry.pixel_end_top, geometry.grid_width_max,
+            geometry.grid_height_max, geometry.pixel_start_left,
+            geometry.pixel_start_top)
+        if kind == _WEIGHTED:
+            for weights, fixed_pixels in (
+                    (grid.column_weights, grid._fixed_column_pixels),
+                    (grid.row_weights, grid._fixed_row_pixels)):
+                record += _COUNT.pack(len(weights)) + struct.pack(
+                    "<{}d".format(len(weights)), *weights)
+                record += _COUNT.pack(len(fixed_pixels)) + b"".join(
+                    _FIXED_PIXELS.pack(cell_index, pixels)
+                    for cell_index, pixels in fixed_pixels.items())
+        return record
+
+    def _use_grid(self, grid: GridCalculator) -> None:
+        """Writes the geometry of the grid if it is new or has changed, or
+        switches to it if another grid was used last."""
+        state = (grid.geometry_version, grid.boundary_policy)
+        entry = self._grids.get(id(grid))
+        if entry is None or entry[0] is not grid:
+            entry = [grid, len(self._grids), None]
+            self._grids[id(grid)] = entry
+        if entry[2] != state:
+            entry[2] = state
+            self._buffer += self._geometry_record(entry[1], grid)
+        elif self._current_grid is not grid:
+            self._buffer += _OPCODE.pack(_USE_GRID) + _INDEX.pack(entry[1])
+        self._current_grid = grid
+
+    def _surface_index(self, surface: pygame.Surface) -> int:
+        """Returns the index of the surface, writing its size and format if
+        it is new or has changed."""
+        parent = surface.get_parent()
+        if parent is not None:
+            return self._view_index(parent, surface)
+        state = (*surface.get_size(), surface.get_flags() & pygame.SRCALPHA,
+                 surface.get_bitsize())
+        entry = self._surfaces.get(id(surface))
+        if entry is None or entry[0] is not surface:
+            entry = [surface, self._surface_count, None]
+            self._surface_count += 1
+            self._surfaces[id(surface)] = entry
+        if entry[2] != state:
+            if entry[2] is not None:
+                self._forget_views(entry[1])
+            entry[2] = state
+            self._buffer += _OPCODE.pack(_SURFACE) + \
+                _SURFACE_VALUES.pack(entry[1], *state)
+        return entry[1]
+
+    def _view_index(self, parent: pygame.Surface,
+                    view: pygame.Surface) -> int:
+        """Returns the index of a subsurface, writing its parent and Rect if
+        no subsurface with the same Rect has been written.  Views are looked
+        up by their Rect rather than held, as new subsurfaces (such as the
+        tiles of a TileRenderer) are often made every frame."""
+        key = (self._surface_index(parent), *view.get_offset(),
+               *view.get_size())
+        index = self._views.get(key)
+        if index is None:
+            index = self._surface_count
+            self._surface_count += 1
+            self._views[key] = index
+            self._buffer += _OPCODE.pack(_VIEW) + _VIEW_VALUES.pack(index,
+                                                                    *key)
+        return index
+
+    def _forget_views(self, parent_index: int) -> None:
+        """Forgets the subsurfaces of a surface that has been replaced, and
+        any subsurfaces of them."""
+        for key in [key for key in self._views if key[0] == parent_index]:
+            self._forget_views(self._views.pop(key))
+
+    def _image_index(self, image: pygame.Surface) -> int:
+        """Returns the index of the image, writing its pixels if it is
+        new."""
+        entry = self._images.get(id(image))
+        if entry is None or entry[0] is not image:
+            entry = (image, len(self._images))
+            self._images[id(image)] = entry
+            self._buffer += _OPCODE.pack(_IMAGE) + _IMAGE_VALUES.pack(
+                entry[1], *image.get_size()) + \
+                pygame.image.tobytes(image, "RGBA")
+        return entry[1]
+
+    def _record(self, grid: GridCalculator | None, surface: pygame.Surface,
+                opcode: int, color, values: bytes) -> None:
+        """Writes a draw command, along with any geometry or surface
+        records it depends on."""
+        if self._closed:
+            raise GridCalculatorException("The recorder has been closed")
+        if grid is not None:
+            self._use_grid(grid)
+        index = self._surface_index(surface)
+        self._buffer += _OPCODE.pack(opcode) + \
+            _COMMAND.pack(index, *pygame.Color(color)) + values
+
+    def frame(self) -> None:
+        """Marks the end of a frame and writes the buffered records."""
+        self._buffer += _OPCODE.pack(_FRAME)
+        self._frames += 1
+        self._write()
+
+    def _write(self) -> None:
+        """Writes the buffered records to the file."""
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        if data:
+            self._file.write(data)
+
+    def close(self) -> None:
+        """Writes any buffered records and closes the log."""
+        if self._closed:
+            return
+        self._write()
+        if self._compressor is not None:
+            self._file.write(self._compressor.flush())
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+        self._closed = True
+        self._grids.clear()
+        self._surfaces.clear()
+        self._views.clear()
+        self._images.clear()
+
+
+class RecordingShapeFactory(ShapeFactory):
+    """Create a RecordingShapeFactory to draw like a ShapeFactory while
+       writing every draw command to a DrawRecorder.
+
+    Grid lines drawn through draw_grid_to_surface and surface fills drawn
+    through fill are also recorded.  Rect and subsurface don't draw, so
+    aren't recorded.  Grids of custom GridCalculator subclasses are recorded
+    as the class they are based on.
+
+    Parameters:
+        grid_calculator (GridCalculator): The grid to draw with.
+        recorder (DrawRecorder): The recorder to write commands to.
+    """
+
+    def __init__(self, grid_calculator: GridCalculator,
+                 recorder: DrawRecorder, image_cache_size: int = 256,
+                 text_cache_size: int = 1024,
+                 subsurface_cache_size: int = 1024):
+        super().__init__(grid_calculator, image_cache_size, text_cache_size,
+                         subsurface_cache_size)
+        self.recorder = recorder
+
+    def fill(self, surface: pygame.Surface, color: tuple) -> pygame.Rect:
+        """Calls Surface.fill to fill the whole surface.
+
+        Parameters:
+            surface (pygame.Surface): The surface to fill.
+            color (tuple): The color value to fill with.
+
+        Returns:
+            pygame.Rect: A pygame.Rect object."""
+        self.recorder._record(None, surface, _FILL, color, b"")
+        return surface.fill(color)
+
+    def draw_grid_to_surface(self, surface: pygame.Surface,
+                             color: tuple = (0, 0, 0),
+                             min_line_spacing: float = 0,
+                             fill_spacing: float = 0) -> None:
+        """Draws the grid to the pygame surface provided.
+
+        Parameters:
+            surface (pygame.Surface): The surface you want to show the grid
+                                      on.
+            color (tuple): (Optional) Set the color of the grid
+                           (default = black (0, 0, 0)).
+            min_line_spacing (float): (Optional) The minimum number of pixels
+                                      between drawn lines (default = 0).
+            fill_spacing (float): (Optional) If the cells are smaller than
+                                  this number of pixels, the grid area is
+                                  filled with the color (default = 0)."""
+        self.recorder._record(self.grid, surface, _GRID, color,
+                              _GRID_VALUES.pack(min_line_spacing,
+                                                fill_spacing))
+        self.grid.draw_grid_to_surface(surface, color, min_line_spacing,
+                                       fill_spacing)
+
+    def blit_image(self, surface: pygame.Surface, image: pygame.Surface,
+                   grid_left: float, grid_top: float, grid_width: float = 1,
+                   grid_height: float = 1, keep_aspect: bool = False,
+                   smooth: bool = True) -> pygame.Rect:
+        """Records the command and calls ShapeFactory.blit_image."""
+        image_index = self.recorder._image_index(image)
+        self.recorder._record(self.grid, surface, _BLIT, (0, 0, 0),
+                              _BLIT_VALUES.pack(image_index, grid_left,
+                                                grid_top, grid_width,
+                                                grid_height, keep_aspect,
+                                                smooth))
+        return super().blit_image(surface, image, grid_left, grid_top,
+                                  grid_width, grid_height, keep_aspect,
+                                  smooth)
+
+    def draw_text(self, surface: pygame.Surface, text: str, color: tuple,
+                  grid_left: float, grid_top: float, grid_width: float = 1,
+                  grid_height: float = 1, font_name: str | None = None,
+                  max_font_size: int = 256, padding: int = 0,
+                  antialias: bool = True) -> pygame.Rect:
+        """Records the command and calls ShapeFactory.draw_text."""
+        self.recorder._record(self.grid, surface, _TEXT, color,
+                              _SPAN.pack(grid_left, grid_top, grid_width,
+                                         grid_height) +
+                              _TEXT_VALUES.pack(max_font_size, padding,
+                                                antialias) +
+                              _pack_string(text) + _pack_string(font_name))
+        return super().draw_text(surface, text, color, grid_left, grid_top,
+                                 grid_width, grid_height, font_name,
+                                 max_font_size, padding, antialias)
+
+    def draw_line(self, surface: pygame.Surface, color: tuple,
+                  grid_start_pos: tuple, grid_end_pos: tuple,
+                  width: int = 1) -> pygame.Rect:
+        """Records the command and calls ShapeFactory.draw_line."""
+        self.recorder._record(self.grid, surface, _LINE, color,
+                              _LINE_VALUES.pack(*grid_start_pos,
+                                                *grid_end_pos, width))
+        return super().draw_line(surface, color, grid_start_pos,
+                                 grid_end_pos, width)
+
+    def draw_lines(self, surface: pygame.Surface, color: tuple, closed: bool,
+                   grid_points: list, width: int = 1) -> pygame.Rect:
+        """Records the command and calls ShapeFactory.draw_lines."""
+        self.recorder._record(self.grid, surface, _LINES, color,
+                              _FLAG_WIDTH.pack(closed, width) +
+                              _pack_points(grid_points))
+        return super().draw_lines(surface, color, closed, grid_points, width)
+
+    def draw_aaline(self, surface: pygame.Surface, color: tuple,
+                    grid_start_pos: tuple, grid_end_pos: tuple,
+                    blend: int = 1) -> pygame.Rect:
+        """Records the command and calls ShapeFactory.draw_aaline."""
+        self.recorder._record(self.grid, surface, _AALINE, color,
+                              _LINE_VALUES.pack(*grid_start_pos,
+                                                *grid_end_pos, blend))
+        return super().draw_aaline(surface, color, grid_start_pos,
+                                   grid_end_pos, blend)
+
+    def draw_aalines(self, surface: pygame.Surface, color: tuple, closed: bool,
+                     grid_points: list, blend: int = 1):
+        """Records the command and calls ShapeFactory.draw_aalines."""
+        self.recorder._record(self.grid, surface, _AALINES, color,
+                              _FLAG_WIDTH.pack(closed, blend) +
+                              _pack_points(grid_points))
+        return super().draw_aalines(surface, color, closed, grid_points,
+                                    blend)
+
+    def draw_polygon(self, surface: pygame.Surface, color: tuple,
+                     grid_points: list, width: int = 0) -> pygame.Rect:
+        """Records the command and calls ShapeFactory.draw_polygon."""
+        self.recorder._record(self.grid, surface, _POLYGON, color,
+                              _FLAG_WIDTH.pack(0, width) +
+                              _pack_points(grid_points))
+        return super().draw_polygon(surface, color, grid_points, width)
+
+    def draw_cell(self, surface: pygame.Surface, color: tuple,
+                  grid_left: int, grid_top: int,
+                  width: int = 0) -> pygame.Rect:
+        """Records the command and calls ShapeFactory.draw_cell."""
+        self.recorder._record(self.grid, surface, _CELL, color,
+                              _CELL_VALUES.pack(grid_left, grid_top, width))
+        return super().draw_cell(surface, color, grid_left, grid_top, width)
+
+    def draw_circle(self, surface: pygame.Surface, color: tuple,
+                    grid_center: tuple, radius: float, width: int = 0,
+                    draw_top_right: bool = True, draw_top_left: bool = True,
+                    draw_bottom_left: bool = True,
+                    draw_bottom_right: bool = True) -> pygame.Rect:
+        """Records the command and calls ShapeFactory.draw_circle."""
+        quadrants = draw_top_right | draw_top_left << 1 | \
+            draw_bottom_left << 2 | draw_bottom_right << 3
+        self.recorder._record(self.grid, surface, _CIRCLE, color,
+                              _CIRCLE_VALUES.pack(*grid_center, radius,
+                                                  width, quadrants))
+        return super().draw_circle(surface, color, grid_center, radius,
+                                   width, draw_top_right, draw_top_left,
+                                   draw_bottom_left, draw_bottom_right)
+
+
+class DrawPlayer:
+    """Create a DrawPlayer to replay a log written by a DrawRecorder on to
+       new surfaces without a display, as fast as possible.
+
+    The log is read and decompressed in chunks, so long logs aren't held in
+    memory.  Grids are rebuilt from their recorded geometry and commands are
+    drawn with a ShapeFactory, so the surfaces end each frame with the same
+    pixels as when they were recorded.
+
+    Parameters:
+        file (str or file): The path of the log to read, or a binary file
+                            object opened for reading.
+        chunk_size (int): (Optional) The number of bytes read from the file
+                          at a time (default = 65536).
+    """
+
+    def __init__(self, file, chunk_size: int = 65536):
+        self._owns_file = isinstance(file, str)
+        self._file = open(file, "rb") if self._owns_file else file
+        self._chunk_size = chunk_size
+        header = self._file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise GridCalculatorException("The log is too short to be a draw "
+                                          "log")
+        magic, version, flags = _HEADER.unpack(header)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise GridCalculatorException("The file isn't a draw log this "
+                                          "version can read")
+        self._decompressor = zlib.decompressobj() \
+            if flags & _COMPRESSED else None
+        self._buffer = bytearray()
+        self._position = 0
+        self._grids = []
+        self._shape_factories = []
+        self._grid_index = None
+        self._surfaces = []
+        self._images = []
+        self._frames = 0
+
+    def __repr__(self):
+        return "DrawPlayer(frames={};  grids={}, surfaces={})".format(
+            self._frames, len(self._grids), len(self._surfaces))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def frames(self) -> int:
+        """Returns the number of frames replayed.
+
+        Returns:
+            int: The number of frames replayed so far."""
+        return self._frames
+
+    @property
+    def surfaces(self) -> list:
+        """Returns the surfaces being drawn on, in the order they were first
+        drawn on when recorded.  Subsurfaces are included and share pixels
+        with their parent, as when they were recorded.
+
+        Returns:
+            list: The pygame.Surface objects of the replay."""
+        return list(self._surfaces)
+
+    @property
+    def grid(self) -> GridCalculator | None:
+        """Returns the grid the last command was drawn with.
+
+        Returns:
+            GridCalculator: The current grid, or None before any grid has
+                            been replayed."""
+        return None if self._grid_index is None \
+            else self._grids[self._grid_index]
+
+    def _fill_buffer(self, size: int) -> bool:
+        """Reads from the file until size bytes are buffered, returning
+        False if the log ends first."""
+        while len(self._buffer) - self._position < size:
+            chunk = self._file.read(self._chunk_size)
+            if not chunk:
+                if self._decompressor is None:
+                    return False
+                chunk = self._decompressor.flush()
+                self._decompressor = None
+                if not chunk:
+                    return False
+            elif self._decompressor is not None:
+                chunk = self._decompressor.decompress(chunk)
+            del self._buffer[:self._position]
+            self._position = 0
+            self._buffer += chunk
+        return True
+
+    def _read(self, size: int) -> bytes:
+        """Returns the next size bytes of the log."""
+        if not self._fill_buffer(size):
+            raise GridCalculatorException("The draw log ended part way "
+                                          "through a record")
+        data = bytes(self._buffer[self._position:self._position + size])
+        self._position += size
+        return data
+
+    def _unpack(self, values: struct.Struct) -> tuple:
+        """Reads and unpacks the next values of the log."""
+        return values.unpack(self._read(values.size))
+
+    def _read_points(self) -> list:
+        """Reads a list of grid points."""
+        count, = self._unpack(_COUNT)
+        flat = struct.unpack("<{}d".format(2 * count),
+                             self._read(16 * count))
+        return list(zip(flat[::2], flat[1::2]))
+
+    def _read_string(self) -> str | None:
+        """Reads a string, or None."""
+        length, = self._unpack(_COUNT)
+        if length == _NO_STRING:
+            return None
+        return self._read(length).decode("utf-8")
+
+    def _read_geometry(self) -> None:
+        """Reads a geometry record and rebuilds the grid it describes."""
+        index, kind, policy, end_left, end_top, width, height, start_left, \
+            start_top = self._unpack(_GEOMETRY_VALUES)
+        policy = BoundaryPolicy(policy)
+        if kind == _WEIGHTED:
+            sizes = []
+            for _ in range(2):
+                count, = self._unpack(_COUNT)
+                weights = list(struct.unpack("<{}d".format(count),
+                                             self._read(8 * count)))
+                count, = self._unpack(_COUNT)
+                fixed_pixels = dict(self._unpack(_FIXED_PIXELS)
+                                    for _ in range(count))
+                sizes.append((weights, fixed_pixels))
+            (column_weights, fixed_columns), (row_weights, fixed_rows) = \
+                sizes
+            grid = WeightedGridCalculator(end_left, end_top, column_weights,
+                                          row_weights, start_left, start_top,
+                                          fixed_columns, fixed_rows, policy)
+        elif kind in (_POINTY_HEX, _FLAT_HEX):
+            grid = HexGridCalculator(end_left, end_top, width, height,
+                                     start_left, start_top,
+                                     kind == _POINTY_HEX, policy)
+        elif kind == _ISOMETRIC:
+            grid = IsometricGridCalculator(end_left, end_top, width, height,
+                                           start_left, start_top, policy)
+        else:
+            grid = GridCalculator(end_left, end_top, width, height,
+                                  start_left, start_top, policy)
+        if index == len(self._grids):
+            self._grids.append(grid)
+            self._shape_factories.append(ShapeFactory(grid))
+        else:
+            self._grids[index] = grid
+            self._shape_factories[index] = ShapeFactory(grid)
+        self._grid_index = index
+
+    def _read_surface(self) -> None:
+        """Reads a surface record and creates the surface, or replaces it
+        keeping its pixels if it has been resized."""
+        index, width, height, flags, bit_size = \
+            self._unpack(_SURFACE_VALUES)
+        surface = pygame.Surface((width, height), flags, bit_size)
+        if index == len(self._surfaces):
+            self._surfaces.append(surface)
+        else:
+            # Taking the max with the new, empty surface copies the pixels
+            # and alpha rather than blending them
+            surface.blit(self._surfaces[index], (0, 0),
+                         special_flags=pygame.BLEND_RGBA_MAX)
+            self._surfaces[index] = surface
+
+    def _read_view(self) -> None:
+        """Reads a subsurface record and creates the subsurface of its
+        parent."""
+        # Subsurfaces are always given a new index, so the index is the
+        # next in the list
+        _, parent_index, left, top, width, height = \
+            self._unpack(_VIEW_VALUES)
+        self._surfaces.append(self._surfaces[parent_index].subsurface(
+            (left, top, width, height)))
+
+    def _read_image(self) -> None:
+        """Reads an image record."""
+        index, width, height = self._unpack(_IMAGE_VALUES)
+        image = pygame.image.frombytes(self._read(width * height * 4),
+                                       (width, height), "RGBA")
+        self._images.append(image)
+
+    def _shape_factory(self) -> ShapeFactory:
+        """Returns the ShapeFactory of the current grid."""
+        return self._shape_factories[self._grid_index]
+
+    def _draw_fill(self, surface: pygame.Surface, color: list) -> None:
+        """Replays a surface fill."""
+        surface.fill(color)
+
+    def _draw_grid(self, surface: pygame.Surface, color: list) -> None:
+        """Replays drawing the grid lines."""
+        self._shape_factory().grid.draw_grid_to_surface(
+            surface, color, *self._unpack(_GRID_VALUES))
+
+    def _draw_line(self, surface: pygame.Surface, color: list,
+                   antialias: bool = False) -> None:
+        """Replays a line or antialiased line."""
+        start_left, start_top, end_left, end_top, width = \
+            self._unpack(_LINE_VALUES)
+        shape_factory = self._shape_factory()
+        draw = shape_factory.draw_aaline if antialias \
+            else shape_factory.draw_line
+        draw(surface, color, (start_left, start_top), (end_left, end_top),
+             width)
+
+    def _draw_aaline(self, surface: pygame.Surface, color: list) -> None:
+        """Replays an antialiased line."""
+        self._draw_line(surface, color, True)
+
+    def _draw_lines(self, surface: pygame.Surface, color: list,
+                    antialias: bool = False) -> None:
+        """Replays a list of lines or antialiased lines."""
+        closed, width = self._unpack(_FLAG_WIDTH)
+        shape_factory = self._shape_factory()
+        draw = shape_factory.draw_aalines if antialias \
+            else shape_factory.draw_lines
+        draw(surface, color, bool(closed), self._read_points(), width)
+
+    def _draw_aalines(self, surface: pygame.Surface, color: list) -> None:
+        """Replays a list of antialiased lines."""
+        self._draw_lines(surface, color, True)
+
+    def _draw_polygon(self, surface: pygame.Surface, color: list) -> None:
+        """Replays a polygon."""
+        _, width = self._unpack(_FLAG_WIDTH)
+        self._shape_factory().draw_polygon(surface, color,
+                                           self._read_points(), width)
+
+    def _draw_cell(self, surface: pygame.Surface, color: list) -> None:
+        """Replays a single grid cell."""
+        self._shape_factory().draw_cell(surface, color,
+                                        *self._unpack(_CELL_VALUES))
+
+    def _draw_circle(self, surface: pygame.Surface, color: list) -> None:
+        """Replays a circle, with each drawn quadrant as a bit."""
+        center_left, center_top, radius, width, quadrants = \
+            self._unpack(_CIRCLE_VALUES)
+        self._shape_factory().draw_circle(
+            surface, color, (center_left, center_top), radius, width,
+            *(bool(quadrants & 1 << bit) for bit in range(4)))
+
+    def _draw_text(self, surface: pygame.Surface, color: list) -> None:
+        """Replays text fitted to a grid span."""
+        if not pygame.font.get_init():
+            pygame.font.init()
+        span = self._unpack(_SPAN)
+        max_font_size, padding, antialias = self._unpack(_TEXT_VALUES)
+        text, font_name = self._read_string(), self._read_string()
+        self._shape_factory().draw_text(surface, text, color, *span,
+                                        font_name, max_font_size, padding,
+                                        bool(antialias))
+
+    def _draw_blit(self, surface: pygame.Surface, color: list) -> None:
+        """Replays an image scaled to a grid span."""
+        image_index, *span, keep_aspect, smooth = self._unpack(_BLIT_VALUES)
+        self._shape_factory().blit_image(surface, self._images[image_index],
+                                         *span, bool(keep_aspect),
+                                         bool(smooth))
+
+    # The method replaying each draw command, by record type
+    _DRAW_HANDLERS = {_FILL: _draw_fill, _GRID: _draw_grid,
+                      _LINE: _draw_line, _AALINE: _draw_aaline,
+                      _LINES: _draw_lines, _AALINES: _draw_aalines,
+                      _POLYGON: _draw_polygon, _CELL: _draw_cell,
+                      _CIRCLE: _draw_circle, _TEXT: _draw_text,
+                      _BLIT: _draw_blit}
+
+    def _draw(self, opcode: int) -> None:
+        """Reads and draws a single draw command."""
+        handler = self._DRAW_HANDLERS.get(opcode)
+        if handler is None:
+            raise GridCalculatorException("The draw log has an unknown "
+                                          "record type ({})".format(opcode))
+        index, *color = self._unpack(_COMMAND)
+        handler(self, self._surfaces[index], color)
+
+    def play(self, on_frame=None, max_frames: int | None = None) -> int:
+        """Replays frames until the end of the log.
+
+        Parameters:
+            on_frame (callable): (Optional) Called with the frame index and
+                                 the list of surfaces at the end of each
+                                 frame (default = None).
+            max_frames (int): (Optional) The most frames to replay before
+                              returning (default = None, every frame).
+
+        Returns:
+            int: The number of frames replayed by this call."""
+        played = 0
+        while max_frames is None or played < max_frames:
+            if not self._fill_buffer(_OPCODE.size):
+                break
+            opcode, = self._unpack(_OPCODE)
+            if opcode == _FRAME:
+                if on_frame is not None:
+                    on_frame(self._frames, self._surfaces)
+                self._frames += 1
+                played += 1
+            elif opcode == _GEOMETRY:
+                self._read_geometry()
+            elif opcode == _USE_GRID:
+                self._grid_index, = self._unpack(_INDEX)
+            elif opcode == _SURFACE:
+                self._read_surface()
+            elif opcode == _VIEW:
+                self._read_view()
+            elif opcode == _IMAGE:
+                self._read_image()
+            else:
+                self._draw(opcode)
+        return played
+
+    def close(self) -> None:
+        """Closes the log."""
+        if self._owns_file:
+            self._file.close()
@@ -0,0 +1,219 @@
+import numpy
+import pygame
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+
+
+class Regions:
+    """The connected regions found by a RegionLabeler.
+
+    Parameters:
+        grid (GridCalculator): The grid the regions are in.
+        labels (numpy.ndarray): The region label for each cell indexed as
+                                [left, top], from 1 to count with 0 for
+                                background cells.
+        count (int): The number of regions.
+    """
+
+    def __init__(self, grid: GridCalculator, labels: numpy.ndarray,
+                 count: int):
+        self.grid = grid
+        self.labels = labels
+        self.count = count
+        self._bounds = None
+
+    def __repr__(self):
+        return "Regions(count={})".format(self.count)
+
+    @property
+    def sizes(self) -> numpy.ndarray:
+        """Returns the number of cells in each region.
+
+        Returns:
+            numpy.ndarray: The cell count for each label, indexed by label
+                           with the background count at index 0."""
+        return numpy.bincount(self.labels.ravel(), minlength=self.count + 1)
+
+    @property
+    def bounds(self) -> numpy.ndarray:
+        """Returns the bounding box of each region in grid cells.  Regions
+        joined across a wrapped border span the full width or height.
+
+        Returns:
+            numpy.ndarray: The (left, top, width, height) of each region,
+                           indexed by label - 1."""
+        if self._bounds is None:
+            labels = self.labels.ravel()
+            lefts, tops = numpy.indices(self.labels.shape).reshape(2, -1)
+            minimums = numpy.full((2, self.count + 1), numpy.iinfo(
+                numpy.intp).max, dtype=numpy.intp)
+            maximums = numpy.full((2, self.count + 1), -1, dtype=numpy.intp)
+            for axis, positions in enumerate((lefts, tops)):
+                numpy.minimum.at(minimums[axis], labels, positions)
+                numpy.maximum.at(maximums[axis], labels, positions)
+            self._bounds = numpy.stack([
+                minimums[0], minimums[1], maximums[0] - minimums[0] + 1,
+                maximums[1] - minimums[1] + 1], axis=1)[1:]
+        return self._bounds
+
+    def rect(self, label: int) -> pygame.Rect:
+        """Returns the pixel Rect covering a region.
+
+        Parameters:
+            label (int): The label of the region (1 to count).
+
+        Returns:
+            pygame.Rect: A pygame.Rect object."""
+        if not 1 <= label <= self.count:
+            raise GridCalculatorException(
+                "The label provided ({}) isn't a region (1 - {})".format(
+                    label, self.count))
+        left, top, width, height = self.bounds[label - 1].tolist()
+        return pygame.Rect(self.grid.position(left, top),
+                           self.grid.square(left, top, left + width,
+                                            top + height))
+
+    def rects(self) -> list:
+        """Returns the pixel Rects covering every region.
+
+        Returns:
+            list: The pygame.Rect objects, indexed by label - 1."""
+        return [self.rect(label) for label in range(1, self.count + 1)]
+
+
+class RegionLabeler:
+    """Create a RegionLabeler to find connected regions of equal values in
+       per-cell data for a GridCalculator.
+
+    Parameters:
+        grid (GridCalculator): The grid the data is for.
+        connectivity (int): (Optional) 4 to connect cells through their
+                            sides, or 8 to also connect them through their
+                            corners (default = 4).
+        wrap (bool): (Optional) If True, cells on opposite borders of the
+                     grid are connected (default = False).
+    """
+
+    def __init__(self, grid: GridCalculator, connectivity: int = 4,
+                 wrap: bool = False):
+        if connectivity not in (4, 8):
+            raise GridCalculatorException("The connectivity provided ({}) "
+                                          "must be 4 or 8".format(
+                                            connectivity))
+        self.grid = grid
+        self._connectivity = connectivity
+        self._wrap = wrap
+
+    def __repr__(self):
+        return "RegionLabeler(connectivity={}, wrap={})".format(
+            self._connectivity, self._wrap)
+
+    def _check_data(self, data: numpy.ndarray) -> numpy.ndarray:
+        """Checks the data matches the grid size."""
+        data = numpy.asarray(data)
+        if data.shape != self.grid.size:
+            raise GridCalculatorException(
+                "The data shape ({}) must match the grid size ({})".format(
+                    data.shape, self.grid.size))
+        return data
+
+    def _links(self, data: numpy.ndarray, foreground: numpy.ndarray) -> tuple:
+        """Returns the flat indexes of every pair of neighbouring foreground
+        cells with equal values."""
+        offsets = [(1, 0), (0, 1)]
+        if self._connectivity == 8:
+            offsets += [(1, 1), (1, -1)]
+        indexes = numpy.arange(data.size).reshape(data.shape)
+        width, height = data.shape
+        firsts, seconds = [], []
+        for left, top in offsets:
+            if self._wrap:
+                first = (slice(None), slice(None))
+                second_indexes = numpy.roll(indexes, (-left, -top),
+                                            axis=(0, 1))
+                second_data = numpy.roll(data, (-left, -top), axis=(0, 1))
+                second_foreground = numpy.roll(foreground, (-left, -top),
+                                               axis=(0, 1))
+            else:
+                first = (slice(0, width - left),
+                         slice(max(-top, 0), height - max(top, 0)))
+                second = (slice(left, width),
+                          slice(max(top, 0), height + min(top, 0)))
+                second_indexes = indexes[second]
+                second_data = data[second]
+                second_foreground = foreground[second]
+            linked = foreground[first] & second_foreground & \
+                (data[first] == second_data)
+            firsts.append(indexes[first][linked])
+            seconds.append(second_indexes[linked])
+        return numpy.concatenate(firsts), numpy.concatenate(seconds)
+
+    @staticmethod
+    def _roots(size: int, firsts: numpy.ndarray,
+               seconds: numpy.ndarray) -> numpy.ndarray:
+        """Returns the root cell of each cell's region, using a vectorised
+        union-find where each region's root is its lowest flat index."""
+        parents = numpy.arange(size)
+        while True:
+            first_roots, second_roots = parents[firsts], parents[seconds]
+            unjoined = first_roots != second_roots
+            if not unjoined.any():
+                return parents
+            # Links between cells already in the same region stay joined, so
+            # only the unjoined links are checked on the next pass
+            firsts, seconds = firsts[unjoined], seconds[unjoined]
+            first_roots = first_roots[unjoined]
+            second_roots = second_roots[unjoined]
+            numpy.minimum.at(parents, numpy.maximum(first_roots,
+                                                    second_roots),
+                             numpy.minimum(first_roots, second_roots))
+            while True:
+                grandparents = parents[parents]
+                if (grandparents == parents).all():
+                    break
+                parents = grandparents
+
+    def label(self, data: numpy.ndarray, background=0) -> Regions:
+        """Labels the connected regions of cells with equal values.
+
+        Parameters:
+            data (numpy.ndarray): The per-cell data indexed as [left, top].
+            background (any): (Optional) The value of cells that aren't part
+                              of any region, or None for every cell to be
+                              part of a region (default = 0).
+
+        Returns:
+            Regions: The regions found."""
+        data = self._check_data(data)
+        foreground = numpy.ones(data.shape, dtype=bool) if background is \
+            None else data != background
+        roots = self._roots(data.size, *self._links(data, foreground))
+        labels = numpy.zeros(data.size, dtype=numpy.intp)
+        unique_roots, region_labels = numpy.unique(
+            roots[foreground.ravel()], return_inverse=True)
+        labels[foreground.ravel()] = region_labels + 1
+        return Regions(self.grid, labels.reshape(data.shape),
+                       len(unique_roots))
+
+    def flood_fill(self, data: numpy.ndarray, left: int,
+                   top: int) -> numpy.ndarray:
+        """Returns the cells connected to a cell with the same value.
+
+        Parameters:
+            data (numpy.ndarray): The per-cell data indexed as [left, top].
+            left (int): The left grid point of the cell to fill from.
+            top (int): The top grid point of the cell to fill from.
+
+        Returns:
+            numpy.ndarray: A boolean mask of the filled cells indexed as
+                           [left, top]."""
+        data = self._check_data(data)
+        width, height = data.shape
+        if not (0 <= left < width and 0 <= top < height):
+            raise GridCalculatorException(
+                "The cell provided (({}, {})) isn't in the grid (0 - {}, "
+                "0 - {})".format(left, top, width - 1, height - 1))
+        labels = self.label(data == data[left, top], background=False).labels
+        return labels == labels[left, top]
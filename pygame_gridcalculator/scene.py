@@ -0,0 +1,221 @@
+import pygame
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+from pygame_gridcalculator.shapefactory import ShapeFactory
+
+
+class Scene:
+    """Create a Scene to record grid-based drawing once and draw it at any
+       resolution.
+
+    A Scene holds the size of its grid and a list of draw commands in grid
+    points, mirroring the ShapeFactory draw methods.  It holds no surfaces,
+    so it can be pickled and sent to other processes to be drawn.  Circle
+    radii are in grid points so circles scale with the output, while line
+    widths stay in pixels.
+
+    Parameters:
+        grid_width_max (int): The max width point of the grid (right border).
+        grid_height_max (int): The max height point of the grid (bottom
+                               border).
+        background (tuple): (Optional) The color the surface is filled with
+                            before drawing (default = None, no fill).
+    """
+
+    def __init__(self, grid_width_max: int, grid_height_max: int,
+                 background: tuple | None = None):
+        if grid_width_max < 1 or grid_height_max < 1:
+            raise GridCalculatorException("The scene grid size must be "
+                                          "greater than 0")
+        self._grid_size = (grid_width_max, grid_height_max)
+        self.background = background
+        self._commands = []
+
+    def __repr__(self):
+        return "Scene(grid: width={}, height={};  commands={})".format(
+            *self._grid_size, len(self._commands))
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    @property
+    def size(self) -> tuple:
+        """Returns the size of the scene's grid.
+
+        Returns:
+            tuple: The size of the grid (width, height)."""
+        return self._grid_size
+
+    @property
+    def commands(self) -> list:
+        """Returns the recorded draw commands.
+
+        Returns:
+            list: The (method name, arguments) of each command in the order
+                  they are drawn."""
+        return list(self._commands)
+
+    def _record(self, name: str, *arguments) -> None:
+        """Adds a draw command."""
+        self._commands.append((name, arguments))
+
+    def clear(self) -> None:
+        """Removes every draw command."""
+        self._commands.clear()
+
+    def draw_grid(self, color: tuple = (0, 0, 0)) -> None:
+        """Records drawing the grid lines.
+
+        Parameters:
+            color (tuple): (Optional) The color of the grid
+                           (default = black (0, 0, 0))."""
+        self._record("draw_grid", color)
+
+    def draw_rect(self, color: tuple, grid_left: float, grid_top: float,
+                  grid_width: float, grid_height: float,
+                  width: int = 0) -> None:
+        """Records drawing a pygame.draw.rect covering a span of grid points.
+
+        Parameters:
+            color (tuple): The color value for the rect.
+            grid_left (float): The left grid point of the rect.
+            grid_top (float): The top grid point of the rect.
+            grid_width (float): The number of grid points the rect covers
+                                from left to right.
+            grid_height (float): The number of grid points the rect covers
+                                 from top to bottom.
+            width (int): (Optional) The width of the line in pixels
+                         (default = 0, filled)."""
+        self._record("draw_rect", color, grid_left, grid_top, grid_width,
+                     grid_height, width)
+
+    def draw_line(self, color: tuple, grid_start_pos: tuple,
+                  grid_end_pos: tuple, width: int = 1) -> None:
+        """Records drawing a pygame.draw.line between grid points.
+
+        Parameters:
+            color (tuple): The color value for the line.
+            grid_start_pos (tuple): The start point in grid positions
+                                    (grid_left, grid_top).
+            grid_end_pos (tuple): The end point in grid positions
+                                  (grid_left, grid_top).
+            width (int): (Optional) The width of the line in pixels
+                         (default = 1)."""
+        self._record("draw_line", color, tuple(grid_start_pos),
+                     tuple(grid_end_pos), width)
+
+    def draw_lines(self, color: tuple, closed: bool, grid_points: list,
+                   width: int = 1) -> None:
+        """Records drawing a pygame.draw.lines between grid points.
+
+        Parameters:
+            color (tuple): The color value for the lines.
+            closed (bool): If True, an additional line is drawn between the
+                           first and last points.
+            grid_points (list): The list of points in grid positions
+                                (grid_left, grid_top).
+            width (int): (Optional) The width of the lines in pixels
+                         (default = 1)."""
+        self._record("draw_lines", color, closed,
+                     [tuple(point) for point in grid_points], width)
+
+    def draw_polygon(self, color: tuple, grid_points: list,
+                     width: int = 0) -> None:
+        """Records drawing a pygame.draw.polygon between grid points.
+
+        Parameters:
+            color (tuple): The color value for the polygon.
+            grid_points (list): A list of grid points in the format
+                                (grid_left, grid_top).
+            width (int): (Optional) The width of the line in pixels
+                         (default = 0, filled)."""
+        self._record("draw_polygon", color,
+                     [tuple(point) for point in grid_points], width)
+
+    def draw_circle(self, color: tuple, grid_center: tuple, radius: float,
+                    width: int = 0) -> None:
+        """Records drawing a pygame.draw.circle around a grid point.
+
+        Parameters:
+            color (tuple): The color value for the circle.
+            grid_center (tuple): The center point in grid positions
+                                 (grid_left, grid_top).
+            radius (float): The radius of the circle in grid points, scaled
+                            by the width of a cell.
+            width (int): (Optional) The width of the line in pixels
+                         (default = 0, filled)."""
+        self._record("draw_circle", color, tuple(grid_center), radius, width)
+
+    def draw_text(self, text: str, color: tuple, grid_left: float,
+                  grid_top: float, grid_width: float = 1,
+                  grid_height: float = 1, font_name: str | None = None,
+                  padding: int = 0) -> None:
+        """Records drawing text centred in a span of grid cells at the
+        largest font size that fits.
+
+        Parameters:
+            text (str): The text to draw.
+            color (tuple): The color value for the text.
+            grid_left (float): The left grid point of the span.
+            grid_top (float): The top grid point of the span.
+            grid_width (float): (Optional) The number of grid points the span
+                                covers from left to right (default = 1).
+            grid_height (float): (Optional) The number of grid points the
+                                 span covers from top to bottom
+                                 (default = 1).
+            font_name (str): (Optional) The font file to use
+                             (default = None, the pygame default font).
+            padding (int): (Optional) The pixels to leave around the text
+                           (default = 0)."""
+        self._record("draw_text", text, color, grid_left, grid_top,
+                     grid_width, grid_height, font_name, padding)
+
+    def render(self, surface: pygame.Surface,
+               grid: GridCalculator | None = None) -> GridCalculator:
+        """Draws every command on to the surface.
+
+        Parameters:
+            surface (pygame.Surface): The surface to draw the scene on.
+            grid (GridCalculator): (Optional) The grid to draw with, which
+                                   must be the same size as the scene's grid
+                                   (default = None, a grid covering the
+                                   whole surface).
+
+        Returns:
+            GridCalculator: The grid the scene was drawn with."""
+        if grid is None:
+            grid = GridCalculator(surface.get_width() - 1,
+                                  surface.get_height() - 1, *self._grid_size)
+        elif grid.size != self._grid_size:
+            raise GridCalculatorException(
+                "The grid size ({}) must match the scene size ({})".format(
+                    grid.size, self._grid_size))
+        shape_factory = ShapeFactory(grid)
+        cell_width = grid.pixel_size[0] / self._grid_size[0]
+        if self.background is not None:
+            surface.fill(self.background)
+        for name, arguments in self._commands:
+            if name == "draw_grid":
+                grid.draw_grid_to_surface(surface, *arguments)
+            elif name == "draw_rect":
+                color, grid_left, grid_top, grid_width, grid_height, \
+                    width = arguments
+                pygame.draw.rect(surface, color, (
+                    grid.position(grid_left, grid_top),
+                    grid.square(grid_left, grid_top, grid_left + grid_width,
+                                grid_top + grid_height)), width)
+            elif name == "draw_circle":
+                color, grid_center, radius, width = arguments
+                shape_factory.draw_circle(surface, color, grid_center,
+                                          max(radius * cell_width, 1), width)
+            elif name == "draw_text":
+                text, color, grid_left, grid_top, grid_width, grid_height, \
+                    font_name, padding = arguments
+                shape_factory.draw_text(surface, text, color, grid_left,
+                                        grid_top, grid_width, grid_height,
+                                        font_name, padding=padding)
+            else:
+                getattr(shape_factory, name)(surface, *arguments)
+        return grid
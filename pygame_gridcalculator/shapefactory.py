@@ -1,22 +1,128 @@
 import pygame
-from pygame_gridcalculator.gridcalculator import GridCalculator
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+from pygame_gridcalculator.lrucache import LRUCache
 
 
 class ShapeFactory:
-    def __init__(self, grid_calculator: GridCalculator):
+    def __init__(self, grid_calculator: GridCalculator,
+                 image_cache_size: int = 256, text_cache_size: int = 1024,
+                 subsurface_cache_size: int = 1024):
         self.grid = grid_calculator
+        self._cached_geometry = (grid_calculator,
+                                 grid_calculator.geometry_version)
+        self._image_cache = LRUCache(image_cache_size)
+        self._text_cache = LRUCache(text_cache_size)
+        self._font_size_cache = LRUCache(text_cache_size)
+        self._font_cache = LRUCache(64)
+        self._subsurface_cache = LRUCache(subsurface_cache_size)
+
+    def _check_geometry(self) -> None:
+        """Clears any cached pixel data if the grid has been updated or
+        replaced since the data was cached."""
+        cached_grid, cached_version = self._cached_geometry
+        if cached_grid is not self.grid or \
+                cached_version != self.grid.geometry_version:
+            self._image_cache.clear()
+            self._text_cache.clear()
+            self._font_size_cache.clear()
+            self._subsurface_cache.clear()
+            self._cached_geometry = (self.grid, self.grid.geometry_version)
+
+    def _grid_span_rect(self, grid_left: float, grid_top: float,
+                        grid_width: float, grid_height: float) -> pygame.Rect:
+        """Takes a grid position and span and returns the pixel Rect
+        covering it, with both corners read from the same geometry."""
+        grid = self.grid
+        geometry = grid._geometry
+        left, top = grid._position(grid_left, grid_top, geometry)
+        right, bottom = grid._position(grid_left + grid_width,
+                                       grid_top + grid_height, geometry)
+        if right < left or bottom < top:
+            raise GridCalculatorException(
+                "The span ({}, {}) of grid points from ({}, {}) must not end "
+                "before it starts".format(grid_width, grid_height, grid_left,
+                                          grid_top))
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def _scaled_image(self, image: pygame.Surface, size: tuple,
+                      smooth: bool) -> pygame.Surface:
+        """Returns a copy of the image scaled to the size provided, reusing
+        a previously scaled copy where possible."""
+        key = (id(image), size, smooth)
+        cached = self._image_cache.get(key)
+        # The source image is held with the scaled copy so its id can't be
+        # reused by another image while the entry is cached
+        if cached is not None and cached[0] is image:
+            return cached[1]
+        if image.get_size() == size:
+            scaled = image
+        elif smooth and image.get_bitsize() in (24, 32):
+            scaled = pygame.transform.smoothscale(image, size)
+        else:
+            scaled = pygame.transform.scale(image, size)
+        self._image_cache.put(key, (image, scaled))
+        return scaled
 
     def _convert_grid_tuple(self, grid_tuple: tuple) -> tuple:
         """Takes the grid tuple and returns a pixel tuple."""
         left_grid, top_grid = grid_tuple
-        return self.grid.left_point(left_grid), self.grid.top_point(top_grid)
+        return self.grid.position(left_grid, top_grid)
 
     def _convert_grid_list(self, grid_list: list) -> list:
-        """Takes a list of grid tuples and returns a list of pixel tuples."""
-        points = []
-        for grid_point in grid_list:
-            points.append(self._convert_grid_tuple(grid_point))
-        return points
+        """Takes a list of grid tuples and returns a list of pixel tuples,
+        with every point read from the same geometry."""
+        grid = self.grid
+        geometry = grid._geometry
+        return [grid._position(left_grid, top_grid, geometry)
+                for left_grid, top_grid in grid_list]
+
+    def _font(self, font_name: str | None, size: int) -> pygame.font.Font:
+        """Returns the font at the size provided, reusing previously loaded
+        fonts where possible."""
+        key = (font_name, size)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = pygame.font.Font(font_name, size)
+            self._font_cache.put(key, font)
+        return font
+
+    def _fitted_font_size(self, font_name: str | None, text: str,
+                          size: tuple, max_font_size: int) -> int:
+        """Returns the largest font size where the text fits within the
+        pixel size provided, reusing the previous result for the same size."""
+        key = (font_name, text, size, max_font_size)
+        font_size = self._font_size_cache.get(key)
+        if font_size is None:
+            width, height = size
+            low, high = 1, max(1, min(max_font_size, height))
+            while low < high:
+                middle = (low + high + 1) // 2
+                text_width, text_height = self._font(font_name,
+                                                     middle).size(text)
+                if text_width <= width and text_height <= height:
+                    low = middle
+                else:
+                    high = middle - 1
+            font_size = low
+            self._font_size_cache.put(key, font_size)
+        return font_size
+
+    def _rendered_text(self, font_name: str | None, font_size: int,
+                       text: str, color: tuple,
+                       antialias: bool) -> pygame.Surface:
+        """Returns the text rendered with the font provided, reusing a
+        previously rendered surface where possible."""
+        key = (font_name, font_size, text, tuple(color), antialias)
+        rendered = self._text_cache.get(key)
+        if rendered is None:
+            rendered = self._font(font_name, font_size).render(text,
+                                                               antialias,
+                                                               color)
+            self._text_cache.put(key, rendered)
+        return rendered
 
     # pygame.Rect shapes
 
@@ -32,9 +138,138 @@ class ShapeFactory:
 
         Returns:
             pygame.Rect: A pygame Rect object."""
-        return pygame.Rect(self.grid.left_point(grid_left),
-                           self.grid.top_point(grid_top),
-                           width, height)
+        return pygame.Rect(self.grid.position(grid_left, grid_top),
+                           (width, height))
+
+    # pygame.Surface views
+
+    def subsurface(self, surface: pygame.Surface, grid_left: float,
+                   grid_top: float, grid_width: float = 1,
+                   grid_height: float = 1) -> pygame.Surface:
+        """Returns a subsurface sharing pixels with the surface provided for
+        the grid cell or cell span provided, so it can be drawn on using local
+        co-ordinates.  The view is clipped to the surface, and a span wholly
+        outside the surface gives a 0 by 0 view at the nearest edge of the
+        surface, which drawing on has no effect.  Subsurfaces are cached
+        until the grid is updated.
+
+        Parameters:
+            surface (pygame.Surface): The surface to create the view of.
+            grid_left (float): The left grid point of the view.
+            grid_top (float): The top grid point of the view.
+            grid_width (float): (Optional) The number of grid points the view
+                                spans from left to right (default = 1).
+            grid_height (float): (Optional) The number of grid points the
+                                 view spans from top to bottom (default = 1).
+
+        Returns:
+            pygame.Surface: A pygame.Surface object."""
+        self._check_geometry()
+        key = (id(surface), surface.get_size(), grid_left, grid_top,
+               grid_width, grid_height)
+        cached = self._subsurface_cache.get(key)
+        # The parent surface is held with the subsurface so its id can't be
+        # reused by another surface while the entry is cached
+        if cached is not None and cached[0] is surface:
+            return cached[1]
+        surface_rect = surface.get_rect()
+        rect = self._grid_span_rect(grid_left, grid_top, grid_width,
+                                    grid_height).clip(surface_rect)
+        if not rect.width or not rect.height:
+            # Spans outside the surface are moved onto its edge, as pygame
+            # only makes subsurfaces inside the surface
+            rect = pygame.Rect(rect.topleft, (0, 0)).clamp(surface_rect)
+        view = surface.subsurface(rect)
+        self._subsurface_cache.put(key, (surface, view))
+        return view
+
+    # pygame.Surface images
+
+    def blit_image(self, surface: pygame.Surface, image: pygame.Surface,
+                   grid_left: float, grid_top: float, grid_width: float = 1,
+                   grid_height: float = 1, keep_aspect: bool = False,
+                   smooth: bool = True) -> pygame.Rect:
+        """Blits an image scaled to fit the grid cell or cell span provided.
+        Scaled copies are cached until the grid is updated.
+
+        Parameters:
+            surface (pygame.Surface): The surface to blit the image on to.
+            image (pygame.Surface): The image to scale and blit.
+            grid_left (float): The left grid point to place the image at.
+            grid_top (float): The top grid point to place the image at.
+            grid_width (float): (Optional) The number of grid points the
+                                image spans from left to right (default = 1).
+            grid_height (float): (Optional) The number of grid points the
+                                 image spans from top to bottom
+                                 (default = 1).
+            keep_aspect (bool): (Optional) If True, the image keeps its
+                                aspect ratio and is centred within the span
+                                (default = False).
+            smooth (bool): (Optional) If True, pygame.transform.smoothscale
+                           is used where the image supports it
+                           (default = True).
+
+        Returns:
+            pygame.Rect: A pygame.Rect object."""
+        self._check_geometry()
+        rect = self._grid_span_rect(grid_left, grid_top, grid_width,
+                                    grid_height)
+        if keep_aspect:
+            image_width, image_height = image.get_size()
+            scale = min(rect.width / max(image_width, 1),
+                        rect.height / max(image_height, 1))
+            fitted = pygame.Rect(0, 0, int(image_width * scale),
+                                 int(image_height * scale))
+            fitted.center = rect.center
+            rect = fitted
+        if rect.width < 1 or rect.height < 1:
+            return pygame.Rect(rect.topleft, (0, 0))
+        return surface.blit(self._scaled_image(image, rect.size, smooth),
+                            rect.topleft)
+
+    # pygame.font text
+
+    def draw_text(self, surface: pygame.Surface, text: str, color: tuple,
+                  grid_left: float, grid_top: float, grid_width: float = 1,
+                  grid_height: float = 1, font_name: str | None = None,
+                  max_font_size: int = 256, padding: int = 0,
+                  antialias: bool = True) -> pygame.Rect:
+        """Draws text centred in the grid cell or cell span provided, using
+        the largest font size that fits.  Font sizes and rendered text are
+        cached until the grid is updated.
+
+        Parameters:
+            surface (pygame.Surface): The surface to draw the text on to.
+            text (str): The text to draw.
+            color (tuple): The color value for the text.
+            grid_left (float): The left grid point to place the text at.
+            grid_top (float): The top grid point to place the text at.
+            grid_width (float): (Optional) The number of grid points the
+                                text spans from left to right (default = 1).
+            grid_height (float): (Optional) The number of grid points the
+                                 text spans from top to bottom (default = 1).
+            font_name (str): (Optional) The font file to use (default = None,
+                             the pygame default font).
+            max_font_size (int): (Optional) The largest font size to use
+                                 (default = 256).
+            padding (int): (Optional) The space to leave around the text in
+                           pixels (default = 0).
+            antialias (bool): (Optional) If True, the text is drawn with
+                              antialiasing (default = True).
+
+        Returns:
+            pygame.Rect: A pygame.Rect object."""
+        self._check_geometry()
+        rect = self._grid_span_rect(grid_left, grid_top, grid_width,
+                                    grid_height)
+        inner = rect.inflate(-2 * padding, -2 * padding)
+        if not text or inner.width < 1 or inner.height < 1:
+            return pygame.Rect(rect.center, (0, 0))
+        font_size = self._fitted_font_size(font_name, text, inner.size,
+                                           max_font_size)
+        rendered = self._rendered_text(font_name, font_size, text, color,
+                                       antialias)
+        return surface.blit(rendered, rendered.get_rect(center=rect.center))
 
     # pygame.draw shapes
 
@@ -55,9 +290,9 @@ class ShapeFactory:
 
         Returns:
             pygame.Rect: A pygame.Rect object."""
-        return pygame.draw.line(surface, color,
-                                self._convert_grid_tuple(grid_start_pos),
-                                self._convert_grid_tuple(grid_end_pos), width)
+        start_pos, end_pos = self._convert_grid_list((grid_start_pos,
+                                                      grid_end_pos))
+        return pygame.draw.line(surface, color, start_pos, end_pos, width)
 
     def draw_lines(self, surface: pygame.Surface, color: tuple, closed: bool,
                    grid_points: list, width: int = 1) -> pygame.Rect:
@@ -93,10 +328,9 @@ class ShapeFactory:
 
         Returns:
             pygame.Rect: A pygame.Rect object."""
-        return pygame.draw.aaline(surface, color,
-                                  self._convert_grid_tuple(grid_start_pos),
-                                  self._convert_grid_tuple(grid_end_pos),
-                                  blend)
+        start_pos, end_pos = self._convert_grid_list((grid_start_pos,
+                                                      grid_end_pos))
+        return pygame.draw.aaline(surface, color, start_pos, end_pos, blend)
 
     def draw_aalines(self, surface: pygame.Surface, color: tuple, closed: bool,
                      grid_points: list, blend: int = 1):
@@ -132,6 +366,25 @@ class ShapeFactory:
         return pygame.draw.polygon(surface, color,
                                    self._convert_grid_list(grid_points), width)
 
+    def draw_cell(self, surface: pygame.Surface, color: tuple,
+                  grid_left: int, grid_top: int,
+                  width: int = 0) -> pygame.Rect:
+        """Calls pygame.draw.polygon with the vertices of a grid cell, which
+        follow the shape of the cells for hexagonal and isometric grids.
+
+        Parameters:
+            surface (pygame.Surface): The surface to draw the cell on to.
+            color (tuple): The color value for the cell.
+            grid_left (int): The left grid point of the cell.
+            grid_top (int): The top grid point of the cell.
+            width (int): (Optional) The width of the line (default = 0).
+
+        Returns:
+            pygame.Rect: A pygame.Rect object."""
+        return pygame.draw.polygon(surface, color,
+                                   self.grid.cell_vertices(
+                                       grid_left, grid_top), width)
+
     def draw_circle(self, surface: pygame.Surface, color: tuple,
                     grid_center: tuple, radius: float, width: int = 0,
                     draw_top_right: bool = True, draw_top_left: bool = True,
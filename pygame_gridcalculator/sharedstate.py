@@ -0,0 +1,251 @@
+import time
+from multiprocessing import shared_memory
+
+import numpy
+from pygame_gridcalculator.gridcalculator import GridCalculatorException
+
+# Header layout (int64 values) followed by the cell dtype string.  The
+# front buffer is the parity of the frame count, so a single write of the
+# frame count publishes a frame.
+_MAGIC, _FRAME, _WIDTH, _HEIGHT, _MAX_ENTITIES, _ENTITY_FIELDS, \
+    _COUNT_0, _COUNT_1 = range(8)
+_HEADER_VALUES = 8
+_DTYPE_OFFSET = _HEADER_VALUES * 8
+_DTYPE_LENGTH = 16
+_DATA_OFFSET = 128
+_MAGIC_NUMBER = 0x47524944  # "GRID"
+
+
+def _aligned(size: int) -> int:
+    """Rounds a byte size up to a multiple of 8."""
+    return (size + 7) // 8 * 8
+
+
+class SharedGridState:
+    """Create a SharedGridState to hand per-cell grid data and an entity
+       table from simulation processes to a render process through shared
+       memory, without pickling.
+
+    The shared memory holds two copies (buffers) of the cell array and the
+    entity table.  Simulation processes write into the back buffer while the
+    render process reads the front buffer, and publish swaps them by
+    counting a new frame, as the front buffer is chosen by whether the frame
+    count is odd or even.  Readers use the frame count as a seqlock: a
+    snapshot is only returned if no frame was published while it was being
+    copied, so it never mixes two frames.  Writers must finish writing (such
+    as by waiting on a multiprocessing.Barrier) before a single process
+    calls publish.
+
+    Parameters:
+        grid_width (int): The number of cells from left to right.
+        grid_height (int): The number of cells from top to bottom.
+        dtype (numpy.dtype): (Optional) The type of the cell data
+                             (default = numpy.uint8).
+        max_entities (int): (Optional) The number of rows in the entity
+                            table (default = 0).
+        entity_fields (int): (Optional) The number of float64 values for
+                             each entity (default = 0).
+        name (str): (Optional) The name of the shared memory block, which
+                    other processes attach to (default = None, a random
+                    name).
+    """
+
+    def __init__(self, grid_width: int, grid_height: int,
+                 dtype=numpy.uint8, max_entities: int = 0,
+                 entity_fields: int = 0, name: str | None = None):
+        if grid_width < 1 or grid_height < 1:
+            raise GridCalculatorException("The grid must be at least 1 cell "
+                                          "wide and high")
+        if max_entities < 0 or entity_fields < 0:
+            raise GridCalculatorException("The max entities and entity "
+                                          "fields cannot be less than 0")
+        dtype = numpy.dtype(dtype)
+        if len(dtype.str) > _DTYPE_LENGTH:
+            raise GridCalculatorException("The dtype ({}) isn't supported "
+                                          "in shared memory".format(dtype))
+        size = _DATA_OFFSET + 2 * _aligned(
+            grid_width * grid_height * dtype.itemsize) + \
+            2 * max_entities * entity_fields * 8
+        self._memory = shared_memory.SharedMemory(name=name, create=True,
+                                                  size=size)
+        self._owner = True
+        header = numpy.ndarray(_HEADER_VALUES, dtype=numpy.int64,
+                               buffer=self._memory.buf)
+        header[:] = 0
+        header[_WIDTH], header[_HEIGHT] = grid_width, grid_height
+        header[_MAX_ENTITIES] = max_entities
+        header[_ENTITY_FIELDS] = entity_fields
+        self._memory.buf[_DTYPE_OFFSET:_DTYPE_OFFSET + _DTYPE_LENGTH] = \
+            dtype.str.encode("ascii").ljust(_DTYPE_LENGTH, b"\0")
+        header[_MAGIC] = _MAGIC_NUMBER
+        self._map_buffers()
+
+    def __repr__(self):
+        return "SharedGridState(name={};  grid: width={}, height={};  " \
+               "entities={}x{};  frame={})".format(
+                    self.name, *self.size, *self._entities[0].shape,
+                    self.frame)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedGridState":
+        """Attaches to a SharedGridState created by another process.
+
+        Parameters:
+            name (str): The name of the shared memory block.
+
+        Returns:
+            SharedGridState: The attached state."""
+        state = cls.__new__(cls)
+        state._memory = shared_memory.SharedMemory(name=name)
+        state._owner = False
+        if numpy.ndarray(1, dtype=numpy.int64, buffer=state._memory.buf)[
+                _MAGIC] != _MAGIC_NUMBER:
+            state._memory.close()
+            raise GridCalculatorException("The shared memory ({}) isn't a "
+                                          "SharedGridState".format(name))
+        state._map_buffers()
+        return state
+
+    def _map_buffers(self) -> None:
+        """Creates the array views over the shared memory."""
+        buffer = self._memory.buf
+        self._header = numpy.ndarray(_HEADER_VALUES, dtype=numpy.int64,
+                                     buffer=buffer)
+        dtype = numpy.dtype(bytes(buffer[_DTYPE_OFFSET:_DTYPE_OFFSET +
+                                         _DTYPE_LENGTH]).rstrip(b"\0")
+                            .decode("ascii"))
+        size = (int(self._header[_WIDTH]), int(self._header[_HEIGHT]))
+        entity_shape = (int(self._header[_MAX_ENTITIES]),
+                        int(self._header[_ENTITY_FIELDS]))
+        cells_size = _aligned(size[0] * size[1] * dtype.itemsize)
+        entities_offset = _DATA_OFFSET + 2 * cells_size
+        entities_size = entity_shape[0] * entity_shape[1] * 8
+        self._cells = [numpy.ndarray(size, dtype=dtype, buffer=buffer,
+                                     offset=_DATA_OFFSET + index * cells_size)
+                       for index in (0, 1)]
+        self._entities = [numpy.ndarray(entity_shape, dtype=numpy.float64,
+                                        buffer=buffer,
+                                        offset=entities_offset +
+                                        index * entities_size)
+                          for index in (0, 1)]
+
+    @property
+    def name(self) -> str:
+        """Returns the name other processes attach with.
+
+        Returns:
+            str: The name of the shared memory block."""
+        return self._memory.name
+
+    @property
+    def size(self) -> tuple:
+        """Returns the size of the grid.
+
+        Returns:
+            tuple: The size of the grid (width, height)."""
+        return self._cells[0].shape
+
+    @property
+    def frame(self) -> int:
+        """Returns the number of frames published.
+
+        Returns:
+            int: The frame count."""
+        return int(self._header[_FRAME])
+
+    @property
+    def back_cells(self) -> numpy.ndarray:
+        """Returns the cell array to write the next frame into.
+
+        Returns:
+            numpy.ndarray: The back buffer cells indexed as [left, top]."""
+        return self._cells[1 - int(self._header[_FRAME]) % 2]
+
+    @property
+    def back_entities(self) -> numpy.ndarray:
+        """Returns the entity table to write the next frame into.
+
+        Returns:
+            numpy.ndarray: The back buffer entities indexed as
+                           [entity, field]."""
+        return self._entities[1 - int(self._header[_FRAME]) % 2]
+
+    def set_entity_count(self, count: int) -> None:
+        """Sets the number of entities in use in the back buffer.
+
+        Parameters:
+            count (int): The number of rows of the entity table in use."""
+        if not 0 <= count <= self._entities[0].shape[0]:
+            raise GridCalculatorException(
+                "The entity count ({}) must be between 0 and the max "
+                "entities ({})".format(count, self._entities[0].shape[0]))
+        self._header[_COUNT_0 + 1 - int(self._header[_FRAME]) % 2] = count
+
+    def publish(self, copy_forward: bool = False) -> int:
+        """Makes the back buffer the front buffer for readers.
+
+        Parameters:
+            copy_forward (bool): (Optional) If True, the published frame is
+                                 copied into the new back buffer, for
+                                 simulations that only update part of the
+                                 state each frame (default = False).
+
+        Returns:
+            int: The frame count of the published frame."""
+        frame = int(self._header[_FRAME]) + 1
+        front = frame % 2
+        # Writing the frame count alone swaps the buffers, so readers never
+        # see the new count with the old front buffer
+        self._header[_FRAME] = frame
+        if copy_forward:
+            self._cells[1 - front][...] = self._cells[front]
+            self._entities[1 - front][...] = self._entities[front]
+            self._header[_COUNT_0 + 1 - front] = \
+                self._header[_COUNT_0 + front]
+        return frame
+
+    def snapshot(self, timeout: float | None = None) -> tuple:
+        """Returns a consistent copy of the front buffer, retrying if a frame
+        is published while copying.
+
+        Parameters:
+            timeout (float): (Optional) The seconds to keep retrying before
+                             raising a GridCalculatorException
+                             (default = None, retry forever).
+
+        Returns:
+            tuple: The (frame, cells, entities) of the latest frame, with
+                   only the entities in use."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        header = self._header
+        while True:
+            frame = int(header[_FRAME])
+            front = frame % 2
+            count = int(header[_COUNT_0 + front])
+            cells = self._cells[front].copy()
+            entities = self._entities[front][:count].copy()
+            if int(header[_FRAME]) == frame:
+                return frame, cells, entities
+            if deadline is not None and time.monotonic() > deadline:
+                raise GridCalculatorException("A consistent snapshot couldn't "
+                                              "be copied in time")
+            time.sleep(0)
+
+    def close(self) -> None:
+        """Stops using the shared memory in this process."""
+        self._header = None
+        self._cells = self._entities = None
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Frees the shared memory once every process has closed it.  Only
+        the creating process should call this."""
+        self._memory.unlink()
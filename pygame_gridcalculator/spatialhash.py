@@ -0,0 +1,283 @@
+from itertools import combinations
+
+import pygame
+from pygame_gridcalculator.gridcalculator import GridCalculator
+
+
+class SpatialHash:
+    """Create a SpatialHash to bucket objects by the GridCalculator cells
+       they overlap, for finding objects near each other without checking
+       every pair.
+
+    Objects are stored against a hashable key with either a pixel
+    pygame.Rect (such as one from ShapeFactory.Rect) or a grid position and
+    span.  Pixel Rects outside the grid are kept but never returned by
+    queries.
+
+    Parameters:
+        grid (GridCalculator): The grid to bucket objects by.
+    """
+
+    def __init__(self, grid: GridCalculator):
+        self.grid = grid
+        self._cells = {}
+        self._objects = {}
+        self._order = {}
+        self._next_order = 0
+        self._geometry_version = grid.geometry_version
+
+    def __repr__(self):
+        return "SpatialHash(objects={}, occupied cells={})".format(
+            len(self._objects), len(self._cells))
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, key) -> bool:
+        return key in self._objects
+
+    def _check_geometry(self) -> None:
+        """Re-buckets every object if the grid has been updated since the
+        objects were bucketed."""
+        if self._geometry_version != self.grid.geometry_version:
+            self._geometry_version = self.grid.geometry_version
+            self._cells.clear()
+            for key, (space, shape, _, _) in list(self._objects.items()):
+                self._store(key, space, shape)
+
+    def _pixel_rect(self, space: str, shape: tuple) -> pygame.Rect:
+        """Returns the pixel Rect for an object in either space."""
+        if space == "pixel":
+            return pygame.Rect(shape)
+        grid_left, grid_top, grid_width, grid_height = shape
+        return pygame.Rect(self.grid.position(grid_left, grid_top),
+                           self.grid.square(grid_left, grid_top,
+                                            grid_left + grid_width,
+                                            grid_top + grid_height))
+
+    def _cell_span(self, rect: pygame.Rect) -> tuple | None:
+        """Returns the (left, top, right, bottom) cells a pixel Rect overlaps
+        (inclusive), or None if it is outside the grid."""
+        pixel_left, pixel_top = self.grid.position(0, 0)
+        pixel_width, pixel_height = self.grid.pixel_size
+        pixel_right, pixel_bottom = pixel_left + pixel_width, \
+            pixel_top + pixel_height
+        right = rect.right - 1 if rect.width else rect.right
+        bottom = rect.bottom - 1 if rect.height else rect.bottom
+        if right < pixel_left or rect.left > pixel_right or \
+                bottom < pixel_top or rect.top > pixel_bottom:
+            return None
+        left, top = self.grid.cell_at(max(rect.left, pixel_left),
+                                      max(rect.top, pixel_top))
+        right, bottom = self.grid.cell_at(min(right, pixel_right),
+                                          min(bottom, pixel_bottom))
+        return left, top, right, bottom
+
+    def _store(self, key, space: str, shape: tuple) -> None:
+        """Stores the object and adds it to the cells it overlaps."""
+        rect = self._pixel_rect(space, shape)
+        span = self._cell_span(rect)
+        self._objects[key] = (space, shape, rect, span)
+        if span is None:
+            return
+        left, top, right, bottom = span
+        for cell_left in range(left, right + 1):
+            for cell_top in range(top, bottom + 1):
+                self._cells.setdefault((cell_left, cell_top), set()).add(key)
+
+    def _unstore(self, key) -> None:
+        """Removes the object from the cells it overlaps."""
+        span = self._objects.pop(key)[3]
+        if span is None:
+            return
+        left, top, right, bottom = span
+        for cell_left in range(left, right + 1):
+            for cell_top in range(top, bottom + 1):
+                keys = self._cells[(cell_left, cell_top)]
+                keys.discard(key)
+                if not keys:
+                    del self._cells[(cell_left, cell_top)]
+
+    def _update(self, key, space: str, shape: tuple) -> None:
+        """Adds or moves an object, only changing its cells if the cells it
+        overlaps have changed."""
+        self._check_geometry()
+        if key not in self._order:
+            self._order[key] = self._next_order
+            self._next_order += 1
+        elif key in self._objects:
+            rect = self._pixel_rect(space, shape)
+            span = self._objects[key][3]
+            if self._cell_span(rect) == span:
+                self._objects[key] = (space, shape, rect, span)
+                return
+            self._unstore(key)
+        self._store(key, space, shape)
+
+    def insert(self, key, rect: pygame.Rect) -> None:
+        """Adds or moves an object using its pixel position.  A Rect with no
+        width and height is treated as a point.
+
+        Parameters:
+            key (hashable): The key to store the object against.
+            rect (pygame.Rect): The pixel Rect of the object."""
+        self._update(key, "pixel", tuple(pygame.Rect(rect)))
+
+    def insert_grid(self, key, grid_left: float, grid_top: float,
+                    grid_width: float = 0, grid_height: float = 0) -> None:
+        """Adds or moves an object using its grid position.  An object with
+        no width and height is treated as a point.
+
+        Parameters:
+            key (hashable): The key to store the object against.
+            grid_left (float): The left grid point of the object.
+            grid_top (float): The top grid point of the object.
+            grid_width (float): (Optional) The number of grid points the
+                                object spans from left to right
+                                (default = 0).
+            grid_height (float): (Optional) The number of grid points the
+                                 object spans from top to bottom
+                                 (default = 0)."""
+        self._update(key, "grid", (grid_left, grid_top, grid_width,
+                                   grid_height))
+
+    def remove(self, key) -> None:
+        """Removes an object.
+
+        Parameters:
+            key (hashable): The key the object is stored against."""
+        self._check_geometry()
+        self._unstore(key)
+        del self._order[key]
+
+    def clear(self) -> None:
+        """Removes every object."""
+        self._cells.clear()
+        self._objects.clear()
+        self._order.clear()
+
+    def rect(self, key) -> pygame.Rect:
+        """Returns the pixel Rect an object is stored with.
+
+        Parameters:
+            key (hashable): The key the object is stored against.
+
+        Returns:
+            pygame.Rect: A pygame.Rect object."""
+        self._check_geometry()
+        return pygame.Rect(self._objects[key][2])
+
+    def _keys_in_span(self, span: tuple | None) -> set:
+        """Returns the keys of the objects in the cells of the span."""
+        found = set()
+        if span is None:
+            return found
+        left, top, right, bottom = span
+        cells = self._cells
+        for cell_left in range(left, right + 1):
+            for cell_top in range(top, bottom + 1):
+                keys = cells.get((cell_left, cell_top))
+                if keys:
+                    found |= keys
+        return found
+
+    @staticmethod
+    def _overlaps(rect1: pygame.Rect, rect2: pygame.Rect) -> bool:
+        """Returns if two Rects overlap, treating Rects with no width or
+        height as points or lines which overlap when touching."""
+        return rect1.left <= rect2.right and rect2.left <= rect1.right and \
+            rect1.top <= rect2.bottom and rect2.top <= rect1.bottom and \
+            (rect1.colliderect(rect2) or not (rect1.width and rect1.height
+                                              and rect2.width and
+                                              rect2.height))
+
+    def query_rect(self, rect: pygame.Rect, exact: bool = False) -> set:
+        """Returns the objects in the cells a pixel Rect overlaps.
+
+        Parameters:
+            rect (pygame.Rect): The pixel Rect to search.
+            exact (bool): (Optional) If True, only objects that overlap the
+                          Rect itself are returned (default = False).
+
+        Returns:
+            set: The keys of the objects found."""
+        self._check_geometry()
+        rect = pygame.Rect(rect)
+        found = self._keys_in_span(self._cell_span(rect))
+        if exact:
+            found = {key for key in found
+                     if self._overlaps(rect, self._objects[key][2])}
+        return found
+
+    def query_point(self, pixel_left: int, pixel_top: int) -> set:
+        """Returns the objects in the cell containing a pixel position.
+
+        Parameters:
+            pixel_left (int): The left pixel position.
+            pixel_top (int): The top pixel position.
+
+        Returns:
+            set: The keys of the objects found."""
+        return self.query_rect(pygame.Rect(pixel_left, pixel_top, 0, 0))
+
+    def query_cells(self, grid_left: int, grid_top: int, grid_width: int = 1,
+                    grid_height: int = 1) -> set:
+        """Returns the objects in a span of grid cells.
+
+        Parameters:
+            grid_left (int): The left grid point of the span.
+            grid_top (int): The top grid point of the span.
+            grid_width (int): (Optional) The number of cells the span covers
+                              from left to right (default = 1).
+            grid_height (int): (Optional) The number of cells the span covers
+                               from top to bottom (default = 1).
+
+        Returns:
+            set: The keys of the objects found."""
+        self._check_geometry()
+        return self._keys_in_span((grid_left, grid_top,
+                                   grid_left + grid_width - 1,
+                                   grid_top + grid_height - 1))
+
+    def neighbours(self, key, exact: bool = False) -> set:
+        """Returns the other objects sharing a cell with an object.
+
+        Parameters:
+            key (hashable): The key the object is stored against.
+            exact (bool): (Optional) If True, only objects that overlap the
+                          object itself are returned (default = False).
+
+        Returns:
+            set: The keys of the objects found."""
+        self._check_geometry()
+        rect, span = self._objects[key][2:]
+        found = self._keys_in_span(span)
+        found.discard(key)
+        if exact:
+            found = {other for other in found
+                     if self._overlaps(rect, self._objects[other][2])}
+        return found
+
+    def pairs(self, exact: bool = False) -> set:
+        """Returns every pair of objects sharing a cell, with each pair
+        ordered by when the objects were first added.
+
+        Parameters:
+            exact (bool): (Optional) If True, only pairs of objects that
+                          overlap each other are returned (default = False).
+
+        Returns:
+            set: The pairs of keys found {(key1, key2), ...}."""
+        self._check_geometry()
+        order = self._order
+        found = set()
+        for keys in self._cells.values():
+            if len(keys) < 2:
+                continue
+            for key1, key2 in combinations(sorted(keys, key=order.get), 2):
+                found.add((key1, key2))
+        if exact:
+            objects = self._objects
+            found = {(key1, key2) for key1, key2 in found
+                     if self._overlaps(objects[key1][2], objects[key2][2])}
+        return found
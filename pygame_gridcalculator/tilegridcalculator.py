@@ -0,0 +1,390 @@
+import math
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+from pygame import Surface, draw
+from pygame_gridcalculator.gridcalculator import (
+    BoundaryPolicy,
+    GridCalculator,
+    _Geometry
+)
+
+_SQRT3 = math.sqrt(3)
+
+
+class _TileTables(NamedTuple):
+    """The cell size, centre tables and vertex offsets of a tile grid, kept
+    in its geometry snapshot."""
+    tile_width: float
+    tile_height: float
+    center_lefts: list
+    center_tops: list
+    vertex_offsets: list
+    origin_left: float = 0
+
+
+class _TileGridCalculator(GridCalculator, ABC):
+    """The shared behaviour of grids where each cell is drawn as a polygon
+    rather than a rectangle.
+
+    The pixel centre of each column and row and the offsets of each vertex
+    from a cell centre are calculated once whenever the grid or pixel
+    positions are updated and kept in the geometry snapshot, so finding the
+    corners of a cell is a table lookup and an add.  Grid point methods such
+    as position and square keep mapping against the bounding box of the
+    grid.  Subclasses must provide the tables, cell centres, fill area and
+    nearest cell for their cell shape.
+    """
+
+    @abstractmethod
+    def _calculate_tables(self, geometry: _Geometry) -> _TileTables:
+        """Returns the cell size, centre tables and vertex offsets."""
+
+    @abstractmethod
+    def _center(self, left: int, top: int, geometry: _Geometry) -> tuple:
+        """Returns the unrounded pixel centre of a cell inside the grid."""
+
+    @abstractmethod
+    def _fill_points(self, geometry: _Geometry) -> list:
+        """Returns the pixel points of the area filled when the cells are
+        too small to outline."""
+
+    @property
+    def tile_size(self) -> tuple:
+        """Returns the pixel size of the bounding box of a single cell.
+
+        Returns:
+            tuple: The (width, height) of a cell in pixels."""
+        tables = self._geometry.tables
+        return tables.tile_width, tables.tile_height
+
+    @property
+    def vertex_offsets(self) -> list:
+        """Returns the offsets of each vertex from the centre of a cell.
+
+        Returns:
+            list: The pixel offsets of each vertex clockwise
+                  [(left, top), ...]."""
+        return list(self._geometry.tables.vertex_offsets)
+
+    def cell_center(self, left: int, top: int) -> tuple:
+        """Returns the pixel position of the centre of the cell specified.
+
+        Parameters:
+            left (int): The left grid point of the cell.
+            top (int): The top grid point of the cell.
+
+        Returns:
+            tuple: The pixel values of the centre of the cell (left, top)."""
+        geometry = self._geometry
+        center_left, center_top = self._center(
+            *self._resolve_cell(left, top, geometry), geometry)
+        return round(center_left), round(center_top)
+
+    def cell_vertices(self, left: int, top: int) -> list:
+        """Returns the pixel positions of the vertices of the cell
+        specified.
+
+        Parameters:
+            left (int): The left grid point of the cell.
+            top (int): The top grid point of the cell.
+
+        Returns:
+            list: The pixel values of each vertex of the cell clockwise
+                  [(left, top), ...]."""
+        geometry = self._geometry
+        center_left, center_top = self._center(
+            *self._resolve_cell(left, top, geometry), geometry)
+        return [(round(center_left + offset_left),
+                 round(center_top + offset_top))
+                for offset_left, offset_top in geometry.tables.vertex_offsets]
+
+    def _pixel_to_cell(self, pixel_left: int, pixel_top: int,
+                       geometry: _Geometry) -> tuple:
+        """Returns the cell containing a pixel position inside the grid,
+        with positions outside of every cell handled based on the boundary
+        policy."""
+        return self._resolve_cell(
+            *self._nearest_cell(pixel_left, pixel_top, geometry), geometry)
+
+    @abstractmethod
+    def _nearest_cell(self, pixel_left: float, pixel_top: float,
+                      geometry: _Geometry) -> tuple:
+        """Returns the cell containing a pixel position, which may be
+        outside of the grid."""
+
+    @staticmethod
+    def _border_cells(geometry: _Geometry) -> list:
+        """Returns the cells on the edge of the grid."""
+        width, height = geometry.grid_width_max, geometry.grid_height_max
+        return [(left, top) for left in range(width) for top in range(height)
+                if left in (0, width - 1) or top in (0, height - 1)]
+
+    def draw_grid_to_surface(self, surface: Surface,
+                             color: tuple = (0, 0, 0),
+                             min_line_spacing: float = 0,
+                             fill_spacing: float = 0) -> None:
+        """Draws the outline of every cell to the pygame surface provided.
+
+        Parameters:
+            surface (pygame.Surface): The surface you want to show the grid
+                                      on.
+            color (tuple): (Optional) Set the color of the grid
+                           (default = black (0, 0, 0)).
+            min_line_spacing (float): (Optional) The minimum size of a cell
+                                      in pixels.  If the cells are smaller
+                                      than this, only the cells on the edge
+                                      of the grid are outlined
+                                      (default = 0, outline every cell).
+            fill_spacing (float): (Optional) If the cells are smaller than
+                                  this number of pixels, the grid area is
+                                  filled with the color instead of outlining
+                                  cells (default = 0, never fill)."""
+        geometry = self._geometry
+        tables = geometry.tables
+        spacing = min(tables.tile_width, tables.tile_height)
+        if spacing < fill_spacing:
+            draw.polygon(surface, color, self._fill_points(geometry))
+            return
+        if spacing < min_line_spacing:
+            cells = self._border_cells(geometry)
+        else:
+            cells = [(left, top) for left in range(geometry.grid_width_max)
+                     for top in range(geometry.grid_height_max)]
+        center, offsets = self._center, tables.vertex_offsets
+        for left, top in cells:
+            center_left, center_top = center(left, top, geometry)
+            draw.lines(surface, color, True,
+                       [(round(center_left + offset_left),
+                         round(center_top + offset_top))
+                        for offset_left, offset_top in offsets])
+
+
+class HexGridCalculator(_TileGridCalculator):
+    """Create a HexGridCalculator to map the available pixels on the screen
+       against a grid of hexagons of the users specified size.
+
+    Pointy topped grids shift every odd row right by half a cell and flat
+    topped grids shift every odd column down by half a cell.  The hexagons
+    are stretched to fill the pixels available.
+
+    Parameters:
+        pixel_end_left (int): The right pixel point for use by the grid.
+        pixel_end_top (int): The bottom pixel point for use by the grid.
+        grid_width_max (int): The number of columns in the grid.
+        grid_height_max (int): The number of rows in the grid.
+        pixel_start_left (int): (Optional) The left pixel point for use by the
+                                grid (default = 0).
+        pixel_start_top (int): (Optional) The top pixel point for use by the
+                               grid (default = 0).
+        pointy (bool): (Optional) If True, the hexagons have a point at the
+                       top, otherwise they have a flat top (default = True).
+        boundary_policy (BoundaryPolicy): (Optional) How points outside of
+                                          the grid are handled
+                                          (default = BoundaryPolicy.RAISE).
+    """
+
+    def __init__(self, pixel_end_left: int, pixel_end_top: int,
+                 grid_width_max: int, grid_height_max: int,
+                 pixel_start_left: int = 0, pixel_start_top: int = 0,
+                 pointy: bool = True,
+                 boundary_policy: BoundaryPolicy = BoundaryPolicy.RAISE):
+        self._pointy = pointy
+        super().__init__(pixel_end_left, pixel_end_top, grid_width_max,
+                         grid_height_max, pixel_start_left, pixel_start_top,
+                         boundary_policy)
+
+    def __repr__(self):
+        return "HexGridCalculator(pixel range: left={}-{}, top={}-{};  " \
+               "grid: width={}, height={};  pointy={})".format(
+                    self._pixel_start_left, self._pixel_end_left,
+                    self._pixel_start_top, self._pixel_end_top,
+                    self._grid_width_max, self._grid_height_max,
+                    self._pointy)
+
+    @property
+    def pointy(self) -> bool:
+        """Returns if the hexagons have a point at the top.
+
+        Returns:
+            bool: True for pointy topped hexagons, False for flat topped."""
+        return self._pointy
+
+    def _new_instance(self) -> "HexGridCalculator":
+        """Returns a grid with the same hexagon shape but no geometry."""
+        grid = super()._new_instance()
+        grid._pointy = self._pointy
+        return grid
+
+    def _calculate_tables(self, geometry: _Geometry) -> _TileTables:
+        """Returns the cell size, centre tables and vertex offsets."""
+        columns, rows = geometry.grid_width_max, geometry.grid_height_max
+        start_left, start_top = geometry.pixel_start_left, \
+            geometry.pixel_start_top
+        pixel_width = geometry.pixel_end_left - start_left
+        pixel_height = geometry.pixel_end_top - start_top
+        if self._pointy:
+            width = pixel_width / (columns + (0.5 if rows > 1 else 0))
+            height = pixel_height / (0.75 * rows + 0.25)
+            # Lefts are indexed by the row parity then the column
+            center_lefts = [
+                [start_left + width * (left + 0.5 + 0.5 * parity)
+                 for left in range(columns)] for parity in (0, 1)]
+            center_tops = [start_top + height * (0.5 + 0.75 * top)
+                           for top in range(rows)]
+            vertex_offsets = [
+                (0, -height / 2), (width / 2, -height / 4),
+                (width / 2, height / 4), (0, height / 2),
+                (-width / 2, height / 4), (-width / 2, -height / 4)]
+        else:
+            width = pixel_width / (0.75 * columns + 0.25)
+            height = pixel_height / (rows + (0.5 if columns > 1 else 0))
+            center_lefts = [start_left + width * (0.5 + 0.75 * left)
+                            for left in range(columns)]
+            # Tops are indexed by the column parity then the row
+            center_tops = [
+                [start_top + height * (top + 0.5 + 0.5 * parity)
+                 for top in range(rows)] for parity in (0, 1)]
+            vertex_offsets = [
+                (-width / 2, 0), (-width / 4, -height / 2),
+                (width / 4, -height / 2), (width / 2, 0),
+                (width / 4, height / 2), (-width / 4, height / 2)]
+        return _TileTables(width, height, center_lefts, center_tops,
+                           vertex_offsets)
+
+    def _center(self, left: int, top: int, geometry: _Geometry) -> tuple:
+        """Returns the unrounded pixel centre of a cell inside the grid."""
+        tables = geometry.tables
+        if self._pointy:
+            return tables.center_lefts[top & 1][left], \
+                tables.center_tops[top]
+        return tables.center_lefts[left], tables.center_tops[left & 1][top]
+
+    def _fill_points(self, geometry: _Geometry) -> list:
+        """Returns the pixel points of the area filled when the cells are
+        too small to outline."""
+        left, top = geometry.pixel_start_left, geometry.pixel_start_top
+        right, bottom = geometry.pixel_end_left, geometry.pixel_end_top
+        return [(left, top), (right, top), (right, bottom), (left, bottom)]
+
+    def _nearest_cell(self, pixel_left: float, pixel_top: float,
+                      geometry: _Geometry) -> tuple:
+        """Returns the cell containing a pixel position, which may be
+        outside of the grid."""
+        # Scale to regular hexagons with a side of 1 centred on cell (0, 0)
+        # and round the axial coordinates through cube coordinates
+        left = (pixel_left - geometry.pixel_start_left) / \
+            geometry.tables.tile_width
+        top = (pixel_top - geometry.pixel_start_top) / \
+            geometry.tables.tile_height
+        if self._pointy:
+            left, top = (left - 0.5) * _SQRT3, (top - 0.5) * 2
+            column = left * _SQRT3 / 3 - top / 3
+            row = top * 2 / 3
+        else:
+            left, top = (left - 0.5) * 2, (top - 0.5) * _SQRT3
+            column = left * 2 / 3
+            row = top * _SQRT3 / 3 - left / 3
+        column, row = self._cube_round(column, row)
+        if self._pointy:
+            return column + (row - (row & 1)) // 2, row
+        return column, row + (column - (column & 1)) // 2
+
+    @staticmethod
+    def _cube_round(column: float, row: float) -> tuple:
+        """Rounds fractional axial coordinates to the nearest hexagon."""
+        third = -column - row
+        rounded_column, rounded_row = round(column), round(row)
+        rounded_third = round(third)
+        column_diff = abs(rounded_column - column)
+        row_diff = abs(rounded_row - row)
+        third_diff = abs(rounded_third - third)
+        if column_diff > row_diff and column_diff > third_diff:
+            rounded_column = -rounded_row - rounded_third
+        elif row_diff > third_diff:
+            rounded_row = -rounded_column - rounded_third
+        return rounded_column, rounded_row
+
+
+class IsometricGridCalculator(_TileGridCalculator):
+    """Create an IsometricGridCalculator to map the available pixels on the
+       screen against a grid of diamond shaped cells of the users specified
+       size.
+
+    Columns run from the top corner of the grid down to the right and rows
+    run from the top corner down to the left, with the diamonds stretched to
+    fill the pixels available.
+
+    Parameters:
+        pixel_end_left (int): The right pixel point for use by the grid.
+        pixel_end_top (int): The bottom pixel point for use by the grid.
+        grid_width_max (int): The number of columns in the grid.
+        grid_height_max (int): The number of rows in the grid.
+        pixel_start_left (int): (Optional) The left pixel point for use by the
+                                grid (default = 0).
+        pixel_start_top (int): (Optional) The top pixel point for use by the
+                               grid (default = 0).
+        boundary_policy (BoundaryPolicy): (Optional) How points outside of
+                                          the grid are handled
+                                          (default = BoundaryPolicy.RAISE).
+    """
+
+    def __repr__(self):
+        return "IsometricGridCalculator(pixel range: left={}-{}, " \
+               "top={}-{};  grid: width={}, height={})".format(
+                    self._pixel_start_left, self._pixel_end_left,
+                    self._pixel_start_top, self._pixel_end_top,
+                    self._grid_width_max, self._grid_height_max)
+
+    def _calculate_tables(self, geometry: _Geometry) -> _TileTables:
+        """Returns the cell size, centre tables and vertex offsets."""
+        columns, rows = geometry.grid_width_max, geometry.grid_height_max
+        width = 2 * (geometry.pixel_end_left -
+                     geometry.pixel_start_left) / (columns + rows)
+        height = 2 * (geometry.pixel_end_top -
+                      geometry.pixel_start_top) / (columns + rows)
+        origin_left = geometry.pixel_start_left + rows * width / 2
+        # Lefts are indexed by column - row + rows - 1 and tops by
+        # column + row
+        center_lefts = [origin_left + (difference - rows + 1) * width / 2
+                        for difference in range(columns + rows - 1)]
+        center_tops = [geometry.pixel_start_top + (total + 1) * height / 2
+                       for total in range(columns + rows - 1)]
+        vertex_offsets = [(0, -height / 2), (width / 2, 0),
+                          (0, height / 2), (-width / 2, 0)]
+        return _TileTables(width, height, center_lefts, center_tops,
+                           vertex_offsets, origin_left)
+
+    def _center(self, left: int, top: int, geometry: _Geometry) -> tuple:
+        """Returns the unrounded pixel centre of a cell inside the grid."""
+        tables = geometry.tables
+        return tables.center_lefts[
+            left - top + geometry.grid_height_max - 1], \
+            tables.center_tops[left + top]
+
+    def _fill_points(self, geometry: _Geometry) -> list:
+        """Returns the pixel points of the area filled when the cells are
+        too small to outline."""
+        tables = geometry.tables
+        columns, rows = geometry.grid_width_max, geometry.grid_height_max
+        half_width, half_height = tables.tile_width / 2, \
+            tables.tile_height / 2
+        origin_left, start_top = tables.origin_left, geometry.pixel_start_top
+        return [(round(origin_left), start_top),
+                (round(origin_left + columns * half_width),
+                 round(start_top + columns * half_height)),
+                (round(origin_left + (columns - rows) * half_width),
+                 round(start_top + (columns + rows) * half_height)),
+                (round(origin_left - rows * half_width),
+                 round(start_top + rows * half_height))]
+
+    def _nearest_cell(self, pixel_left: float, pixel_top: float,
+                      geometry: _Geometry) -> tuple:
+        """Returns the cell containing a pixel position, which may be
+        outside of the grid."""
+        tables = geometry.tables
+        across = (pixel_left - tables.origin_left) / (tables.tile_width / 2)
+        down = (pixel_top - geometry.pixel_start_top) / \
+            (tables.tile_height / 2)
+        return math.floor((across + down) / 2), \
+            math.floor((down - across) / 2)
@@ -0,0 +1,171 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+from pygame_gridcalculator.shapefactory import ShapeFactory
+from pygame_gridcalculator.tilegridcalculator import _TileGridCalculator
+
+
+class TileRenderer:
+    """Create a TileRenderer to split drawing a large grid into tiles of
+       whole cells, with each tile drawn into its own subsurface on a thread
+       pool.
+
+    Each tile is given a copy of the grid translated to start at the tile's
+    subsurface (see GridCalculator.translated) and a ShapeFactory for it, so
+    the same grid points can be drawn in every tile and pygame clips anything
+    outside the tile.  Diagonal lines crossing the edge of a tile can be a
+    pixel out where pygame clips them.  Surface.fill and Surface.blit release
+    the GIL while they copy pixels, so tiles that fill or blit can be drawn
+    at the same time on multiple cores.  Only grids of rectangular cells can
+    be split into tiles.
+
+    Parameters:
+        grid (GridCalculator): The grid to draw.
+        tile_size (tuple): (Optional) The number of cells in each tile
+                           (width, height) (default = (16, 16)).
+        max_workers (int): (Optional) The number of threads drawing tiles
+                           (default = None, chosen by
+                           concurrent.futures.ThreadPoolExecutor).
+    """
+
+    def __init__(self, grid: GridCalculator, tile_size: tuple = (16, 16),
+                 max_workers: int | None = None):
+        if min(tile_size) < 1:
+            raise GridCalculatorException("The tile size ({}) must be at "
+                                          "least 1 cell".format(tile_size))
+        if isinstance(grid, _TileGridCalculator):
+            raise GridCalculatorException("Only grids of rectangular cells "
+                                          "can be split into tiles")
+        self.grid = grid
+        self._tile_size = tuple(tile_size)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._tiles = None
+        self._tiles_key = None
+
+    def __repr__(self):
+        return "TileRenderer(tile size: width={}, height={})".format(
+            *self._tile_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _tile_spans(self) -> list:
+        """Returns the (left, top, width, height) cells of every tile."""
+        grid_width, grid_height = self.grid.size
+        tile_width, tile_height = self._tile_size
+        return [(left, top, min(tile_width, grid_width - left),
+                 min(tile_height, grid_height - top))
+                for top in range(0, grid_height, tile_height)
+                for left in range(0, grid_width, tile_width)]
+
+    def _build_tiles(self, surface_rect: pygame.Rect) -> list:
+        """Returns the cells, pixel Rect, grid and ShapeFactory of every tile
+        that is on the surface."""
+        grid_width, grid_height = self.grid.size
+        tiles = []
+        for span in self._tile_spans():
+            left, top, width, height = span
+            pixel_left, pixel_top = self.grid.position(left, top)
+            pixel_right, pixel_bottom = self.grid.position(left + width,
+                                                           top + height)
+            # The last tiles also cover the far border lines of the grid
+            rect = pygame.Rect(pixel_left, pixel_top,
+                               pixel_right - pixel_left +
+                               (left + width == grid_width),
+                               pixel_bottom - pixel_top +
+                               (top + height == grid_height)) \
+                .clip(surface_rect)
+            if not rect.width or not rect.height:
+                continue
+            tile_grid = self.grid.translated(rect.left, rect.top)
+            tiles.append((span, rect, tile_grid, ShapeFactory(tile_grid)))
+        return tiles
+
+    def tiles(self, surface: pygame.Surface) -> list:
+        """Returns the tiles the surface is split into, which are rebuilt
+        when the grid or surface size changes.
+
+        Parameters:
+            surface (pygame.Surface): The surface the grid is drawn on.
+
+        Returns:
+            list: The (left, top, width, height) cells and pixel Rect of each
+                  tile [((left, top, width, height), pygame.Rect), ...]."""
+        return [(span, pygame.Rect(rect))
+                for span, rect, _, _ in self._current_tiles(surface)]
+
+    def _current_tiles(self, surface: pygame.Surface) -> list:
+        """Returns the tiles for the surface, rebuilding them if needed."""
+        key = (self.grid, self.grid.geometry_version, surface.get_size())
+        if key != self._tiles_key:
+            self._tiles = self._build_tiles(surface.get_rect())
+            self._tiles_key = key
+        return self._tiles
+
+    @staticmethod
+    def _draw_tile(tile_surface: pygame.Surface, span: tuple,
+                   tile_grid: GridCalculator, shape_factory: ShapeFactory,
+                   draw, background: tuple | None,
+                   grid_color: tuple | None) -> None:
+        """Draws a single tile."""
+        if background is not None:
+            tile_surface.fill(background)
+        if draw is not None:
+            draw(tile_surface, shape_factory, span)
+        if grid_color is not None:
+            left, top, width, height = span
+            pixel_top = tile_grid.top_point(top)
+            pixel_bottom = tile_grid.top_point(top + height)
+            pixel_left = tile_grid.left_point(left)
+            pixel_right = tile_grid.left_point(left + width)
+            for l_point in range(left, left + width + 1):
+                pixel = tile_grid.left_point(l_point)
+                pygame.draw.line(tile_surface, grid_color,
+                                 (pixel, pixel_top), (pixel, pixel_bottom))
+            for t_point in range(top, top + height + 1):
+                pixel = tile_grid.top_point(t_point)
+                pygame.draw.line(tile_surface, grid_color,
+                                 (pixel_left, pixel), (pixel_right, pixel))
+
+    def render(self, surface: pygame.Surface, draw=None,
+               background: tuple | None = None,
+               grid_color: tuple | None = None) -> list:
+        """Draws every tile on the thread pool and waits for them to finish.
+
+        Parameters:
+            surface (pygame.Surface): The surface to draw the grid on.
+            draw (callable): (Optional) Called for each tile as
+                             draw(tile_surface, shape_factory, cells) to draw
+                             its contents, where cells is the
+                             (left, top, width, height) of the tile and
+                             shape_factory uses full grid points
+                             (default = None).
+            background (tuple): (Optional) The color to fill each tile with
+                                first (default = None, no fill).
+            grid_color (tuple): (Optional) The color of the grid lines drawn
+                                over each tile (default = None, no lines).
+
+        Returns:
+            list: The pixel Rect of each tile drawn."""
+        futures = []
+        rects = []
+        for span, rect, tile_grid, shape_factory in \
+                self._current_tiles(surface):
+            futures.append(self._executor.submit(
+                self._draw_tile, surface.subsurface(rect), span, tile_grid,
+                shape_factory, draw, background, grid_color))
+            rects.append(pygame.Rect(rect))
+        for future in futures:
+            future.result()
+        return rects
+
+    def close(self) -> None:
+        """Stops the thread pool once any drawing has finished."""
+        self._executor.shutdown(wait=True)
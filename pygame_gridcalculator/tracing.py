@@ -0,0 +1,317 @@
+import json
+import threading
+import time
+from functools import wraps
+
+from pygame_gridcalculator.gridcalculator import (
+    GridCalculator,
+    GridCalculatorException
+)
+from pygame_gridcalculator.shapefactory import ShapeFactory
+
+# The methods instrumented on each kind of object, by category
+_GRID_METHODS = {
+    "conversion": ("top_point", "left_point", "position", "height_gap",
+                   "width_gap", "square", "points_from_left",
+                   "points_from_top", "points_from_right",
+                   "points_from_bottom", "resolve_cell", "cell_at",
+                   "cells_at", "cell_center", "cell_vertices"),
+    "drawing": ("draw_grid_to_surface",),
+    "geometry": ("update_grid", "update_pixel_positions", "update_weights")
+}
+_SHAPE_FACTORY_METHODS = {
+    "conversion": ("Rect", "subsurface"),
+    "drawing": ("fill", "draw_grid_to_surface", "blit_image", "draw_text",
+                "draw_line", "draw_lines", "draw_aaline", "draw_aalines",
+                "draw_polygon", "draw_cell", "draw_circle")
+}
+
+
+class _Span:
+    """A context manager that writes a complete event when it exits."""
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start")
+
+    def __init__(self, tracer: "FrameTracer", name: str, category: str,
+                 args: dict):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+
+    def __enter__(self):
+        self._start = self._tracer._clock()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._tracer._complete(self._name, self._category, self._start,
+                               self._tracer._clock(), self._args)
+
+
+class FrameTracer:
+    """Create a FrameTracer to write a timeline of each frame as Chrome trace
+       event JSON, which can be opened in Perfetto or chrome://tracing.
+
+    Frames and the phases within them (such as event handling, drawing and
+    updating the display) are written as spans.  Instrumented GridCalculator
+    and ShapeFactory objects have their calls counted and timed by category
+    (conversion, drawing and geometry updates) and written once per frame,
+    as arguments of the frame span and as counter tracks, rather than as an
+    event for every call.  Geometry updates are also written as their own
+    spans, as they are rare and often the cause of slow frames.  Call times
+    are inclusive, so drawing time includes the conversions it makes.
+
+    At most max_buffered_events events are held in memory before they are
+    written to the file, so long sessions can be traced.  Instrumented
+    objects can be called from several threads, such as a render thread
+    drawing while the main thread updates the grid: calls inside calls are
+    tracked per thread and the counts and events are updated under a lock.
+
+    Parameters:
+        file (str or file): The path of the JSON file to write, or a text
+                            file object opened for writing.
+        max_buffered_events (int): (Optional) The most events to hold before
+                                   writing them (default = 10000).
+        process_name (str): (Optional) The name shown for the process in the
+                            timeline (default = "pygame").
+        clock (callable): (Optional) Returns the current time in seconds
+                          (default = time.perf_counter).
+    """
+
+    def __init__(self, file, max_buffered_events: int = 10000,
+                 process_name: str = "pygame", clock=time.perf_counter):
+        if max_buffered_events < 1:
+            raise GridCalculatorException("The max buffered events must be "
+                                          "greater than 0")
+        self._owns_file = isinstance(file, str)
+        self._file = open(file, "w") if self._owns_file else file
+        self._max_buffered_events = max_buffered_events
+        self._clock = clock
+        self._origin = clock()
+        self._buffer = []
+        self._events_written = 0
+        self._frames = 0
+        self._frame_start = None
+        self._stats = {}
+        self._active = threading.local()
+        self._lock = threading.RLock()
+        self._instrumented = {}
+        self._closed = False
+        self._file.write("[")
+        self._add({"name": "process_name", "ph": "M", "pid": 1,
+                   "args": {"name": process_name}})
+
+    def __repr__(self):
+        return "FrameTracer(frames={};  events={})".format(
+            self._frames, self._events_written + len(self._buffer))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def frames(self) -> int:
+        """Returns the number of frames traced.
+
+        Returns:
+            int: The number of frames ended."""
+        return self._frames
+
+    @property
+    def events_written(self) -> int:
+        """Returns the number of events written to the file so far.
+
+        Returns:
+            int: The number of events written, not including buffered
+                 events."""
+        return self._events_written
+
+    def _timestamp(self, seconds: float) -> float:
+        """Returns a time as microseconds since the tracer was created."""
+        return round((seconds - self._origin) * 1e6, 3)
+
+    def _add(self, event: dict) -> None:
+        """Buffers an event, writing the buffer if it is full."""
+        with self._lock:
+            if self._closed:
+                raise GridCalculatorException("The tracer has been closed")
+            self._buffer.append(event)
+            if len(self._buffer) >= self._max_buffered_events:
+                self.flush()
+
+    def _complete(self, name: str, category: str, start: float, end: float,
+                  args: dict | None = None) -> None:
+        """Buffers a complete event covering start to end."""
+        event = {"name": name, "cat": category, "ph": "X",
+                 "ts": self._timestamp(start),
+                 "dur": round((end - start) * 1e6, 3), "pid": 1,
+                 "tid": threading.get_native_id()}
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def span(self, name: str, category: str = "phase", **args) -> _Span:
+        """Returns a context manager that traces the code it wraps as a
+        span, such as a phase of a frame.
+
+        Parameters:
+            name (str): The name of the span, such as "events" or "display".
+            category (str): (Optional) The category of the span
+                            (default = "phase").
+            args: (Optional) Values to show with the span.
+
+        Returns:
+            _Span: A context manager for the span."""
+        return _Span(self, name, category, args)
+
+    def begin_frame(self) -> None:
+        """Marks the start of a frame."""
+        self._frame_start = self._clock()
+
+    def end_frame(self) -> None:
+        """Marks the end of a frame, writing the frame span and the calls
+        made during it."""
+        end = self._clock()
+        start = end if self._frame_start is None else self._frame_start
+        timestamp = self._timestamp(end)
+        calls = {}
+        totals = {}
+        with self._lock:
+            stats, self._stats = self._stats, {}
+        for (category, name), (count, seconds) in stats.items():
+            calls[name] = {"calls": count, "ms": round(seconds * 1e3, 3)}
+            totals[category] = totals.get(category, 0.0) + seconds
+        self._complete("frame {}".format(self._frames), "frame", start, end,
+                       calls)
+        for category, seconds in totals.items():
+            self._add({"name": category, "ph": "C", "ts": timestamp,
+                       "pid": 1, "args": {"ms": round(seconds * 1e3, 3)}})
+        self._frame_start = None
+        self._frames += 1
+
+    def frame(self) -> "_Frame":
+        """Returns a context manager that traces the code it wraps as a
+        frame.
+
+        Returns:
+            _Frame: A context manager for the frame."""
+        return _Frame(self)
+
+    def _wrap(self, method, name: str, category: str):
+        """Returns the method wrapped to count and time its calls."""
+        active, lock, clock = self._active, self._lock, self._clock
+        key = (category, name)
+
+        @wraps(method)
+        def traced(*args, **kwargs):
+            # Calls made by other calls of the same category on the same
+            # thread, such as points_from_left calling left_point, are only
+            # counted once
+            categories = getattr(active, "categories", None)
+            if categories is None:
+                categories = active.categories = set()
+            if category in categories:
+                return method(*args, **kwargs)
+            categories.add(category)
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                end = clock()
+                categories.discard(category)
+                with lock:
+                    entry = self._stats.get(key)
+                    if entry is None:
+                        self._stats[key] = [1, end - start]
+                    else:
+                        entry[0] += 1
+                        entry[1] += end - start
+                if category == "geometry":
+                    self._complete(name, category, start, end)
+
+        return traced
+
+    def instrument(self, target):
+        """Counts and times the calls made to a GridCalculator or
+        ShapeFactory from now on.  Only the object provided is instrumented,
+        not grids translated from it (such as the tiles of a TileRenderer).
+
+        Parameters:
+            target (GridCalculator or ShapeFactory): The object to
+                                                     instrument.
+
+        Returns:
+            GridCalculator or ShapeFactory: The object provided."""
+        if isinstance(target, GridCalculator):
+            methods = _GRID_METHODS
+        elif isinstance(target, ShapeFactory):
+            methods = _SHAPE_FACTORY_METHODS
+        else:
+            raise GridCalculatorException(
+                "Only GridCalculator and ShapeFactory objects can be "
+                "instrumented, not {}".format(type(target).__name__))
+        if id(target) in self._instrumented:
+            return target
+        names = []
+        for category, method_names in methods.items():
+            for name in method_names:
+                method = getattr(target, name, None)
+                if method is not None:
+                    setattr(target, name, self._wrap(method, name, category))
+                    names.append(name)
+        # The target is held so its id can't be reused while instrumented
+        self._instrumented[id(target)] = (target, names)
+        return target
+
+    def uninstrument(self, target) -> None:
+        """Stops counting the calls made to an instrumented object.
+
+        Parameters:
+            target (GridCalculator or ShapeFactory): The object to stop
+                                                     instrumenting."""
+        _, names = self._instrumented.pop(id(target), (None, []))
+        for name in names:
+            delattr(target, name)
+
+    def flush(self) -> None:
+        """Writes the buffered events to the file."""
+        with self._lock:
+            if not self._buffer:
+                return
+            separator = ",\n" if self._events_written else "\n"
+            self._file.write(separator + ",\n".join(
+                json.dumps(event, separators=(",", ":"))
+                for event in self._buffer))
+            self._events_written += len(self._buffer)
+            self._buffer.clear()
+
+    def close(self) -> None:
+        """Stops instrumenting every object, writes the buffered events and
+        closes the JSON array."""
+        if self._closed:
+            return
+        for target, _ in list(self._instrumented.values()):
+            self.uninstrument(target)
+        self.flush()
+        self._file.write("\n]\n")
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+        self._closed = True
+
+
+class _Frame:
+    """A context manager that marks the start and end of a frame."""
+    __slots__ = ("_tracer",)
+
+    def __init__(self, tracer: FrameTracer):
+        self._tracer = tracer
+
+    def __enter__(self):
+        self._tracer.begin_frame()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._tracer.end_frame()
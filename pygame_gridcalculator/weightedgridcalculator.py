@@ -0,0 +1,270 @@
+from bisect import bisect_left
+from itertools import accumulate
+
+from pygame_gridcalculator.gridcalculator import (
+    BoundaryPolicy,
+    GridCalculator,
+    GridCalculatorException,
+    _Geometry
+)
+
+
+class WeightedGridCalculator(GridCalculator):
+    """Create a WeightedGridCalculator to map the available pixels on the
+       screen against a grid where each column and row has its own width and
+       height.
+
+    Columns and rows either have a fixed size in pixels or share the
+    remaining pixels based on their weight.  Whole grid points are looked up
+    from precalculated pixel offsets and pixels are mapped back to cells by
+    bisecting the offsets.  The offsets are kept in the geometry snapshot, so
+    they are swapped along with the pixel positions they were calculated
+    from.
+
+    Parameters:
+        pixel_end_left (int): The right pixel point for use by the grid.
+        pixel_end_top (int): The bottom pixel point for use by the grid.
+        column_weights (list): The weight of each column from left to right.
+        row_weights (list): The weight of each row from top to bottom.
+        pixel_start_left (int): (Optional) The left pixel point for use by the
+                                grid (default = 0).
+        pixel_start_top (int): (Optional) The top pixel point for use by the
+                               grid (default = 0).
+        fixed_column_pixels (dict): (Optional) The fixed pixel width of
+                                    columns by column index, which ignore
+                                    their weight (default = None).
+        fixed_row_pixels (dict): (Optional) The fixed pixel height of rows by
+                                 row index, which ignore their weight
+                                 (default = None).
+        boundary_policy (BoundaryPolicy): (Optional) How points outside of
+                                          the grid are handled
+                                          (default = BoundaryPolicy.RAISE).
+    """
+
+    def __init__(self, pixel_end_left: int, pixel_end_top: int,
+                 column_weights: list, row_weights: list,
+                 pixel_start_left: int = 0, pixel_start_top: int = 0,
+                 fixed_column_pixels: dict | None = None,
+                 fixed_row_pixels: dict | None = None,
+                 boundary_policy: BoundaryPolicy = BoundaryPolicy.RAISE):
+        self._column_weights = self._check_weights(column_weights, "column")
+        self._row_weights = self._check_weights(row_weights, "row")
+        self._fixed_column_pixels = self._check_fixed_pixels(
+            fixed_column_pixels, len(self._column_weights),
+            pixel_end_left - pixel_start_left, "column")
+        self._fixed_row_pixels = self._check_fixed_pixels(
+            fixed_row_pixels, len(self._row_weights),
+            pixel_end_top - pixel_start_top, "row")
+        super().__init__(pixel_end_left, pixel_end_top,
+                         len(self._column_weights), len(self._row_weights),
+                         pixel_start_left, pixel_start_top, boundary_policy)
+
+    def __repr__(self):
+        return "WeightedGridCalculator(pixel range: left={}-{}, top={}-{};  " \
+               "grid: width={}, height={})".format(
+                    self._pixel_start_left, self._pixel_end_left,
+                    self._pixel_start_top, self._pixel_end_top,
+                    self._grid_width_max, self._grid_height_max)
+
+    @staticmethod
+    def _check_weights(weights: list, name: str) -> list:
+        """Checks the weights provided are valid and returns them as a
+        list."""
+        weights = [float(weight) for weight in weights]
+        if not weights:
+            raise GridCalculatorException("At least one {} weight must be "
+                                          "provided".format(name))
+        if min(weights) <= 0:
+            raise GridCalculatorException("The {} weights must be greater "
+                                          "than 0".format(name))
+        return weights
+
+    @staticmethod
+    def _check_fixed_pixels(fixed_pixels: dict | None, count: int,
+                            pixel_range: int, name: str) -> dict:
+        """Checks the fixed pixel sizes provided fit in the grid and returns
+        them as a dict."""
+        fixed_pixels = dict(fixed_pixels or {})
+        for index, pixels in fixed_pixels.items():
+            if not 0 <= index < count:
+                raise GridCalculatorException(
+                    "The fixed {} index ({}) isn't in the grid "
+                    "(0 - {})".format(name, index, count - 1))
+            if pixels < 0:
+                raise GridCalculatorException(
+                    "The fixed {} pixels ({}) cannot be less than "
+                    "0".format(name, pixels))
+        if sum(fixed_pixels.values()) > pixel_range:
+            raise GridCalculatorException(
+                "The fixed {} pixels ({}) cannot be greater than the pixel "
+                "range ({})".format(name, sum(fixed_pixels.values()),
+                                    pixel_range))
+        return fixed_pixels
+
+    @staticmethod
+    def _offsets(weights: list, fixed_pixels: dict,
+                 pixel_range: int) -> list:
+        """Returns the pixel offset of each grid point from the start of the
+        grid."""
+        weighted = sum(weight for index, weight in enumerate(weights)
+                       if index not in fixed_pixels)
+        remaining = pixel_range - sum(fixed_pixels.values())
+        sizes = [fixed_pixels[index] if index in fixed_pixels
+                 else remaining * weight / weighted if weighted else 0
+                 for index, weight in enumerate(weights)]
+        offsets = [0.0] + list(accumulate(sizes))
+        if weighted:
+            # Avoid rounding errors leaving the far border short of the range
+            offsets[-1] = float(pixel_range)
+        return offsets
+
+    def _calculate_tables(self, geometry: _Geometry) -> tuple:
+        """Returns the pixel offsets of every column and row, which are kept
+        in the geometry snapshot."""
+        return self._offsets(self._column_weights, self._fixed_column_pixels,
+                             geometry.pixel_end_left -
+                             geometry.pixel_start_left), \
+            self._offsets(self._row_weights, self._fixed_row_pixels,
+                          geometry.pixel_end_top - geometry.pixel_start_top)
+
+    def _new_instance(self) -> "WeightedGridCalculator":
+        """Returns a grid with the same weights and fixed sizes but no
+        geometry."""
+        grid = super()._new_instance()
+        grid._column_weights = self._column_weights
+        grid._row_weights = self._row_weights
+        grid._fixed_column_pixels = self._fixed_column_pixels
+        grid._fixed_row_pixels = self._fixed_row_pixels
+        return grid
+
+    @staticmethod
+    def _point_offset(offsets: list, point: float) -> float:
+        """Returns the pixel offset of a grid point, interpolating within the
+        column or row for part points."""
+        index = int(point)
+        if index == point:
+            return offsets[index]
+        return offsets[index] + (offsets[index + 1] -
+                                 offsets[index]) * (point - index)
+
+    def _get_width_pixels(self, point_needed: float,
+                          geometry: _Geometry) -> int:
+        """Calculate the width point based on the value provided."""
+        return geometry.pixel_start_left + int(
+            self._point_offset(geometry.tables[0], point_needed))
+
+    def _get_height_pixels(self, point_needed: float,
+                           geometry: _Geometry) -> int:
+        """Calculate the height point based on the value provided."""
+        return geometry.pixel_start_top + int(
+            self._point_offset(geometry.tables[1], point_needed))
+
+    def _get_width_cell(self, pixel: int, geometry: _Geometry) -> int:
+        """Calculate the cell containing the width pixel provided."""
+        cell = bisect_left(geometry.tables[0],
+                           pixel - geometry.pixel_start_left + 1) - 1
+        return min(max(cell, 0), geometry.grid_width_max - 1)
+
+    def _get_height_cell(self, pixel: int, geometry: _Geometry) -> int:
+        """Calculate the cell containing the height pixel provided."""
+        cell = bisect_left(geometry.tables[1],
+                           pixel - geometry.pixel_start_top + 1) - 1
+        return min(max(cell, 0), geometry.grid_height_max - 1)
+
+    @property
+    def column_weights(self) -> list:
+        """Returns the weight of each column.
+
+        Returns:
+            list: The column weights from left to right."""
+        return list(self._column_weights)
+
+    @property
+    def row_weights(self) -> list:
+        """Returns the weight of each row.
+
+        Returns:
+            list: The row weights from top to bottom."""
+        return list(self._row_weights)
+
+    def update_weights(self, column_weights: list | None = None,
+                       row_weights: list | None = None,
+                       fixed_column_pixels: dict | None = None,
+                       fixed_row_pixels: dict | None = None) -> None:
+        """Recalculates the grid based on new column and row sizes.  Sizes
+        that aren't provided are kept.
+
+        Parameters:
+            column_weights (list): (Optional) The weight of each column.
+            row_weights (list): (Optional) The weight of each row.
+            fixed_column_pixels (dict): (Optional) The fixed pixel width of
+                                        columns by column index.
+            fixed_row_pixels (dict): (Optional) The fixed pixel height of
+                                     rows by row index."""
+        column_weights = self._column_weights if column_weights is None \
+            else self._check_weights(column_weights, "column")
+        row_weights = self._row_weights if row_weights is None \
+            else self._check_weights(row_weights, "row")
+        fixed_column_pixels = self._check_fixed_pixels(
+            self._fixed_column_pixels if fixed_column_pixels is None
+            else fixed_column_pixels, len(column_weights),
+            self._pixel_end_left - self._pixel_start_left, "column")
+        fixed_row_pixels = self._check_fixed_pixels(
+            self._fixed_row_pixels if fixed_row_pixels is None
+            else fixed_row_pixels, len(row_weights),
+            self._pixel_end_top - self._pixel_start_top, "row")
+        geometry = self._geometry
+        self._check_geometry(geometry.pixel_end_left, geometry.pixel_end_top,
+                             len(column_weights), len(row_weights),
+                             geometry.pixel_start_left,
+                             geometry.pixel_start_top)
+        self._column_weights, self._row_weights = column_weights, row_weights
+        self._fixed_column_pixels = fixed_column_pixels
+        self._fixed_row_pixels = fixed_row_pixels
+        self._set_geometry(geometry.pixel_end_left, geometry.pixel_end_top,
+                           len(column_weights), len(row_weights),
+                           geometry.pixel_start_left, geometry.pixel_start_top)
+
+    def update_grid(self, grid_width_max: int, grid_height_max: int) -> None:
+        """Recalculates the grid based on the provided width and height.
+        New columns and rows have a weight of 1 and removed columns and rows
+        lose their fixed sizes.
+
+        Parameters:
+            grid_width_max (int): The max width point of the grid (right
+                                  border).
+            grid_height_max (int): The max height point of the grid (bottom
+                                   border)."""
+        if grid_width_max < 1:
+            raise GridCalculatorException("Grid width must be greater than 1")
+        if grid_height_max < 1:
+            raise GridCalculatorException("Grid height must be greater "
+                                          "than 1")
+        self.update_weights(
+            (self._column_weights + [1.0] * grid_width_max)[:grid_width_max],
+            (self._row_weights + [1.0] * grid_height_max)[:grid_height_max],
+            {index: pixels for index, pixels in
+             self._fixed_column_pixels.items() if index < grid_width_max},
+            {index: pixels for index, pixels in
+             self._fixed_row_pixels.items() if index < grid_height_max})
+
+    def update_pixel_positions(self, pixel_end_left: int, pixel_end_top: int,
+                               pixel_start_left: int = 0,
+                               pixel_start_top: int = 0) -> None:
+        """Recalculates the pixel positions the grid is based on.
+
+        Parameters:
+            pixel_end_left (int): The right pixel point for use by the grid.
+            pixel_end_top (int): The bottom pixel point for use by the grid.
+            pixel_start_left (int): (Optional) The left pixel point for use by
+                                    the grid (default = 0).
+            pixel_start_top (int): (Optional) The top pixel point for use by
+                                   the grid (default = 0)."""
+        self._check_fixed_pixels(self._fixed_column_pixels,
+                                 self._grid_width_max,
+                                 pixel_end_left - pixel_start_left, "column")
+        self._check_fixed_pixels(self._fixed_row_pixels,
+                                 self._grid_height_max,
+                                 pixel_end_top - pixel_start_top, "row")
+        super().update_pixel_positions(pixel_end_left, pixel_end_top,
+                                       pixel_start_left, pixel_start_top)
@@ -0,0 +1,102 @@
+import unittest
+import numpy
+import pygame
+from pygame_gridcalculator import GridCalculator, GridCalculatorException
+from pygame_gridcalculator.batchsnake import BatchSnake, DOWN, LEFT, RIGHT, \
+    UP
+
+
+class TestBatchSnake(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_snake = BatchSnake(3, 5, 4, seed=0)
+
+    def test_init(self) -> None:
+        """Test every game starts with a single cell snake moving down"""
+        self.assertEqual(len(self.test_snake), 3)
+        self.assertEqual(self.test_snake.size, (5, 4))
+        self.assertEqual(self.test_snake.heads.tolist(), [[2, 2]] * 3)
+        self.assertEqual(self.test_snake.direction.tolist(), [DOWN] * 3)
+        self.assertFalse(self.test_snake.occupied[
+            numpy.arange(3), self.test_snake.fruit].any())
+
+    def test_init_error_grid_too_small(self) -> None:
+        """Test a grid of a single cell errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            BatchSnake(1, 1, 5)
+        self.assertEqual(str(err.exception),
+                         "The grid must be at least 2 cells wide and high")
+
+    def test_step_turns_and_wraps(self) -> None:
+        """Test snakes turn, ignore reversing and wrap around the grid"""
+        self.test_snake.fruit[:] = 0
+        self.test_snake.step([LEFT, UP, -1])
+        self.assertEqual(self.test_snake.heads.tolist(),
+                         [[1, 2], [2, 3], [2, 3]])
+        self.test_snake.step([-1, -1, -1])
+        self.assertEqual(self.test_snake.heads.tolist(),
+                         [[0, 2], [2, 0], [2, 0]])
+        self.test_snake.step([-1, RIGHT, -1])
+        self.assertEqual(self.test_snake.heads.tolist(),
+                         [[4, 2], [3, 0], [2, 1]])
+        self.assertEqual(self.test_snake.occupied.sum(axis=1).tolist(),
+                         [1, 1, 1])
+
+    def test_step_eating_grows_snake(self) -> None:
+        """Test eating fruit grows the snake and moves the fruit"""
+        self.test_snake.fruit[0] = 2 * 4 + 3
+        rewards, done = self.test_snake.step()
+        self.assertEqual(rewards.tolist(), [1, 0, 0])
+        self.assertEqual(done.tolist(), [False] * 3)
+        self.assertEqual(self.test_snake.length.tolist(), [2, 1, 1])
+        self.assertEqual(self.test_snake.scores.tolist(), [1, 0, 0])
+        self.assertEqual(self.test_snake.snake_cells(0), [(2, 2), (2, 3)])
+        self.assertNotIn(self.test_snake.fruit[0], (2 * 4 + 2, 2 * 4 + 3))
+
+    @staticmethod
+    def _feed(snake: BatchSnake, times: int) -> None:
+        """Places the fruit in front of the first snake and steps."""
+        for _ in range(times):
+            left, top = snake.heads[0].tolist()
+            snake.fruit[0] = left * snake.size[1] + (top + 1) % snake.size[1]
+            snake.step()
+
+    def test_step_collision_ends_game(self) -> None:
+        """Test moving into the body ends the game and resets it"""
+        snake = BatchSnake(1, 4, 4, seed=0)
+        self._feed(snake, 3)
+        self.assertEqual(snake.snake_cells(0),
+                         [(2, 2), (2, 3), (2, 0), (2, 1)])
+        rewards, done = snake.step()
+        self.assertEqual(rewards.tolist(), [-1])
+        self.assertTrue(done[0])
+        self.assertEqual(snake.length[0], 1)
+        self.assertTrue(snake.alive[0])
+
+    def test_step_without_auto_reset(self) -> None:
+        """Test ended games stop until reset"""
+        snake = BatchSnake(2, 2, 2, auto_reset=False, seed=0)
+        self._feed(snake, 1)
+        snake.step()
+        self.assertFalse(snake.alive[0])
+        heads = snake.heads[0].tolist()
+        snake.step()
+        self.assertEqual(snake.heads[0].tolist(), heads)
+        snake.reset([0])
+        self.assertTrue(snake.alive[0])
+
+    def test_observations(self) -> None:
+        """Test the board marks the body, head and fruit"""
+        self.test_snake.fruit[:] = 0
+        boards = self.test_snake.observations()
+        self.assertEqual(boards.shape, (3, 5, 4))
+        self.assertEqual(boards[0, 2, 2], 2)
+        self.assertEqual(boards[0, 0, 0], 3)
+        self.assertEqual(boards[0].sum(), 5)
+
+    def test_render(self) -> None:
+        """Test rendering a game through a grid"""
+        surface = pygame.Surface((50, 40))
+        self.test_snake.render(surface, GridCalculator(50, 40, 5, 4), 1)
+        self.assertEqual(surface.get_at((25, 25)), (100, 255, 100))
+        with self.assertRaises(GridCalculatorException):
+            self.test_snake.render(surface, GridCalculator(50, 40, 4, 4))
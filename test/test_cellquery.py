@@ -0,0 +1,74 @@
+import unittest
+import numpy
+from pygame_gridcalculator import GridCalculator
+from pygame_gridcalculator.cellquery import CellQuery
+
+
+def as_cells(result: tuple) -> set:
+    """Converts the index arrays returned into a set of (left, top) cells."""
+    lefts, tops = result
+    return set(zip(lefts.tolist(), tops.tolist()))
+
+
+class TestCellQuery(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_grid = GridCalculator(100, 100, 10, 10)
+        self.test_query = CellQuery(self.test_grid)
+
+    def test_line_horizontal(self) -> None:
+        """Test a horizontal line covers the cells it passes through"""
+        result = self.test_query.line((0.5, 1.5), (3.5, 1.5))
+        self.assertEqual(as_cells(result), {(0, 1), (1, 1), (2, 1), (3, 1)})
+
+    def test_line_diagonal_through_corners(self) -> None:
+        """Test a line through cell corners includes the cells beside them"""
+        result = self.test_query.line((0, 0), (2, 2))
+        self.assertEqual(as_cells(result), {(0, 0), (1, 0), (0, 1), (1, 1)})
+
+    def test_line_shallow(self) -> None:
+        """Test a shallow line covers each cell it crosses"""
+        result = self.test_query.line((0.5, 0.5), (4.5, 1.5))
+        self.assertEqual(as_cells(result), {(0, 0), (1, 0), (2, 0), (2, 1),
+                                            (3, 1), (4, 1)})
+
+    def test_line_reversed(self) -> None:
+        """Test a line covers the same cells in either direction"""
+        self.assertEqual(as_cells(self.test_query.line((4.5, 1.5),
+                                                       (0.5, 0.5))),
+                         as_cells(self.test_query.line((0.5, 0.5),
+                                                       (4.5, 1.5))))
+
+    def test_line_clipped_to_grid(self) -> None:
+        """Test cells outside the grid are left out"""
+        result = self.test_query.line((-2.5, 0.5), (1.5, 0.5))
+        self.assertEqual(as_cells(result), {(0, 0), (1, 0)})
+
+    def test_lines_closed(self) -> None:
+        """Test closed lines include the line back to the start"""
+        result = self.test_query.lines(True, [(0.5, 0.5), (2.5, 0.5),
+                                              (2.5, 2.5)])
+        self.assertIn((1, 1), as_cells(result))
+        self.assertEqual(len(as_cells(result)), 8)
+
+    def test_polygon(self) -> None:
+        """Test a polygon covers the cells inside it"""
+        result = self.test_query.polygon([(1, 1), (4, 1), (4, 3), (1, 3)])
+        expected = {(left, top) for left in range(1, 4) for top in
+                    range(1, 3)}
+        self.assertTrue(expected <= as_cells(result))
+        result = self.test_query.polygon([(1, 1), (4, 1), (4, 3), (1, 3)],
+                                         outline=False)
+        self.assertEqual(as_cells(result), expected)
+
+    def test_circle(self) -> None:
+        """Test a circle covers the cells with their centre inside it"""
+        result = self.test_query.circle((5, 5), 1)
+        self.assertEqual(as_cells(result), {(4, 4), (5, 4), (4, 5), (5, 5)})
+        result = self.test_query.circle((0.5, 0.5), 1)
+        self.assertEqual(as_cells(result), {(0, 0), (1, 0), (0, 1)})
+
+    def test_results_index_cell_data(self) -> None:
+        """Test results can be used directly to index per-cell data"""
+        data = numpy.zeros(self.test_grid.size)
+        data[self.test_query.circle((5, 5), 2)] = 1
+        self.assertEqual(data.sum(), 12)
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+import numpy
+from numpy.lib.format import open_memmap
+from pygame_gridcalculator import GridCalculator, GridCalculatorException
+from pygame_gridcalculator.chunkstore import ChunkedWorld
+
+
+class TestChunkedWorld(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.test_path = os.path.join(self.test_dir.name, "world.npy")
+        ChunkedWorld.create(self.test_path, 4, 3, 8, numpy.int32)
+        store = open_memmap(self.test_path, mode="r+")
+        # Each cell holds its world position as left * 1000 + top
+        lefts, tops = numpy.indices((32, 24))
+        store[...] = (lefts * 1000 + tops).reshape(4, 8, 3, 8) \
+            .transpose(0, 2, 1, 3)
+        store.flush()
+        del store
+        self.test_grid = GridCalculator(100, 100, 10, 10)
+        self.test_world = ChunkedWorld(self.test_path, self.test_grid,
+                                       max_resident_chunks=6)
+
+    def tearDown(self) -> None:
+        self.test_world.close()
+        self.test_dir.cleanup()
+
+    def test_init(self) -> None:
+        """Test opening a world file works as expected"""
+        self.assertEqual(self.test_world.world_size, (32, 24))
+        self.assertEqual(self.test_world.chunk_size, 8)
+        self.assertIsNone(self.test_world.camera)
+        self.assertEqual(self.test_world.resident_chunks, [])
+
+    def test_init_error_max_resident_chunks_too_low(self) -> None:
+        """Test opening a world with no resident chunks errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            ChunkedWorld(self.test_path, self.test_grid, 0)
+        self.assertEqual(str(err.exception),
+                         "The max resident chunks must be greater than 0")
+
+    def test_update_view_pages_in_overlapping_chunks(self) -> None:
+        """Test only the chunks under the view are read"""
+        self.test_world.update_view(5, 3)
+        self.assertEqual(sorted(self.test_world.resident_chunks),
+                         [(0, 0), (0, 1), (1, 0), (1, 1)])
+        window = self.test_world.window
+        self.assertEqual(window.shape, (10, 10))
+        self.assertEqual(window[0, 0], 5003)
+        self.assertEqual(window[9, 9], 14012)
+
+    def test_window_outside_world_is_filled(self) -> None:
+        """Test view cells outside of the world use the fill value"""
+        self.test_world.update_view(28, -2)
+        window = self.test_world.window
+        self.assertEqual(window[0, 0], 0)
+        self.assertEqual(window[0, 2], 28000)
+        self.assertEqual(window[3, 5], 31003)
+        self.assertEqual(window[4, 5], 0)
+
+    def test_update_view_error_too_many_chunks(self) -> None:
+        """Test a view overlapping more chunks than can be resident errors"""
+        self.test_grid.update_grid(20, 20)
+        with self.assertRaises(GridCalculatorException) as err:
+            self.test_world.update_view(4, 4)
+        self.assertEqual(str(err.exception),
+                         "The view overlaps 9 chunks, which is more than the "
+                         "max resident chunks (6)")
+
+    def test_least_recently_used_chunks_evicted(self) -> None:
+        """Test scrolling drops the chunks least recently in view"""
+        world = ChunkedWorld(self.test_path, self.test_grid, 4, prefetch=0)
+        world.update_view(0, 0)
+        world.update_view(16, 0)
+        self.assertEqual(sorted(world.resident_chunks),
+                         [(2, 0), (2, 1), (3, 0), (3, 1)])
+        world.close()
+
+    def test_prefetch_in_scroll_direction(self) -> None:
+        """Test the chunks past the view are read ahead when scrolling"""
+        self.test_world.update_view(0, 0)
+        self.test_world.update_view(1, 0)
+        self.test_world.wait_for_prefetch()
+        self.assertEqual(sorted(self.test_world.resident_chunks),
+                         [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)])
+
+    def test_set_cell_written_back(self) -> None:
+        """Test changed cells are written to the world file"""
+        self.test_world.update_view(0, 0)
+        self.test_world.set_cell(1, 2, -1)
+        self.assertEqual(self.test_world.window[1, 2], -1)
+        self.assertEqual(self.test_world.cell(1, 2), -1)
+        self.test_world.flush()
+        store = open_memmap(self.test_path, mode="r")
+        self.assertEqual(store[0, 0, 1, 2], -1)
+        del store
+
+    def test_set_cell_error_outside_world(self) -> None:
+        """Test setting a cell outside of the world errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            self.test_world.set_cell(32, 0, 1)
+        self.assertEqual(str(err.exception),
+                         "The cell provided ((32, 0)) isn't in the world "
+                         "(0 - 31, 0 - 23)")
+
+    def test_set_cell_error_read_only(self) -> None:
+        """Test setting a cell in a read-only world errors"""
+        world = ChunkedWorld(self.test_path, self.test_grid, read_only=True)
+        with self.assertRaises(GridCalculatorException) as err:
+            world.set_cell(0, 0, 1)
+        self.assertEqual(str(err.exception), "The world is read-only")
+        world.close()
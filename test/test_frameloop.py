@@ -0,0 +1,145 @@
+import asyncio
+import io
+import json
+import unittest
+import pygame
+from pygame_gridcalculator import GridCalculator, GridCalculatorException
+from pygame_gridcalculator.frameloop import FrameLoop
+from pygame_gridcalculator.tracing import FrameTracer
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFrameLoop(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.alphas = []
+        self.updates = []
+
+    def make_loop(self, frame_time: float, frames: int,
+                  **kwargs) -> FrameLoop:
+        """Returns a loop where each frame takes frame_time seconds and
+        which stops after the number of frames provided."""
+        def render(alpha: float) -> None:
+            self.alphas.append(alpha)
+            self.clock.now += frame_time
+            if len(self.alphas) == frames:
+                loop.stop()
+
+        loop = FrameLoop(self.updates.append, render, fps=None,
+                         clock=self.clock, **kwargs)
+        return loop
+
+    def test_fixed_timestep(self) -> None:
+        """Test updates run once per timestep however long frames take and
+        render is given the time left over"""
+        loop = self.make_loop(0.3125, 3, timestep=0.125)
+        asyncio.run(loop.run())
+        self.assertEqual(loop.frames, 3)
+        self.assertEqual(loop.ticks, 5)
+        self.assertEqual(self.updates, [0.125] * 5)
+        self.assertEqual(self.alphas, [0, 0.5, 0])
+        self.assertFalse(loop.running)
+
+    def test_max_updates(self) -> None:
+        """Test a slow frame only runs max updates and drops the rest"""
+        loop = self.make_loop(2.0, 3, timestep=0.125, max_updates=5)
+        asyncio.run(loop.run())
+        self.assertEqual(loop.ticks, 10)
+        self.assertEqual(loop.alpha, 0)
+
+    def test_coroutines_run_alongside(self) -> None:
+        """Test coroutine callbacks are awaited and other tasks keep
+        running between frames"""
+        background = []
+
+        async def update(timestep: float) -> None:
+            await asyncio.sleep(0)
+            self.updates.append(timestep)
+
+        async def render(alpha: float) -> None:
+            self.clock.now += 0.5
+            if loop.frames == 4:
+                loop.stop()
+
+        async def telemetry() -> None:
+            while True:
+                background.append(loop.frames)
+                await asyncio.sleep(0)
+
+        async def main() -> None:
+            task = asyncio.create_task(telemetry())
+            await loop.run()
+            task.cancel()
+
+        loop = FrameLoop(update, render, timestep=0.25, fps=None,
+                         clock=self.clock)
+        asyncio.run(main())
+        self.assertEqual(len(self.updates), 8)
+        self.assertGreaterEqual(len(background), 4)
+
+    def test_resize_event(self) -> None:
+        """Test resizing the window resizes the grid, or calls on_resize if
+        provided"""
+        grid = GridCalculator(100, 100, 5, 5)
+        loop = FrameLoop(None, None, grid=grid)
+        loop.handle_event(pygame.event.Event(pygame.VIDEORESIZE, w=200,
+                                             h=150))
+        self.assertEqual(grid.pixel_size, (200, 150))
+        self.assertIs(loop.shape_factory.grid, grid)
+
+        sizes = []
+        loop = FrameLoop(None, None, grid=grid,
+                         on_resize=lambda *size: sizes.append(size))
+        loop.handle_event(pygame.event.Event(pygame.VIDEORESIZE, w=50,
+                                             h=50))
+        self.assertEqual(sizes, [(50, 50)])
+        self.assertEqual(grid.pixel_size, (200, 150))
+
+    def test_quit_event(self) -> None:
+        """Test quitting stops the loop and events are passed on"""
+        events = []
+        loop = FrameLoop(None, None, on_event=events.append)
+        loop._running = True
+        loop.handle_event(pygame.event.Event(pygame.QUIT))
+        self.assertFalse(loop.running)
+        self.assertEqual(len(events), 1)
+
+    def test_interpolate(self) -> None:
+        """Test interpolating numbers and positions"""
+        self.assertEqual(FrameLoop.interpolate(2, 4, 0.25), 2.5)
+        self.assertEqual(FrameLoop.interpolate((1, 1), (3, 0), 0.5),
+                         (2, 0.5))
+
+    def test_tracer(self) -> None:
+        """Test each frame and its phases are traced"""
+        output = io.StringIO()
+        tracer = FrameTracer(output, clock=self.clock)
+        loop = self.make_loop(0.25, 2, timestep=0.125, tracer=tracer)
+        asyncio.run(loop.run())
+        tracer.close()
+        self.assertEqual(tracer.frames, 2)
+        names = [event["name"] for event in json.loads(output.getvalue())
+                 if event["ph"] == "X"]
+        self.assertEqual(names, ["update", "render", "frame 0",
+                                 "update", "render", "frame 1"])
+
+    def test_invalid_settings(self) -> None:
+        """Test invalid timesteps, fps and max updates error"""
+        with self.assertRaises(GridCalculatorException):
+            FrameLoop(None, None, timestep=0)
+        with self.assertRaises(GridCalculatorException):
+            FrameLoop(None, None, fps=0)
+        with self.assertRaises(GridCalculatorException):
+            FrameLoop(None, None, max_updates=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
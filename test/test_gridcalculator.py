@@ -1,5 +1,8 @@
+import sys
+import threading
 import unittest
-from pygame_gridcalculator import GridCalculator, \
+import pygame
+from pygame_gridcalculator import BoundaryPolicy, GridCalculator, \
     GridCalculatorException
 
 
@@ -104,6 +107,48 @@ class TestGridCalculator(unittest.TestCase):
         self.assertEqual(str(err.exception),
                          "Grid height must be greater than 1")
 
+    def test_geometry_version(self) -> None:
+        """Test the geometry version increases when the grid is updated"""
+        self.assertEqual(self.test_grid.geometry_version, 0)
+        self.test_grid.update_grid(10, 10)
+        self.assertEqual(self.test_grid.geometry_version, 1)
+        self.test_grid.update_pixel_positions(200, 200)
+        self.assertEqual(self.test_grid.geometry_version, 2)
+
+    def test_failed_update_keeps_geometry(self) -> None:
+        """Test an update that fails validation leaves the grid unchanged"""
+        with self.assertRaises(GridCalculatorException):
+            self.test_grid.update_pixel_positions(200, 200, 300, 0)
+        self.assertEqual(self.test_grid.pixel_size, (100, 100))
+        self.assertEqual(self.test_grid.geometry_version, 0)
+        self.assertEqual(self.test_grid.points_from_right(0), 100)
+
+    def test_update_while_reading_on_another_thread(self) -> None:
+        """Test reading the grid while another thread updates it only ever
+        sees a whole geometry"""
+        expected = {(50, 50), (150, 150)}
+        seen = []
+        done = threading.Event()
+
+        def update() -> None:
+            for _ in range(2000):
+                self.test_grid.update_pixel_positions(250, 250, 50, 50)
+                self.test_grid.update_pixel_positions(100, 100)
+            done.set()
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            writer = threading.Thread(target=update)
+            writer.start()
+            while not done.is_set():
+                seen.append(self.test_grid.cell_center(2, 2))
+                self.test_grid.cell_at(99, 99)
+            writer.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        self.assertTrue(set(seen) <= expected, set(seen) - expected)
+
     def test_update_pixel_positions(self) -> None:
         """Test updating the pixel positions works"""
         self.test_grid.update_pixel_positions(120, 120)
@@ -401,6 +446,134 @@ class TestGridCalculator(unittest.TestCase):
                          "The top point provided (-2) isn't in the "
                          "grid (0 - 5)")
 
+    def test_cell_at(self) -> None:
+        """Test getting the cell containing a pixel position."""
+        self.assertEqual(self.test_grid.cell_at(0, 0), (0, 0))
+        self.assertEqual(self.test_grid.cell_at(19, 20), (0, 1))
+        self.assertEqual(self.test_grid.cell_at(100, 99), (4, 4))
+        grid = GridCalculator(100, 100, 3, 3, 10, 10)
+        self.assertEqual(grid.cell_at(39, 40), (0, 1))
+        self.assertEqual(grid.left_point(1), 40)
+
+    def test_cells_at(self) -> None:
+        """Test getting the cells containing several pixel positions."""
+        self.assertEqual(self.test_grid.cells_at([(0, 0), (19, 20)]),
+                         [(0, 0), (0, 1)])
+
+    def test_cell_center_and_vertices(self) -> None:
+        """Test getting the centre and corners of a cell."""
+        self.assertEqual(self.test_grid.cell_center(1, 2), (30, 50))
+        self.assertEqual(self.test_grid.cell_vertices(1, 2),
+                         [(20, 40), (40, 40), (40, 60), (20, 60)])
+
+    def test_translated(self) -> None:
+        """Test a translated grid rounds to the same pixels less the offset
+        and isn't changed by updates to the original grid."""
+        grid = GridCalculator(100, 100, 3, 3, 10, 10,
+                              boundary_policy=BoundaryPolicy.CLAMP)
+        translated = grid.translated(40, 30)
+        self.assertIs(type(translated), GridCalculator)
+        self.assertIs(translated.boundary_policy, BoundaryPolicy.CLAMP)
+        self.assertEqual(translated.size, (3, 3))
+        for point in (0, 0.5, 1, 2, 3):
+            self.assertEqual(translated.left_point(point),
+                             grid.left_point(point) - 40)
+            self.assertEqual(translated.top_point(point),
+                             grid.top_point(point) - 30)
+        self.assertEqual(translated.cell_at(-1, 9), grid.cell_at(39, 39))
+        self.assertEqual(translated.cell_at(0, 10), grid.cell_at(40, 40))
+        grid.update_grid(5, 5)
+        self.assertEqual(translated.size, (3, 3))
+
+    def test_cell_at_error(self) -> None:
+        """Test getting the cell for a pixel outside the grid errors."""
+        with self.assertRaises(GridCalculatorException) as err:
+            self.test_grid.cell_at(101, 0)
+        self.assertEqual(str(err.exception),
+                         "The pixel left position provided (101) isn't in "
+                         "the grid (0 - 100)")
+        with self.assertRaises(GridCalculatorException) as err:
+            self.test_grid.cell_at(0, -1)
+        self.assertEqual(str(err.exception),
+                         "The pixel top position provided (-1) isn't in "
+                         "the grid (0 - 100)")
+
+    def test_boundary_policy_clamp(self) -> None:
+        """Test a clamping grid moves points to the nearest border."""
+        grid = GridCalculator(100, 100, 5, 5,
+                              boundary_policy=BoundaryPolicy.CLAMP)
+        self.assertEqual(grid.left_point(-1), 0)
+        self.assertEqual(grid.top_point(7), 100)
+        self.assertEqual(grid.position(6, -2), (100, 0))
+        self.assertEqual(grid.width_gap(-1, 2), 40)
+        self.assertEqual(grid.square(4, 4, 9, 9), (20, 20))
+        self.assertEqual(grid.points_from_right(7), 0)
+        self.assertEqual(grid.cell_at(150, -5), (4, 0))
+        self.assertEqual(grid.resolve_cell(5, -1), (4, 0))
+
+    def test_boundary_policy_wrap(self) -> None:
+        """Test a wrapping grid moves points to the other side of the
+        grid."""
+        grid = GridCalculator(100, 100, 5, 5,
+                              boundary_policy=BoundaryPolicy.WRAP)
+        self.assertEqual(grid.left_point(-1), 80)
+        self.assertEqual(grid.left_point(5), 100)
+        self.assertEqual(grid.top_point(7), 40)
+        self.assertEqual(grid.position(6, -2), (20, 60))
+        self.assertEqual(grid.cell_at(110, -10), (0, 4))
+        self.assertEqual(grid.resolve_cell(5, -1), (0, 4))
+        self.assertEqual(grid.resolve_cell(2, 3), (2, 3))
+
+    def test_boundary_policy_raise(self) -> None:
+        """Test the default boundary policy raises for cells outside the
+        grid."""
+        self.assertIs(self.test_grid.boundary_policy, BoundaryPolicy.RAISE)
+        with self.assertRaises(GridCalculatorException) as err:
+            self.test_grid.resolve_cell(5, 0)
+        self.assertEqual(str(err.exception),
+                         "The cell provided ((5, 0)) isn't in the grid "
+                         "(0 - 4, 0 - 4)")
+
+    def test_boundary_policy_setter(self) -> None:
+        """Test changing the boundary policy."""
+        self.test_grid.boundary_policy = BoundaryPolicy.CLAMP
+        self.assertEqual(self.test_grid.left_point(10), 100)
+        with self.assertRaises(GridCalculatorException) as err:
+            self.test_grid.boundary_policy = "wrap"
+        self.assertEqual(str(err.exception),
+                         "The boundary policy (wrap) must be a "
+                         "BoundaryPolicy")
+
+    def test_draw_grid_to_surface(self) -> None:
+        """Test drawing the grid draws every line"""
+        surface = pygame.Surface((101, 101))
+        self.test_grid.draw_grid_to_surface(surface, (255, 0, 0))
+        for point in (0, 20, 40, 60, 80, 100):
+            self.assertEqual(surface.get_at((point, 10)),
+                             pygame.Color(255, 0, 0))
+            self.assertEqual(surface.get_at((10, point)),
+                             pygame.Color(255, 0, 0))
+        self.assertEqual(surface.get_at((10, 10)), pygame.Color(0, 0, 0))
+
+    def test_draw_grid_to_surface_min_line_spacing(self) -> None:
+        """Test drawing a dense grid with a minimum line spacing thins the
+        lines but keeps the border"""
+        surface = pygame.Surface((101, 101))
+        grid = GridCalculator(100, 100, 48, 48)
+        grid.draw_grid_to_surface(surface, (255, 0, 0), min_line_spacing=10)
+        drawn = [left for left in range(101)
+                 if surface.get_at((left, 1)) == pygame.Color(255, 0, 0)]
+        self.assertEqual(drawn, [0, 10, 20, 31, 41, 52, 62, 72, 83, 93,
+                                 100])
+
+    def test_draw_grid_to_surface_fill_spacing(self) -> None:
+        """Test drawing a dense grid with a fill spacing fills the grid"""
+        surface = pygame.Surface((101, 101))
+        grid = GridCalculator(100, 100, 50, 50)
+        grid.draw_grid_to_surface(surface, (255, 0, 0), fill_spacing=3)
+        self.assertEqual(surface.get_at((1, 1)), pygame.Color(255, 0, 0))
+        self.assertEqual(surface.get_at((100, 100)), pygame.Color(255, 0, 0))
+
 
 if __name__ == '__main__':
     unittest.main()
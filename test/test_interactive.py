@@ -0,0 +1,127 @@
+import unittest
+import pygame
+from pygame_gridcalculator import GridCalculator, GridCalculatorException
+from pygame_gridcalculator.interactive import RegionRegistry
+
+
+def motion(pos: tuple) -> pygame.event.Event:
+    """Returns a mouse movement event to a pixel position."""
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0),
+                              buttons=(0, 0, 0))
+
+
+class TestRegionRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.grid = GridCalculator(100, 100, 10, 10)
+        self.calls = []
+
+    def make_registries(self) -> list:
+        """Returns a registry that keeps a table and one that only uses the
+        masks, with the same overlapping regions."""
+        registries = [RegionRegistry(self.grid),
+                      RegionRegistry(self.grid, max_table_cells=0)]
+        for registry in registries:
+            registry.add("board", 0, 0, 8, 8)
+            registry.add("button", 2, 2, 2, 1)
+            registry.add("off edge", 9, 9, 5, 5)
+        return registries
+
+    def test_owner(self) -> None:
+        """Test cells are owned by the region added last over them, with or
+        without the table"""
+        table, masks = self.make_registries()
+        self.assertTrue(table.uses_table)
+        self.assertFalse(masks.uses_table)
+        for registry in (table, masks):
+            self.assertEqual(registry.owner(0, 0), "board")
+            self.assertEqual(registry.owner(3, 2), "button")
+            self.assertEqual(registry.owner(3, 3), "board")
+            self.assertEqual(registry.owner(9, 9), "off edge")
+            self.assertIsNone(registry.owner(8, 0))
+            self.assertIsNone(registry.owner(-1, 0))
+            self.assertEqual(registry.owner_at(35, 25), "button")
+            self.assertIsNone(registry.owner_at(150, 20))
+
+    def test_remove_and_move(self) -> None:
+        """Test removing a region hands its cells back to the regions under
+        it and adding a key again moves it to the top"""
+        for registry in self.make_registries():
+            registry.remove("button")
+            self.assertEqual(registry.owner(3, 2), "board")
+            registry.add("board", 5, 5, 1, 1)
+            registry.add("button", 4, 4, 3, 3)
+            self.assertEqual(registry.span("button"), (4, 4, 3, 3))
+            self.assertIsNone(registry.owner(0, 0))
+            self.assertEqual(registry.owner(5, 5), "button")
+            registry.add("board", 5, 5)
+            self.assertEqual(registry.owner(5, 5), "board")
+            self.assertEqual(len(registry), 3)
+            registry.clear()
+            self.assertIsNone(registry.owner(5, 5))
+        with self.assertRaises(GridCalculatorException):
+            registry.add("empty", 0, 0, 0, 1)
+
+    def test_slots_are_compacted(self) -> None:
+        """Test adding and removing many regions keeps the owners"""
+        registry = RegionRegistry(self.grid, max_table_cells=0)
+        registry.add("board", 0, 0, 10, 10)
+        for index in range(500):
+            registry.add(index, index % 10, 0)
+            registry.remove(index)
+        registry.add("top", 1, 1)
+        self.assertLess(max(registry._columns).bit_length(), 100)
+        self.assertEqual(registry.owner(0, 0), "board")
+        self.assertEqual(registry.owner(1, 1), "top")
+
+    def test_events_and_hover(self) -> None:
+        """Test events are routed to the region under them and hover enter
+        and leave are only sent when the region changes"""
+        registry = RegionRegistry(self.grid)
+        for key, span in (("board", (0, 0, 8, 8)), ("button", (2, 2, 2, 1))):
+            registry.add(key, *span,
+                         on_event=lambda *args: self.calls.append(
+                             ("event", args[0], args[2])),
+                         on_enter=lambda key, event: self.calls.append(
+                             ("enter", key)),
+                         on_leave=lambda key, event: self.calls.append(
+                             ("leave", key)))
+        for pos in ((5, 5), (15, 5), (25, 25), (35, 25), (95, 95)):
+            registry.handle_event(motion(pos))
+        self.assertEqual(self.calls, [
+            ("enter", "board"), ("event", "board", (0, 0)),
+            ("event", "board", (1, 0)),
+            ("leave", "board"), ("enter", "button"),
+            ("event", "button", (2, 2)), ("event", "button", (3, 2)),
+            ("leave", "button")])
+        self.assertIsNone(registry.hovered)
+        click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(25, 25),
+                                   button=1)
+        self.assertEqual(registry.handle_event(click), "button")
+        self.assertEqual(registry.hovered, "button")
+        self.calls.clear()
+        registry.handle_event(pygame.event.Event(pygame.WINDOWLEAVE))
+        self.assertEqual(self.calls, [("leave", "button")])
+        self.assertIsNone(registry.handle_event(
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)))
+
+    def test_hover_follows_changes(self) -> None:
+        """Test the hover is worked out again when regions or the grid
+        change under a still mouse"""
+        registry = RegionRegistry(self.grid)
+        registry.add("board", 0, 0, 5, 5)
+        registry.handle_event(motion((25, 25)))
+        registry.add("button", 2, 2)
+        registry.handle_event(motion((25, 25)))
+        self.assertEqual(registry.hovered, "button")
+        self.grid.update_pixel_positions(200, 200)
+        registry.handle_event(motion((25, 25)))
+        self.assertEqual(registry.hovered, "board")
+        self.grid.update_grid(3, 3)
+        self.assertEqual(registry.owner(2, 2), "button")
+        self.assertIsNone(registry.owner(4, 4))
+        registry.remove("board")
+        self.assertIsNone(registry.hovered)
+
+
+if __name__ == '__main__':
+    unittest.main()
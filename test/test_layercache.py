@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+import pygame
+from pygame_gridcalculator import GridCalculator, GridCalculatorException, \
+    HexGridCalculator, WeightedGridCalculator
+from pygame_gridcalculator.layercache import LayerCache
+
+
+class TestLayerCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache = LayerCache(self.directory.name)
+        self.grid = GridCalculator(100, 100, 10, 10)
+        self.draws = 0
+
+    def draw_grid(self, surface: pygame.Surface) -> None:
+        """Draws the grid lines, counting each time it is called."""
+        self.draws += 1
+        self.grid.draw_grid_to_surface(surface, (255, 0, 0))
+
+    def test_layer_is_drawn_once(self) -> None:
+        """Test a layer is drawn the first time and loaded after that, with
+        the same pixels and transparency"""
+        first = self.cache.layer(self.grid, (101, 101), self.draw_grid,
+                                 (255, 0, 0), "grid lines")
+        second = LayerCache(self.directory.name).layer(
+            self.grid, (101, 101), self.draw_grid, (255, 0, 0), "grid lines")
+        self.assertEqual(self.draws, 1)
+        self.assertEqual(second.get_size(), (101, 101))
+        self.assertEqual(pygame.image.tobytes(second, "RGBA"),
+                         pygame.image.tobytes(first, "RGBA"))
+        self.assertEqual(second.get_at((0, 0)), (255, 0, 0, 255))
+        self.assertEqual(second.get_at((5, 5)).a, 0)
+
+    def test_keys(self) -> None:
+        """Test keys change with the geometry, size, colours and commands
+        but not the number of grid updates"""
+        key = LayerCache.key(self.grid, (101, 101), (255, 0, 0), "lines")
+        self.assertEqual(len(key), 64)
+        same = GridCalculator(100, 100, 5, 5)
+        same.update_grid(10, 10)
+        self.assertEqual(LayerCache.key(same, (101, 101), (255, 0, 0),
+                                        "lines"), key)
+        others = {
+            LayerCache.key(GridCalculator(100, 100, 10, 5), (101, 101),
+                           (255, 0, 0), "lines"),
+            LayerCache.key(self.grid, (100, 101), (255, 0, 0), "lines"),
+            LayerCache.key(self.grid, (101, 101), (255, 0, 1), "lines"),
+            LayerCache.key(self.grid, (101, 101), (255, 0, 0), "border"),
+            LayerCache.key(self.grid, (101, 101), (255, 0, 0), b"lines"),
+            LayerCache.key(HexGridCalculator(100, 100, 10, 10), (101, 101),
+                           (255, 0, 0), "lines"),
+            LayerCache.key(WeightedGridCalculator(100, 100, [1] * 10,
+                                                  [1] * 9 + [2]),
+                           (101, 101), (255, 0, 0), "lines")
+        }
+        self.assertEqual(len(others), 7)
+        self.assertNotIn(key, others)
+        with self.assertRaises(GridCalculatorException):
+            LayerCache.key(self.grid, (101, 101), commands=object())
+
+    def test_least_recently_used_evicted(self) -> None:
+        """Test the least recently used layers are deleted once the cache is
+        full, and the order is kept between runs"""
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+        layer_bytes = 10 * 10 * 4 + 13
+        cache = LayerCache(self.directory.name, max_bytes=layer_bytes * 2)
+        cache.put("a", surface)
+        cache.put("b", surface)
+        os.utime(os.path.join(self.directory.name, "a.layer"), ns=(1, 1))
+        os.utime(os.path.join(self.directory.name, "b.layer"), ns=(2, 2))
+        cache = LayerCache(self.directory.name, max_bytes=layer_bytes * 2)
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", surface)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.total_bytes, layer_bytes * 2)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertFalse(os.path.exists(
+            os.path.join(self.directory.name, "b.layer")))
+        cache.clear()
+        self.assertEqual(os.listdir(self.directory.name), [])
+        with self.assertRaises(GridCalculatorException):
+            LayerCache(self.directory.name, max_bytes=100).put("a", surface)
+
+    def test_damaged_layer_is_a_miss(self) -> None:
+        """Test a damaged layer file is deleted and drawn again"""
+        self.cache.layer(self.grid, (101, 101), self.draw_grid)
+        key = LayerCache.key(self.grid, (101, 101))
+        path = os.path.join(self.directory.name, key + ".layer")
+        with open(path, "r+b") as file:
+            file.truncate(100)
+        cache = LayerCache(self.directory.name)
+        self.assertIsNone(cache.get(key))
+        self.assertFalse(os.path.exists(path))
+        cache.layer(self.grid, (101, 101), self.draw_grid)
+        self.assertEqual(self.draws, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from pygame_gridcalculator.lrucache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_cache = LRUCache(2)
+
+    def test_init_error_max_size_too_low(self) -> None:
+        """Test initialising the cache with a 0 max size errors"""
+        with self.assertRaises(ValueError) as err:
+            LRUCache(0)
+        self.assertEqual(str(err.exception),
+                         "The cache max size must be greater than 0")
+
+    def test_get_and_put(self) -> None:
+        """Test values put into the cache can be retrieved"""
+        self.test_cache.put("a", 1)
+        self.assertEqual(self.test_cache.get("a"), 1)
+        self.assertIsNone(self.test_cache.get("b"))
+        self.assertEqual(self.test_cache.get("b", 2), 2)
+
+    def test_put_evicts_least_recently_used(self) -> None:
+        """Test the least recently used entry is evicted when full"""
+        self.test_cache.put("a", 1)
+        self.test_cache.put("b", 2)
+        self.test_cache.get("a")
+        self.test_cache.put("c", 3)
+        self.assertIn("a", self.test_cache)
+        self.assertNotIn("b", self.test_cache)
+        self.assertEqual(len(self.test_cache), 2)
+
+    def test_clear(self) -> None:
+        """Test clearing the cache removes all entries"""
+        self.test_cache.put("a", 1)
+        self.test_cache.clear()
+        self.assertEqual(len(self.test_cache), 0)
+
+    def test_put_returns_evicted_entry(self) -> None:
+        """Test put returns the entry it evicts so it can be written back"""
+        self.assertIsNone(self.test_cache.put("a", 1))
+        self.assertIsNone(self.test_cache.put("b", 2))
+        self.assertEqual(self.test_cache.put("c", 3), ("a", 1))
+        self.assertEqual(self.test_cache.items(), [("b", 2), ("c", 3)])
+        self.assertEqual(self.test_cache.pop("b"), 2)
+        self.assertNotIn("b", self.test_cache)
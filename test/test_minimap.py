@@ -0,0 +1,69 @@
+import unittest
+import numpy
+import pygame
+from pygame_gridcalculator import GridCalculator, GridCalculatorException
+from pygame_gridcalculator.minimap import Minimap
+
+
+class TestMinimap(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_data = numpy.zeros((10, 10), dtype=numpy.int32)
+        self.test_data[1, 1] = 5
+        self.test_data[9, 9] = 7
+        self.test_grid = GridCalculator(40, 40, 4, 4)
+        self.test_minimap = Minimap(self.test_data, self.test_grid)
+
+    def test_values_max(self) -> None:
+        """Test the data is reduced to the max value per block"""
+        values = self.test_minimap.values
+        self.assertEqual(values.shape, (4, 4))
+        self.assertEqual(values[0, 0], 5)
+        self.assertEqual(values[3, 3], 7)
+        self.assertEqual(values.sum(), 12)
+
+    def test_values_mean_and_any(self) -> None:
+        """Test the data is reduced to the mean and any value per block"""
+        minimap = Minimap(self.test_data, GridCalculator(10, 10, 2, 2),
+                          "mean")
+        self.assertAlmostEqual(minimap.values[0, 0], 0.2)
+        minimap = Minimap(self.test_data, GridCalculator(10, 10, 2, 2),
+                          "any")
+        self.assertEqual(minimap.values.tolist(), [[True, False],
+                                                   [False, True]])
+
+    def test_init_error_invalid_reduction(self) -> None:
+        """Test initialising with an unknown reduction errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            Minimap(self.test_data, self.test_grid, "median")
+        self.assertEqual(str(err.exception),
+                         "The reduction provided (median) must be one of "
+                         "max, min, mean, any")
+
+    def test_init_error_too_many_blocks(self) -> None:
+        """Test initialising with more blocks than cells errors"""
+        with self.assertRaises(GridCalculatorException):
+            Minimap(numpy.zeros((2, 2)), self.test_grid)
+
+    def test_set_cells_updates_blocks(self) -> None:
+        """Test changing cells only updates the blocks containing them"""
+        self.test_minimap.set_cells([5, 0], [5, 9], [9, 3])
+        self.assertEqual(self.test_minimap._dirty, {(2, 2), (0, 3)})
+        values = self.test_minimap.values
+        self.assertEqual(values[2, 2], 9)
+        self.assertEqual(values[0, 3], 3)
+        self.assertEqual(values[0, 0], 5)
+
+    def test_resized_grid_rebuilds(self) -> None:
+        """Test resizing the minimap grid recalculates every block"""
+        self.test_grid.update_grid(2, 2)
+        self.assertEqual(self.test_minimap.values.shape, (2, 2))
+
+    def test_draw(self) -> None:
+        """Test drawing the minimap scales it to the minimap grid"""
+        surface = pygame.Surface((40, 40))
+        result = self.test_minimap.draw(surface, (0, 0, 0), (255, 255, 255))
+        self.assertEqual(result, pygame.Rect(0, 0, 40, 40))
+        self.assertEqual(surface.get_at((35, 35)),
+                         pygame.Color(255, 255, 255))
+        self.assertEqual(surface.get_at((5, 5)), pygame.Color(182, 182, 182))
+        self.assertEqual(surface.get_at((15, 5)), pygame.Color(0, 0, 0))
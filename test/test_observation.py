@@ -0,0 +1,79 @@
+import unittest
+from pygame_gridcalculator import GridCalculatorException
+from pygame_gridcalculator.observation import SceneRasterizer
+from pygame_gridcalculator.scene import Scene
+
+
+class TestSceneRasterizer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_scene = Scene(6, 5, (255, 255, 255))
+        self.test_scene.draw_rect((255, 0, 0), 1, 1, 2, 2)
+        self.test_scene.draw_line((0, 255, 0), (0, 4.5), (6, 4.5))
+        self.test_scene.draw_circle((0, 0, 255), (4.5, 1.5), 1)
+        self.test_scene.draw_grid()
+
+    def test_init_error_one_hot_without_palette(self) -> None:
+        """Test one-hot observations need a palette"""
+        with self.assertRaises(GridCalculatorException) as err:
+            SceneRasterizer(one_hot=True)
+        self.assertEqual(str(err.exception),
+                         "A palette must be provided for one-hot "
+                         "observations")
+
+    def test_rasterize_rgb(self) -> None:
+        """Test each cell holds the color last drawn in it"""
+        cells = SceneRasterizer().rasterize(self.test_scene)
+        self.assertEqual(cells.shape, (6, 5, 3))
+        self.assertEqual(cells[0, 0].tolist(), [255, 255, 255])
+        self.assertEqual(cells[2, 2].tolist(), [255, 0, 0])
+        self.assertEqual(cells[3, 4].tolist(), [0, 255, 0])
+        self.assertEqual(cells[4, 1].tolist(), [0, 0, 255])
+        self.assertEqual(cells[4, 0].tolist(), [0, 0, 255])
+        self.assertEqual(cells[5, 0].tolist(), [255, 255, 255])
+
+    def test_rasterize_palette(self) -> None:
+        """Test cells hold palette indexes, with 0 for other colors"""
+        rasterizer = SceneRasterizer([(255, 0, 0), (0, 0, 255)])
+        cells = rasterizer.rasterize(self.test_scene)
+        self.assertEqual(cells.shape, (6, 5))
+        self.assertEqual(cells.T.tolist(), [[0, 0, 0, 0, 2, 0],
+                                            [0, 1, 1, 2, 2, 2],
+                                            [0, 1, 1, 0, 2, 0],
+                                            [0, 0, 0, 0, 0, 0],
+                                            [0, 0, 0, 0, 0, 0]])
+
+    def test_rasterize_palette_hidden_by_other_colors(self) -> None:
+        """Test colors not in the palette hide the palette colors under
+        them, but not one-hot channels"""
+        self.test_scene.draw_rect((0, 255, 0), 2, 1, 1, 2)
+        palette = [(255, 0, 0), (0, 0, 255)]
+        cells = SceneRasterizer(palette).rasterize(self.test_scene)
+        self.assertEqual(cells[1:3, 1:3].tolist(), [[1, 1], [0, 0]])
+        cells = SceneRasterizer(palette, True).rasterize(self.test_scene)
+        self.assertEqual(cells[2, 1].tolist(), [True, False])
+
+    def test_query_cache_is_bounded(self) -> None:
+        """Test a CellQuery is only kept for the most recent grid sizes"""
+        rasterizer = SceneRasterizer(query_cache_size=2)
+        for width in range(3, 7):
+            rasterizer.rasterize(Scene(width, 4))
+        self.assertEqual(len(rasterizer._queries), 2)
+        self.assertIn((6, 4), rasterizer._queries)
+
+    def test_rasterize_one_hot(self) -> None:
+        """Test overlapping colors each get their own channel"""
+        self.test_scene.draw_rect((0, 0, 255), 2, 2, 1, 1, 1)
+        rasterizer = SceneRasterizer([(255, 0, 0), (0, 0, 255)], True)
+        cells = rasterizer.rasterize(self.test_scene)
+        self.assertEqual(cells.shape, (6, 5, 2))
+        self.assertEqual(cells[2, 2].tolist(), [True, True])
+        self.assertEqual(cells[1, 1].tolist(), [True, False])
+        self.assertEqual(int(cells[..., 1].sum()), 6)
+
+    def test_rasterize_outlines(self) -> None:
+        """Test outlined rects only cover their edge cells"""
+        scene = Scene(4, 4)
+        scene.draw_rect((255, 0, 0), 0, 0, 4, 4, 1)
+        cells = SceneRasterizer([(255, 0, 0)]).rasterize(scene)
+        self.assertEqual(int(cells.sum()), 12)
+        self.assertEqual(cells[1:3, 1:3].sum(), 0)
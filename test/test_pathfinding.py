@@ -0,0 +1,125 @@
+import math
+import unittest
+import numpy
+from pygame_gridcalculator import GridCalculator, GridCalculatorException
+from pygame_gridcalculator.pathfinding import PathFinder
+
+
+class TestPathFinder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_grid = GridCalculator(100, 100, 5, 5)
+        # A wall down the middle column with a gap at the bottom
+        self.test_costs = numpy.ones((5, 5))
+        self.test_costs[2, 0:4] = 0
+        self.test_path_finder = PathFinder(self.test_grid, self.test_costs)
+
+    def test_init_error_costs_wrong_shape(self) -> None:
+        """Test initialising with costs that don't match the grid errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            PathFinder(self.test_grid, numpy.ones((4, 5)))
+        self.assertEqual(str(err.exception),
+                         "The costs shape ((4, 5)) must match the grid size "
+                         "((5, 5))")
+
+    def test_find_path(self) -> None:
+        """Test finding a path routes around impassable cells"""
+        path = self.test_path_finder.find_path((0, 0), (4, 0))
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (4, 0))
+        self.assertIn((2, 4), path)
+        self.assertEqual(len(path), 13)
+        for (left1, top1), (left2, top2) in zip(path, path[1:]):
+            self.assertEqual(abs(left1 - left2) + abs(top1 - top2), 1)
+
+    def test_find_path_diagonal(self) -> None:
+        """Test finding a path with diagonal moves allowed"""
+        path_finder = PathFinder(self.test_grid, diagonal=True)
+        self.assertEqual(path_finder.find_path((0, 0), (4, 4)),
+                         [(0, 0), (1, 1), (2, 2), (3, 3), (4, 4)])
+
+    def test_find_path_no_route(self) -> None:
+        """Test finding a path to an unreachable cell returns no path"""
+        self.test_path_finder.set_cost(2, 4, 0)
+        self.assertEqual(self.test_path_finder.find_path((0, 0), (4, 0)), [])
+
+    def test_find_path_error_cell_not_in_grid(self) -> None:
+        """Test finding a path from outside the grid errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            self.test_path_finder.find_path((5, 0), (0, 0))
+        self.assertEqual(str(err.exception),
+                         "The cell provided ((5, 0)) isn't in the grid "
+                         "(0 - 4, 0 - 4)")
+
+    def test_find_path_weighted(self) -> None:
+        """Test finding a path avoids expensive cells"""
+        costs = numpy.ones((5, 1))
+        costs[2, 0] = 10
+        grid = GridCalculator(100, 100, 5, 1)
+        path_finder = PathFinder(grid, costs)
+        self.assertEqual(len(path_finder.find_path((0, 0), (4, 0))), 5)
+        self.assertEqual(path_finder.distance_map([(0, 0)])[4, 0], 13)
+
+    def test_distance_map(self) -> None:
+        """Test the distance map measures from the nearest source"""
+        distances = self.test_path_finder.distance_map([(0, 0), (4, 4)])
+        self.assertEqual(distances[0, 0], 0)
+        self.assertEqual(distances[4, 0], 4)
+        self.assertEqual(distances[1, 3], 4)
+        self.assertEqual(distances[2, 0], math.inf)
+
+    def test_flow_field(self) -> None:
+        """Test following the flow field reaches the goal"""
+        field = self.test_path_finder.flow_field([(4, 0)])
+        self.assertEqual(field.shape, (5, 5, 2))
+        self.assertEqual(tuple(field[4, 0]), (0, 0))
+        left, top = 0, 0
+        for _ in range(12):
+            step_left, step_top = field[left, top]
+            left, top = left + step_left, top + step_top
+        self.assertEqual((left, top), (4, 0))
+
+    def test_flow_field_weighted(self) -> None:
+        """Test following the flow field on a weighted grid costs the same
+        as the cheapest route, with and without diagonal moves"""
+        grid = GridCalculator(100, 100, 8, 8)
+        random = numpy.random.default_rng(3)
+
+        def route_cost(costs: numpy.ndarray, route: list) -> float:
+            return sum(costs[cell] * math.dist(previous, cell)
+                       for previous, cell in zip(route, route[1:]))
+
+        for diagonal in (False, True):
+            for _ in range(10):
+                costs = random.choice([1.0, 3.0, 5.0], size=(8, 8))
+                goal = tuple(int(value)
+                             for value in random.integers(8, size=2))
+                path_finder = PathFinder(grid, costs, diagonal)
+                field = path_finder.flow_field([goal])
+                for left in range(8):
+                    for top in range(8):
+                        route = [(left, top)]
+                        while route[-1] != goal:
+                            step = field[route[-1]]
+                            route.append((route[-1][0] + int(step[0]),
+                                          route[-1][1] + int(step[1])))
+                            self.assertLessEqual(len(route), 64)
+                        self.assertAlmostEqual(
+                            route_cost(costs, route),
+                            route_cost(costs, path_finder.find_path(
+                                (left, top), goal)))
+
+    def test_resized_grid_error(self) -> None:
+        """Test using the costs after resizing the grid errors"""
+        self.test_grid.update_grid(10, 10)
+        with self.assertRaises(GridCalculatorException):
+            self.test_path_finder.distance_map([(0, 0)])
+        self.test_path_finder.set_costs(None)
+        self.assertEqual(self.test_path_finder.distance_map([(0, 0)]).shape,
+                         (10, 10))
+
+    def test_to_pixels(self) -> None:
+        """Test converting a path to pixel positions"""
+        self.assertEqual(self.test_path_finder.to_pixels([(0, 0), (1, 0)]),
+                         [(10, 10), (30, 10)])
+        self.assertEqual(self.test_path_finder.to_pixels([(1, 1)], False),
+                         [(20, 20)])
@@ -0,0 +1,188 @@
+import io
+import os
+import tempfile
+import unittest
+import pygame
+from pygame_gridcalculator import GridCalculator, GridCalculatorException, \
+    HexGridCalculator, WeightedGridCalculator
+from pygame_gridcalculator.recorder import DrawPlayer, DrawRecorder, \
+    RecordingShapeFactory
+
+
+class TestRecorder(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.font.init()
+        self.surface = pygame.Surface((101, 101))
+        self.grid = GridCalculator(100, 100, 10, 10)
+
+    def draw_frame(self, shape_factory: RecordingShapeFactory,
+                   offset: float) -> None:
+        """Draws one frame of every kind of command."""
+        image = pygame.Surface((4, 4), pygame.SRCALPHA)
+        image.fill((0, 0, 255, 128))
+        shape_factory.fill(self.surface, (255, 255, 255))
+        shape_factory.draw_grid_to_surface(self.surface, (200, 200, 200))
+        shape_factory.draw_line(self.surface, (255, 0, 0), (offset, 0),
+                                (10, 9.5), 2)
+        shape_factory.draw_lines(self.surface, (0, 255, 0), True,
+                                 [(1, 1), (5, 2), (3, offset)])
+        shape_factory.draw_aaline(self.surface, (0, 0, 0), (0, 10), (10, 0))
+        shape_factory.draw_polygon(self.surface, (0, 0, 255),
+                                   [(6, 6), (9, 6), (offset, 9)])
+        shape_factory.draw_circle(self.surface, (255, 0, 255),
+                                  (5.5, 5.5), 12, 3, draw_top_left=False)
+        shape_factory.draw_cell(self.surface, (50, 50, 50), 2, 7)
+        shape_factory.draw_text(self.surface, "Hi", (0, 0, 0), 0, 8, 3, 2)
+        shape_factory.blit_image(self.surface, image, 7, 1, 2, 2)
+
+    def record(self, log, frames: int = 3, compress: bool = True) -> list:
+        """Records frames to the log and returns the pixels of each."""
+        pixels = []
+        with DrawRecorder(log, compress) as recorder:
+            shape_factory = RecordingShapeFactory(self.grid, recorder)
+            for frame in range(frames):
+                self.draw_frame(shape_factory, frame + 0.5)
+                recorder.frame()
+                pixels.append(pygame.image.tobytes(self.surface, "RGB"))
+            self.assertEqual(recorder.frames, frames)
+        return pixels
+
+    def replay(self, log) -> list:
+        """Replays the log and returns the pixels of each frame."""
+        pixels = []
+        with DrawPlayer(log) as player:
+            player.play(lambda frame, surfaces: pixels.append(
+                pygame.image.tobytes(surfaces[0], "RGB")))
+        return pixels
+
+    def test_replay_matches_recording(self) -> None:
+        """Test replaying a compressed log draws the same pixels"""
+        log = io.BytesIO()
+        recorded = self.record(log)
+        log.seek(0)
+        self.assertEqual(self.replay(log), recorded)
+
+    def test_replay_uncompressed(self) -> None:
+        """Test replaying an uncompressed log draws the same pixels, and
+        compression makes the log smaller"""
+        log, compressed = io.BytesIO(), io.BytesIO()
+        recorded = self.record(log, compress=False)
+        self.record(compressed)
+        self.assertLess(len(compressed.getvalue()), len(log.getvalue()))
+        log.seek(0)
+        self.assertEqual(self.replay(log), recorded)
+
+    def test_replay_from_file(self) -> None:
+        """Test recording to and replaying from a path"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "session.pgdr")
+            recorded = self.record(path, frames=2)
+            self.assertEqual(self.replay(path), recorded)
+
+    def test_geometry_changes(self) -> None:
+        """Test grid updates and other grid types are replayed"""
+        log = io.BytesIO()
+        pixels = []
+        hex_grid = HexGridCalculator(100, 100, 5, 5)
+        # Fixed sizes can be part pixels
+        weighted = WeightedGridCalculator(100, 100, [1, 3], [2, 1],
+                                          fixed_column_pixels={0: 10.5},
+                                          fixed_row_pixels={1: 20})
+        with DrawRecorder(log) as recorder:
+            plain_factory = RecordingShapeFactory(self.grid, recorder)
+            hex_factory = RecordingShapeFactory(hex_grid, recorder)
+            weighted_factory = RecordingShapeFactory(weighted, recorder)
+            for size in (10, 4):
+                self.grid.update_grid(size, size)
+                plain_factory.fill(self.surface, (0, 0, 0))
+                plain_factory.draw_grid_to_surface(self.surface,
+                                                   (255, 255, 255))
+                hex_factory.draw_cell(self.surface, (255, 0, 0), 1, 1)
+                weighted_factory.draw_polygon(self.surface, (0, 255, 0),
+                                              [(0, 0), (1, 1), (0, 2)])
+                plain_factory.draw_line(self.surface, (0, 0, 255), (0, 0),
+                                        (3, 3))
+                recorder.frame()
+                pixels.append(pygame.image.tobytes(self.surface, "RGB"))
+        log.seek(0)
+        self.assertEqual(self.replay(log), pixels)
+
+    def test_alpha_surface(self) -> None:
+        """Test surfaces with per pixel alpha are replayed with their
+        alpha"""
+        log = io.BytesIO()
+        surface = pygame.Surface((101, 101), pygame.SRCALPHA)
+        with DrawRecorder(log) as recorder:
+            shape_factory = RecordingShapeFactory(self.grid, recorder)
+            shape_factory.draw_cell(surface, (255, 0, 0, 128), 2, 2)
+            recorder.frame()
+        log.seek(0)
+        with DrawPlayer(log) as player:
+            player.play()
+            replayed = player.surfaces[0]
+        self.assertTrue(replayed.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(replayed.get_at((25, 25)), (255, 0, 0, 128))
+        self.assertEqual(replayed.get_at((5, 5)), (0, 0, 0, 0))
+        self.assertEqual(pygame.image.tobytes(replayed, "RGBA"),
+                         pygame.image.tobytes(surface, "RGBA"))
+
+    def test_subsurfaces(self) -> None:
+        """Test draws through subsurfaces reach their parent on replay, and
+        new subsurfaces of the same area reuse one replayed subsurface"""
+        log = io.BytesIO()
+        with DrawRecorder(log) as recorder:
+            shape_factory = RecordingShapeFactory(self.grid, recorder)
+            view = shape_factory.subsurface(self.surface, 5, 5, 5, 5)
+            view_factory = RecordingShapeFactory(GridCalculator(50, 50, 5, 5),
+                                                 recorder)
+            for frame in range(2):
+                view_factory.draw_cell(view, (255, 0, 0), frame, 0)
+                view_factory.draw_cell(self.surface.subsurface(
+                    (0, 0, 20, 20)), (0, 255, 0), 0, frame)
+                recorder.frame()
+        self.assertEqual(self.surface.get_at((52, 52)), (255, 0, 0))
+        log.seek(0)
+        with DrawPlayer(log) as player:
+            player.play()
+            surfaces = player.surfaces
+        self.assertEqual(len(surfaces), 3)
+        self.assertIs(surfaces[1].get_parent(), surfaces[0])
+        self.assertEqual(pygame.image.tobytes(surfaces[0], "RGB"),
+                         pygame.image.tobytes(self.surface, "RGB"))
+
+    def test_play_max_frames(self) -> None:
+        """Test replaying part of a log and carrying on"""
+        log = io.BytesIO()
+        self.record(log, frames=3)
+        log.seek(0)
+        player = DrawPlayer(log)
+        self.assertEqual(player.play(max_frames=2), 2)
+        self.assertEqual(player.frames, 2)
+        self.assertEqual(player.grid.size, (10, 10))
+        self.assertEqual(player.play(), 1)
+        self.assertEqual(player.play(), 0)
+
+    def test_invalid_logs(self) -> None:
+        """Test logs that aren't draw logs or are cut short error"""
+        with self.assertRaises(GridCalculatorException):
+            DrawPlayer(io.BytesIO(b"PNG image data"))
+        log = io.BytesIO()
+        self.record(log, frames=1, compress=False)
+        with self.assertRaises(GridCalculatorException):
+            DrawPlayer(io.BytesIO(log.getvalue()[:40])).play()
+        # A record type no draw command uses
+        unknown = io.BytesIO(log.getvalue() + bytes([255]) + bytes(6))
+        with self.assertRaises(GridCalculatorException):
+            DrawPlayer(unknown).play()
+
+    def test_closed_recorder(self) -> None:
+        """Test drawing with a closed recorder errors"""
+        recorder = DrawRecorder(io.BytesIO())
+        shape_factory = RecordingShapeFactory(self.grid, recorder)
+        recorder.close()
+        with self.assertRaises(GridCalculatorException):
+            shape_factory.draw_cell(self.surface, (0, 0, 0), 0, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
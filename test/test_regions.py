@@ -0,0 +1,93 @@
+import unittest
+import numpy
+import pygame
+from pygame_gridcalculator import GridCalculator, GridCalculatorException
+from pygame_gridcalculator.regions import RegionLabeler
+
+
+class TestRegionLabeler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_grid = GridCalculator(50, 50, 5, 5)
+        # Two diagonal cells, a block touching the right border and a cell
+        # touching the left border on the same row
+        self.test_data = numpy.zeros((5, 5), dtype=numpy.int8)
+        self.test_data[0, 0] = 1
+        self.test_data[1, 1] = 1
+        self.test_data[3:5, 3] = 2
+        self.test_data[0, 3] = 2
+
+    def test_init_error_invalid_connectivity(self) -> None:
+        """Test initialising with an unsupported connectivity errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            RegionLabeler(self.test_grid, 6)
+        self.assertEqual(str(err.exception),
+                         "The connectivity provided (6) must be 4 or 8")
+
+    def test_label_4_connectivity(self) -> None:
+        """Test labeling only connects cells through their sides"""
+        regions = RegionLabeler(self.test_grid).label(self.test_data)
+        self.assertEqual(regions.count, 4)
+        self.assertEqual(regions.labels[0, 0], 1)
+        self.assertEqual(regions.labels[0, 3], 2)
+        self.assertEqual(regions.labels[1, 1], 3)
+        self.assertEqual(regions.labels[3, 3], regions.labels[4, 3])
+        self.assertEqual(regions.labels[2, 2], 0)
+        self.assertEqual(regions.sizes.tolist(), [20, 1, 1, 1, 2])
+
+    def test_label_8_connectivity(self) -> None:
+        """Test labeling connects cells through their corners"""
+        regions = RegionLabeler(self.test_grid, 8).label(self.test_data)
+        self.assertEqual(regions.count, 3)
+        self.assertEqual(regions.labels[0, 0], regions.labels[1, 1])
+
+    def test_label_wrap(self) -> None:
+        """Test labeling with wrap connects cells across the borders"""
+        regions = RegionLabeler(self.test_grid, wrap=True).label(
+            self.test_data)
+        self.assertEqual(regions.count, 3)
+        self.assertEqual(regions.labels[0, 3], regions.labels[4, 3])
+        self.assertEqual(regions.bounds[regions.labels[0, 3] - 1].tolist(),
+                         [0, 3, 5, 1])
+
+    def test_label_no_background(self) -> None:
+        """Test labeling without a background labels every cell"""
+        regions = RegionLabeler(self.test_grid).label(self.test_data, None)
+        self.assertEqual(regions.count, 5)
+        self.assertEqual(regions.sizes[0], 0)
+
+    def test_label_long_region(self) -> None:
+        """Test labeling a winding region gives it a single label"""
+        data = numpy.zeros((50, 50), dtype=bool)
+        data[::2, :] = True
+        data[1::4, 0] = True
+        data[3::4, 49] = True
+        regions = RegionLabeler(GridCalculator(50, 50, 50, 50)).label(data)
+        self.assertEqual(regions.count, 1)
+
+    def test_label_error_wrong_shape(self) -> None:
+        """Test labeling data that doesn't match the grid errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            RegionLabeler(self.test_grid).label(numpy.zeros((4, 5)))
+        self.assertEqual(str(err.exception),
+                         "The data shape ((4, 5)) must match the grid size "
+                         "((5, 5))")
+
+    def test_bounds_and_rects(self) -> None:
+        """Test region bounds convert to pixel Rects"""
+        regions = RegionLabeler(self.test_grid).label(self.test_data)
+        self.assertEqual(regions.bounds.tolist(), [[0, 0, 1, 1],
+                                                   [0, 3, 1, 1],
+                                                   [1, 1, 1, 1],
+                                                   [3, 3, 2, 1]])
+        self.assertEqual(regions.rect(4), pygame.Rect(30, 30, 20, 10))
+        self.assertEqual(len(regions.rects()), 4)
+        with self.assertRaises(GridCalculatorException):
+            regions.rect(5)
+
+    def test_flood_fill(self) -> None:
+        """Test flood filling finds the connected cells with equal values"""
+        mask = RegionLabeler(self.test_grid).flood_fill(self.test_data, 2, 2)
+        self.assertEqual(mask.sum(), 20)
+        self.assertFalse(mask[0, 0])
+        mask = RegionLabeler(self.test_grid).flood_fill(self.test_data, 3, 3)
+        self.assertEqual(mask.sum(), 2)
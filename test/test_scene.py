@@ -0,0 +1,117 @@
+import os
+import pickle
+import tempfile
+import unittest
+import pygame
+from pygame_gridcalculator import GridCalculator, GridCalculatorException, \
+    ShapeFactory
+from pygame_gridcalculator.export import export_frames
+from pygame_gridcalculator.scene import Scene
+
+
+def _scene_for_frame(frame: int) -> Scene:
+    scene = Scene(4, 4, (255, 255, 255))
+    scene.draw_rect((255, 0, 0), frame, 0, 1, 1)
+    return scene
+
+
+class TestScene(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_scene = Scene(4, 4, (255, 255, 255))
+        self.test_scene.draw_rect((255, 0, 0), 1, 1, 2, 1)
+        self.test_scene.draw_circle((0, 0, 255), (3.5, 3.5), 0.25)
+        self.test_scene.draw_line((0, 255, 0), (0, 4), (4, 0))
+        self.test_scene.draw_grid()
+
+    def test_init_error_grid_too_small(self) -> None:
+        """Test a scene grid of 0 cells errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            Scene(0, 4)
+        self.assertEqual(str(err.exception),
+                         "The scene grid size must be greater than 0")
+
+    def test_commands_recorded(self) -> None:
+        """Test draw methods are recorded in order"""
+        self.assertEqual(len(self.test_scene), 4)
+        self.assertEqual(self.test_scene.commands[0],
+                         ("draw_rect", ((255, 0, 0), 1, 1, 2, 1, 0)))
+        self.test_scene.clear()
+        self.assertEqual(len(self.test_scene), 0)
+
+    def test_render_matches_shape_factory(self) -> None:
+        """Test rendering draws the same pixels as a ShapeFactory"""
+        surface = pygame.Surface((101, 101))
+        grid = self.test_scene.render(surface)
+        self.assertEqual(grid.size, (4, 4))
+        expected = pygame.Surface((101, 101))
+        expected.fill((255, 255, 255))
+        shape_factory = ShapeFactory(grid)
+        pygame.draw.rect(expected, (255, 0, 0),
+                         (grid.position(1, 1), grid.square(1, 1, 3, 2)))
+        shape_factory.draw_circle(expected, (0, 0, 255), (3.5, 3.5), 6.25)
+        shape_factory.draw_line(expected, (0, 255, 0), (0, 4), (4, 0))
+        grid.draw_grid_to_surface(expected)
+        self.assertEqual(pygame.image.tobytes(surface, "RGB"),
+                         pygame.image.tobytes(expected, "RGB"))
+
+    def test_render_scales_with_resolution(self) -> None:
+        """Test the same scene is drawn in proportion at any size"""
+        small, large = pygame.Surface((41, 41)), pygame.Surface((401, 401))
+        self.test_scene.render(small)
+        self.test_scene.render(large)
+        self.assertEqual(small.get_at((15, 15)), (255, 0, 0))
+        self.assertEqual(large.get_at((150, 150)), (255, 0, 0))
+        self.assertEqual(large.get_at((350, 350)), (0, 0, 255))
+
+    def test_render_error_grid_size(self) -> None:
+        """Test rendering with a grid of a different size errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            self.test_scene.render(pygame.Surface((10, 10)),
+                                   GridCalculator(10, 10, 2, 2))
+        self.assertEqual(str(err.exception),
+                         "The grid size ((2, 2)) must match the scene size "
+                         "((4, 4))")
+
+    def test_pickle(self) -> None:
+        """Test scenes can be sent to other processes"""
+        scene = pickle.loads(pickle.dumps(self.test_scene))
+        self.assertEqual(scene.commands, self.test_scene.commands)
+
+
+class TestExportFrames(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.test_dir.cleanup()
+
+    def test_export_png(self) -> None:
+        """Test each frame is written at each resolution"""
+        paths = export_frames(_scene_for_frame, [(41, 41), (81, 61)],
+                              self.test_dir.name, range(2), max_workers=2)
+        self.assertEqual([os.path.basename(path) for path in paths],
+                         ["frame_00000_41x41.png", "frame_00000_81x61.png",
+                          "frame_00001_41x41.png", "frame_00001_81x61.png"])
+        image = pygame.image.load(paths[3])
+        self.assertEqual(image.get_size(), (81, 61))
+        self.assertEqual(image.get_at((25, 5)), (255, 0, 0))
+        self.assertEqual(image.get_at((5, 5)), (255, 255, 255))
+
+    def test_export_raw(self) -> None:
+        """Test raw frames are written as unpacked RGB bytes"""
+        scene = _scene_for_frame(0)
+        paths = export_frames(scene, [(8, 8)], self.test_dir.name,
+                              image_format="raw", max_workers=1)
+        with open(paths[0], "rb") as raw_file:
+            data = raw_file.read()
+        self.assertEqual(len(data), 8 * 8 * 3)
+        self.assertEqual(data[:3], bytes((255, 0, 0)))
+
+    def test_export_error_format(self) -> None:
+        """Test an unknown image format errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            export_frames(Scene(2, 2), [(10, 10)], self.test_dir.name,
+                          image_format="gif")
+        self.assertEqual(str(err.exception),
+                         "The image format provided (gif) must be one of "
+                         "png, raw")
@@ -1,9 +1,24 @@
 import unittest
 import pygame
-from pygame_gridcalculator.gridcalculator import GridCalculator
+from pygame_gridcalculator.gridcalculator import BoundaryPolicy, \
+    GridCalculator, GridCalculatorException
 from pygame_gridcalculator.shapefactory import ShapeFactory
 
 
+class CountingGridCalculator(GridCalculator):
+    """A GridCalculator that counts how many times its geometry is read."""
+    reads = 0
+
+    @property
+    def _geometry(self):
+        self.reads += 1
+        return self._snapshot
+
+    @_geometry.setter
+    def _geometry(self, geometry) -> None:
+        self._snapshot = geometry
+
+
 class TestShapeFactory(unittest.TestCase):
     def setUp(self) -> None:
         self.test_surface = pygame.Surface((100, 100))
@@ -91,3 +106,151 @@ class TestShapeFactory(unittest.TestCase):
         self.assertEqual(result.top, 45)
         self.assertEqual(result.width, 10)
         self.assertEqual(result.height, 10)
+
+    def test_blit_image(self) -> None:
+        """Test blitting an image scaled to a grid cell span"""
+        image = pygame.Surface((10, 10))
+        image.fill((255, 0, 0))
+        result = self.test_shape_factory.blit_image(self.test_surface, image,
+                                                    1, 1, 2, 1)
+        self.assertEqual(result, pygame.Rect(25, 25, 50, 25))
+        self.assertEqual(self.test_surface.get_at((60, 40)),
+                         pygame.Color(255, 0, 0))
+
+    def test_blit_image_keep_aspect(self) -> None:
+        """Test blitting an image keeping its aspect ratio centres it"""
+        image = pygame.Surface((10, 10))
+        result = self.test_shape_factory.blit_image(self.test_surface, image,
+                                                    0, 0, 2, 1,
+                                                    keep_aspect=True)
+        self.assertEqual(result, pygame.Rect(13, 0, 25, 25))
+
+    def test_blit_image_reuses_scaled_image(self) -> None:
+        """Test scaled images are cached until the grid is updated"""
+        image = pygame.Surface((10, 10))
+        self.test_shape_factory.blit_image(self.test_surface, image, 0, 0)
+        self.test_shape_factory.blit_image(self.test_surface, image, 1, 1)
+        self.assertEqual(len(self.test_shape_factory._image_cache), 1)
+        self.test_shape_factory.blit_image(self.test_surface, image, 0, 0, 2,
+                                           2)
+        self.assertEqual(len(self.test_shape_factory._image_cache), 2)
+        self.test_grid.update_pixel_positions(200, 200)
+        self.test_shape_factory.blit_image(self.test_surface, image, 0, 0)
+        self.assertEqual(len(self.test_shape_factory._image_cache), 1)
+
+    def test_blit_image_cache_is_bounded(self) -> None:
+        """Test the scaled image cache evicts the least recently used image"""
+        shape_factory = ShapeFactory(self.test_grid, image_cache_size=2)
+        images = [pygame.Surface((10, 10)) for _ in range(3)]
+        for image in images:
+            shape_factory.blit_image(self.test_surface, image, 0, 0)
+        self.assertEqual(len(shape_factory._image_cache), 2)
+
+    def test_draw_text(self) -> None:
+        """Test drawing text fits it within the grid cell span"""
+        pygame.font.init()
+        result = self.test_shape_factory.draw_text(self.test_surface, "12",
+                                                   (255, 255, 255), 1, 1, 2,
+                                                   1)
+        self.assertIsInstance(result, pygame.Rect)
+        self.assertTrue(pygame.Rect(25, 25, 50, 25).contains(result))
+        self.assertEqual(result.center, (50, 37))
+
+    def test_draw_text_empty(self) -> None:
+        """Test drawing empty text draws nothing"""
+        pygame.font.init()
+        result = self.test_shape_factory.draw_text(self.test_surface, "",
+                                                   (255, 255, 255), 1, 1)
+        self.assertEqual(result.size, (0, 0))
+
+    def test_draw_text_reuses_rendered_text(self) -> None:
+        """Test rendered text is cached until the grid is updated"""
+        pygame.font.init()
+        for left in range(4):
+            self.test_shape_factory.draw_text(self.test_surface, "7",
+                                              (0, 0, 0), left, 0)
+        self.assertEqual(len(self.test_shape_factory._text_cache), 1)
+        self.assertEqual(len(self.test_shape_factory._font_size_cache), 1)
+        self.test_grid.update_pixel_positions(200, 200)
+        self.test_shape_factory.draw_text(self.test_surface, "7", (0, 0, 0),
+                                          0, 0)
+        self.assertEqual(len(self.test_shape_factory._text_cache), 1)
+        self.assertIsNotNone(self.test_shape_factory._font_size_cache.get(
+            (None, "7", (50, 50), 256)))
+
+    def test_subsurface(self) -> None:
+        """Test getting a subsurface view of a grid cell span"""
+        result = self.test_shape_factory.subsurface(self.test_surface, 1, 2,
+                                                    2, 1)
+        self.assertIsInstance(result, pygame.Surface)
+        self.assertIs(result.get_parent(), self.test_surface)
+        self.assertEqual(result.get_offset(), (25, 50))
+        self.assertEqual(result.get_size(), (50, 25))
+        result.fill((0, 255, 0))
+        self.assertEqual(self.test_surface.get_at((25, 50)),
+                         pygame.Color(0, 255, 0))
+
+    def test_subsurface_clipped_to_surface(self) -> None:
+        """Test subsurface views are clipped to the surface provided"""
+        result = self.test_shape_factory.subsurface(pygame.Surface((90, 90)),
+                                                    3, 3)
+        self.assertEqual(result.get_size(), (15, 15))
+
+    def test_subsurface_outside_surface(self) -> None:
+        """Test a span wholly outside the surface gives an empty view at
+        the nearest edge of the surface"""
+        shape_factory = ShapeFactory(GridCalculator(200, 200, 8, 8))
+        surface = pygame.Surface((100, 100))
+        result = shape_factory.subsurface(surface, 6, 6, 2, 2)
+        self.assertEqual(result.get_size(), (0, 0))
+        self.assertEqual(result.get_offset(), (100, 100))
+        result = shape_factory.subsurface(surface, 1, 5, 1, 1)
+        self.assertEqual(result.get_size(), (0, 0))
+        self.assertEqual(result.get_offset(), (25, 100))
+
+    def test_subsurface_reused(self) -> None:
+        """Test subsurface views are cached until the grid is updated"""
+        first = self.test_shape_factory.subsurface(self.test_surface, 1, 1)
+        self.assertIs(self.test_shape_factory.subsurface(self.test_surface,
+                                                         1, 1), first)
+        self.test_grid.update_pixel_positions(80, 80)
+        result = self.test_shape_factory.subsurface(self.test_surface, 1, 1)
+        self.assertIsNot(result, first)
+        self.assertEqual(result.get_offset(), (20, 20))
+
+    def test_shapes_read_geometry_once(self) -> None:
+        """Test every point of a shape is converted from one geometry"""
+        grid = CountingGridCalculator(100, 100, 4, 4)
+        shape_factory = ShapeFactory(grid)
+        shapes = (
+            lambda: shape_factory.Rect(1, 1, 20, 30),
+            lambda: shape_factory.draw_line(self.test_surface, (255, 0, 0),
+                                            (1, 1), (2, 2)),
+            lambda: shape_factory.draw_aaline(self.test_surface, (255, 0, 0),
+                                              (1, 1), (2, 2)),
+            lambda: shape_factory.draw_lines(self.test_surface, (255, 0, 0),
+                                             False, [(0, 0), (1, 2), (3, 3)]),
+            lambda: shape_factory.draw_polygon(self.test_surface,
+                                               (255, 0, 0),
+                                               [(0, 0), (1, 2), (3, 3)]),
+            lambda: shape_factory.draw_circle(self.test_surface, (255, 0, 0),
+                                              (2, 2), 5),
+            lambda: shape_factory._grid_span_rect(1, 1, 2, 2))
+        for shape in shapes:
+            grid.reads = 0
+            shape()
+            self.assertEqual(grid.reads, 1)
+
+    def test_span_ending_before_start_error(self) -> None:
+        """Test a span that wraps round to end before it starts errors"""
+        grid = GridCalculator(100, 100, 4, 4,
+                              boundary_policy=BoundaryPolicy.WRAP)
+        with self.assertRaises(GridCalculatorException):
+            ShapeFactory(grid).subsurface(self.test_surface, 3, 0, 2, 1)
+
+    def test_draw_cell(self) -> None:
+        """Test drawing a single grid cell"""
+        result = self.test_shape_factory.draw_cell(self.test_surface,
+                                                   (255, 0, 0), 1, 2)
+        self.assertEqual(result, pygame.Rect(25, 50, 26, 26))
+        self.assertEqual(self.test_surface.get_at((30, 60)), (255, 0, 0))
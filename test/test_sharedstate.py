@@ -0,0 +1,125 @@
+import multiprocessing
+import unittest
+import numpy
+from pygame_gridcalculator import GridCalculatorException
+from pygame_gridcalculator.sharedstate import SharedGridState
+
+
+def _simulate(name: str, frames: int) -> None:
+    state = SharedGridState.attach(name)
+    for frame in range(1, frames + 1):
+        state.back_cells[...] = frame
+        state.back_entities[0] = (frame, frame * 2)
+        state.set_entity_count(1)
+        state.publish()
+    state.close()
+
+
+class _InterleavedHeader(numpy.ndarray):
+    """A header that calls a function after every value written to it, to
+    run a reader part way through publish."""
+    on_write = None
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        if self.on_write is not None:
+            self.on_write()
+
+
+class TestSharedGridState(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_state = SharedGridState(4, 3, numpy.int16, max_entities=2,
+                                          entity_fields=2)
+
+    def tearDown(self) -> None:
+        self.test_state.close()
+        self.test_state.unlink()
+
+    def test_init(self) -> None:
+        """Test creating the shared state works as expected"""
+        self.assertEqual(self.test_state.size, (4, 3))
+        self.assertEqual(self.test_state.frame, 0)
+        self.assertEqual(self.test_state.back_cells.dtype, numpy.int16)
+        self.assertEqual(self.test_state.back_entities.shape, (2, 2))
+
+    def test_init_error_grid_too_small(self) -> None:
+        """Test creating a grid of 0 cells errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            SharedGridState(0, 3)
+        self.assertEqual(str(err.exception),
+                         "The grid must be at least 1 cell wide and high")
+
+    def test_publish_swaps_buffers(self) -> None:
+        """Test readers only see the back buffer once it is published"""
+        self.test_state.back_cells[1, 2] = 7
+        frame, cells, entities = self.test_state.snapshot()
+        self.assertEqual((frame, int(cells[1, 2])), (0, 0))
+        self.assertEqual(entities.shape, (0, 2))
+        self.test_state.set_entity_count(1)
+        self.assertEqual(self.test_state.publish(), 1)
+        frame, cells, entities = self.test_state.snapshot()
+        self.assertEqual((frame, int(cells[1, 2])), (1, 7))
+        self.assertEqual(entities.shape, (1, 2))
+        self.assertEqual(int(self.test_state.back_cells[1, 2]), 0)
+
+    def test_snapshot_during_publish(self) -> None:
+        """Test a snapshot taken between any two header writes of publish
+        returns either the old frame or the new one, never a mix"""
+        snapshots = []
+        header = self.test_state._header.view(_InterleavedHeader)
+        self.test_state._header = header
+        for frame in range(1, 5):
+            self.test_state.back_cells[...] = frame
+            self.test_state.back_entities[0] = (frame, frame)
+            self.test_state.set_entity_count(1)
+            header.on_write = lambda: snapshots.append(
+                self.test_state.snapshot(timeout=1))
+            self.test_state.publish(copy_forward=frame % 2 == 0)
+            header.on_write = None
+        self.assertTrue(snapshots)
+        for frame, cells, entities in snapshots:
+            self.assertTrue((cells == frame).all())
+            if frame:
+                self.assertEqual(entities.tolist(), [[frame, frame]])
+
+    def test_publish_copy_forward(self) -> None:
+        """Test the published frame can be copied into the back buffer"""
+        self.test_state.back_cells[0, 0] = 3
+        self.test_state.set_entity_count(2)
+        self.test_state.publish(copy_forward=True)
+        self.assertEqual(int(self.test_state.back_cells[0, 0]), 3)
+        self.test_state.publish()
+        self.assertEqual(len(self.test_state.snapshot()[2]), 2)
+
+    def test_set_entity_count_error(self) -> None:
+        """Test using more entities than the table holds errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            self.test_state.set_entity_count(3)
+        self.assertEqual(str(err.exception),
+                         "The entity count (3) must be between 0 and the "
+                         "max entities (2)")
+
+    def test_attach_error_not_shared_state(self) -> None:
+        """Test attaching to other shared memory errors"""
+        memory = multiprocessing.shared_memory.SharedMemory(create=True,
+                                                            size=128)
+        try:
+            with self.assertRaises(GridCalculatorException):
+                SharedGridState.attach(memory.name)
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def test_other_process_publishes_frames(self) -> None:
+        """Test frames published by another process are read whole"""
+        process = multiprocessing.Process(
+            target=_simulate, args=(self.test_state.name, 200))
+        process.start()
+        frame = 0
+        while frame < 200:
+            frame, cells, entities = self.test_state.snapshot(timeout=10)
+            if frame:
+                self.assertTrue((cells == frame).all())
+                self.assertEqual(entities.tolist(), [[frame, frame * 2]])
+        process.join(10)
+        self.assertEqual(process.exitcode, 0)
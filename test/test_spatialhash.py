@@ -0,0 +1,83 @@
+import unittest
+import pygame
+from pygame_gridcalculator import GridCalculator, ShapeFactory
+from pygame_gridcalculator.spatialhash import SpatialHash
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_grid = GridCalculator(100, 100, 10, 10)
+        self.test_hash = SpatialHash(self.test_grid)
+        self.test_hash.insert("a", pygame.Rect(5, 5, 10, 10))
+        self.test_hash.insert("b", pygame.Rect(12, 12, 10, 10))
+        self.test_hash.insert("c", pygame.Rect(80, 80, 5, 5))
+
+    def test_insert(self) -> None:
+        """Test objects are bucketed into the cells they overlap"""
+        self.assertEqual(len(self.test_hash), 3)
+        self.assertEqual(self.test_hash.query_cells(0, 0), {"a"})
+        self.assertEqual(self.test_hash.query_cells(1, 1), {"a", "b"})
+        self.assertEqual(self.test_hash.query_cells(2, 2), {"b"})
+
+    def test_insert_grid(self) -> None:
+        """Test objects can be added using grid positions"""
+        self.test_hash.insert_grid("d", 8, 8, 1, 1)
+        self.test_hash.insert_grid("e", 5.5, 5.5)
+        self.assertEqual(self.test_hash.query_cells(8, 8), {"c", "d"})
+        self.assertEqual(self.test_hash.query_cells(5, 5), {"e"})
+        self.assertEqual(self.test_hash.rect("d"),
+                         pygame.Rect(80, 80, 10, 10))
+
+    def test_insert_moves_object(self) -> None:
+        """Test inserting an existing key moves it between cells"""
+        self.test_hash.insert("a", pygame.Rect(50, 50, 5, 5))
+        self.assertEqual(self.test_hash.query_cells(0, 0), set())
+        self.assertEqual(self.test_hash.query_cells(5, 5), {"a"})
+        self.assertEqual(len(self.test_hash), 3)
+
+    def test_insert_outside_grid(self) -> None:
+        """Test objects outside the grid are kept but not found"""
+        self.test_hash.insert("d", pygame.Rect(150, 150, 5, 5))
+        self.assertIn("d", self.test_hash)
+        self.assertEqual(self.test_hash.query_rect(pygame.Rect(0, 0, 200,
+                                                               200)),
+                         {"a", "b", "c"})
+
+    def test_remove(self) -> None:
+        """Test removing an object"""
+        self.test_hash.remove("b")
+        self.assertNotIn("b", self.test_hash)
+        self.assertEqual(self.test_hash.query_cells(1, 1), {"a"})
+
+    def test_query_rect_and_point(self) -> None:
+        """Test querying by pixel Rect and pixel point"""
+        self.assertEqual(self.test_hash.query_rect(pygame.Rect(0, 0, 20,
+                                                               20)),
+                         {"a", "b"})
+        self.assertEqual(self.test_hash.query_rect(pygame.Rect(0, 0, 8, 8),
+                                                   exact=True), {"a"})
+        self.assertEqual(self.test_hash.query_point(15, 15), {"a", "b"})
+
+    def test_neighbours(self) -> None:
+        """Test finding the objects sharing cells with an object"""
+        self.assertEqual(self.test_hash.neighbours("a"), {"b"})
+        self.assertEqual(self.test_hash.neighbours("a", exact=True), {"b"})
+        self.assertEqual(self.test_hash.neighbours("c"), set())
+
+    def test_pairs(self) -> None:
+        """Test finding every pair of objects sharing a cell"""
+        self.test_hash.insert("d", pygame.Rect(18, 0, 1, 1))
+        self.assertEqual(self.test_hash.pairs(), {("a", "b"), ("a", "d")})
+        self.assertEqual(self.test_hash.pairs(exact=True), {("a", "b")})
+
+    def test_resized_grid_rebuckets(self) -> None:
+        """Test updating the grid re-buckets the objects"""
+        self.test_grid.update_grid(5, 5)
+        self.assertEqual(self.test_hash.query_cells(4, 4), {"c"})
+        self.assertEqual(self.test_hash.query_cells(0, 0), {"a", "b"})
+
+    def test_shape_factory_rects(self) -> None:
+        """Test Rects from a ShapeFactory can be added"""
+        shape_factory = ShapeFactory(self.test_grid)
+        self.test_hash.insert("d", shape_factory.Rect(3, 3, 10, 10))
+        self.assertEqual(self.test_hash.query_cells(3, 3), {"d"})
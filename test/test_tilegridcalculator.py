@@ -0,0 +1,134 @@
+import unittest
+import pygame
+from pygame_gridcalculator import BoundaryPolicy, GridCalculatorException, \
+    HexGridCalculator, IsometricGridCalculator
+from pygame_gridcalculator.tilegridcalculator import _TileGridCalculator
+
+
+class TestHexGridCalculator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_grid = HexGridCalculator(270, 100, 4, 3)
+        self.test_flat_grid = HexGridCalculator(100, 270, 3, 4, pointy=False)
+
+    def test_init_grid(self) -> None:
+        """Test initialising a hex grid works as expected"""
+        self.assertEqual(self.test_grid.size, (4, 3))
+        self.assertTrue(self.test_grid.pointy)
+        self.assertEqual(self.test_grid.tile_size, (60, 40))
+        self.assertEqual(self.test_flat_grid.tile_size, (40, 60))
+        self.assertEqual(len(self.test_grid.vertex_offsets), 6)
+
+    def test_cell_center(self) -> None:
+        """Test odd rows (pointy) and columns (flat) are shifted"""
+        self.assertEqual(self.test_grid.cell_center(0, 0), (30, 20))
+        self.assertEqual(self.test_grid.cell_center(0, 1), (60, 50))
+        self.assertEqual(self.test_grid.cell_center(3, 2), (210, 80))
+        self.assertEqual(self.test_flat_grid.cell_center(0, 0), (20, 30))
+        self.assertEqual(self.test_flat_grid.cell_center(1, 0), (50, 60))
+
+    def test_cell_vertices(self) -> None:
+        """Test the vertices of a pointy topped hexagon"""
+        self.assertEqual(self.test_grid.cell_vertices(0, 0),
+                         [(30, 0), (60, 10), (60, 30), (30, 40), (0, 30),
+                          (0, 10)])
+
+    def test_neighbours_share_vertices(self) -> None:
+        """Test neighbouring cells share an edge"""
+        self.assertEqual(len(set(self.test_grid.cell_vertices(0, 0)) &
+                             set(self.test_grid.cell_vertices(0, 1))), 2)
+        self.assertEqual(len(set(self.test_flat_grid.cell_vertices(0, 0)) &
+                             set(self.test_flat_grid.cell_vertices(1, 0))), 2)
+
+    def test_cell_at_round_trip(self) -> None:
+        """Test every cell centre maps back to its cell"""
+        for grid in (self.test_grid, self.test_flat_grid):
+            width, height = grid.size
+            for left in range(width):
+                for top in range(height):
+                    self.assertEqual(grid.cell_at(*grid.cell_center(left,
+                                                                    top)),
+                                     (left, top))
+
+    def test_cell_at_outside_cells(self) -> None:
+        """Test a pixel in the grid area but outside every cell errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            self.test_grid.cell_at(1, 1)
+        self.assertEqual(str(err.exception),
+                         "The cell provided ((-1, -1)) isn't in the grid "
+                         "(0 - 3, 0 - 2)")
+        grid = HexGridCalculator(270, 100, 4, 3,
+                                 boundary_policy=BoundaryPolicy.CLAMP)
+        self.assertEqual(grid.cell_at(1, 1), (0, 0))
+
+    def test_update_grid_recalculates_tables(self) -> None:
+        """Test the vertex tables follow updates to the grid"""
+        self.test_grid.update_pixel_positions(540, 200)
+        self.assertEqual(self.test_grid.tile_size, (120, 80))
+        self.assertEqual(self.test_grid.cell_center(0, 0), (60, 40))
+        self.test_grid.update_grid(2, 2)
+        self.assertEqual(self.test_grid.cell_center(1, 1), (432, 143))
+
+    def test_translated(self) -> None:
+        """Test a translated hex grid keeps its shape and moves its cells"""
+        translated = self.test_flat_grid.translated(10, 20)
+        self.assertFalse(translated.pointy)
+        self.assertEqual(translated.cell_center(1, 0), (40, 40))
+        self.assertEqual(translated.cell_at(40, 40), (1, 0))
+
+    def test_draw_grid_to_surface(self) -> None:
+        """Test drawing the outline of every hexagon"""
+        surface = pygame.Surface((280, 110))
+        self.test_grid.draw_grid_to_surface(surface, (255, 255, 255))
+        self.assertEqual(surface.get_at((30, 0)), (255, 255, 255))
+        self.assertEqual(surface.get_at((30, 20)), (0, 0, 0))
+
+    def test_draw_grid_to_surface_fill(self) -> None:
+        """Test small hexagons fill the grid area"""
+        surface = pygame.Surface((280, 110))
+        self.test_grid.draw_grid_to_surface(surface, (255, 255, 255),
+                                            fill_spacing=50)
+        self.assertEqual(surface.get_at((30, 20)), (255, 255, 255))
+
+
+class TestIsometricGridCalculator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_grid = IsometricGridCalculator(200, 100, 3, 1)
+
+    def test_init_grid(self) -> None:
+        """Test initialising an isometric grid works as expected"""
+        self.assertEqual(self.test_grid.tile_size, (100, 50))
+        self.assertEqual(self.test_grid.vertex_offsets,
+                         [(0, -25), (50, 0), (0, 25), (-50, 0)])
+
+    def test_cell_center_and_vertices(self) -> None:
+        """Test columns run down to the right from the top corner"""
+        self.assertEqual(self.test_grid.cell_center(0, 0), (50, 25))
+        self.assertEqual(self.test_grid.cell_center(2, 0), (150, 75))
+        self.assertEqual(self.test_grid.cell_vertices(1, 0),
+                         [(100, 25), (150, 50), (100, 75), (50, 50)])
+
+    def test_cell_at(self) -> None:
+        """Test pixels map to the diamond containing them"""
+        self.assertEqual(self.test_grid.cell_at(50, 5), (0, 0))
+        self.assertEqual(self.test_grid.cell_at(100, 45), (1, 0))
+        self.assertEqual(self.test_grid.cells_at([(160, 75), (100, 74)]),
+                         [(2, 0), (1, 0)])
+        with self.assertRaises(GridCalculatorException):
+            self.test_grid.cell_at(5, 95)
+
+
+class TestTileGridCalculator(unittest.TestCase):
+    def test_incomplete_subclass_error(self) -> None:
+        """Test a tile grid missing a cell shape method can't be created"""
+        class NoCenterGridCalculator(_TileGridCalculator):
+            def _calculate_tables(self, geometry):
+                return None
+
+            def _fill_points(self, geometry):
+                return []
+
+            def _nearest_cell(self, pixel_left, pixel_top, geometry):
+                return 0, 0
+
+        with self.assertRaises(TypeError):
+            NoCenterGridCalculator(100, 100, 2, 2)
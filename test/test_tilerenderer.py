@@ -0,0 +1,87 @@
+import unittest
+import pygame
+from pygame_gridcalculator import GridCalculator, GridCalculatorException, \
+    HexGridCalculator, ShapeFactory, WeightedGridCalculator
+from pygame_gridcalculator.tilerenderer import TileRenderer
+
+
+def _draw(surface: pygame.Surface, shape_factory: ShapeFactory,
+          cells: tuple) -> None:
+    shape_factory.draw_circle(surface, (255, 0, 0), (2.5, 2.5), 2)
+    shape_factory.draw_cell(surface, (0, 0, 255), 1, 1)
+    pygame.draw.rect(surface, (0, 255, 0), shape_factory.Rect(3, 2, 4, 2))
+
+
+class TestTileRenderer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_grid = GridCalculator(197, 113, 9, 7, 3, 5)
+        self.test_renderer = TileRenderer(self.test_grid, (4, 3), 4)
+
+    def tearDown(self) -> None:
+        self.test_renderer.close()
+
+    def _assert_matches_single_thread(self, grid: GridCalculator,
+                                      renderer: TileRenderer) -> None:
+        expected = pygame.Surface((200, 120))
+        expected.fill((9, 9, 9))
+        _draw(expected, ShapeFactory(grid), None)
+        grid.draw_grid_to_surface(expected, (255, 255, 255))
+        result = pygame.Surface((200, 120))
+        result.fill((9, 9, 9))
+        renderer.render(result, _draw, (9, 9, 9), (255, 255, 255))
+        self.assertEqual(pygame.image.tobytes(result, "RGB"),
+                         pygame.image.tobytes(expected, "RGB"))
+
+    def test_init_error_tile_size_too_small(self) -> None:
+        """Test a tile size of 0 cells errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            TileRenderer(self.test_grid, (0, 4))
+        self.assertEqual(str(err.exception),
+                         "The tile size ((0, 4)) must be at least 1 cell")
+
+    def test_init_error_not_rectangular(self) -> None:
+        """Test grids of hexagons can't be split into tiles"""
+        with self.assertRaises(GridCalculatorException) as err:
+            TileRenderer(HexGridCalculator(100, 100, 4, 4))
+        self.assertEqual(str(err.exception),
+                         "Only grids of rectangular cells can be split into "
+                         "tiles")
+
+    def test_tiles_aligned_to_cells(self) -> None:
+        """Test tiles are split on cell borders and cover the grid"""
+        tiles = self.test_renderer.tiles(pygame.Surface((200, 120)))
+        self.assertEqual([span for span, _ in tiles],
+                         [(0, 0, 4, 3), (4, 0, 4, 3), (8, 0, 1, 3),
+                          (0, 3, 4, 3), (4, 3, 4, 3), (8, 3, 1, 3),
+                          (0, 6, 4, 1), (4, 6, 4, 1), (8, 6, 1, 1)])
+        self.assertEqual(tiles[0][1], pygame.Rect(3, 5, 86, 46))
+        self.assertEqual(tiles[1][1].left, self.test_grid.left_point(4))
+        self.assertEqual(tiles[-1][1].bottomright, (198, 114))
+
+    def test_render_matches_single_thread(self) -> None:
+        """Test tiled drawing matches drawing the whole surface at once"""
+        self._assert_matches_single_thread(self.test_grid,
+                                           self.test_renderer)
+
+    def test_render_weighted_grid(self) -> None:
+        """Test tiled drawing of a weighted grid keeps its cell sizes"""
+        grid = WeightedGridCalculator(190, 110, [1, 2, 3, 1, 1, 2, 1],
+                                      [1, 1, 2, 1], 4, 2)
+        with TileRenderer(grid, (3, 2), 2) as renderer:
+            self._assert_matches_single_thread(grid, renderer)
+
+    def test_render_follows_grid_updates(self) -> None:
+        """Test tiles are rebuilt after the grid is updated"""
+        surface = pygame.Surface((200, 120))
+        self.test_renderer.render(surface)
+        self.test_grid.update_grid(5, 5)
+        self.assertEqual(len(self.test_renderer.render(surface)), 4)
+        self._assert_matches_single_thread(self.test_grid,
+                                           self.test_renderer)
+
+    def test_render_raises_draw_errors(self) -> None:
+        """Test errors raised while drawing a tile are raised by render"""
+        def draw(surface, shape_factory, cells):
+            raise ValueError("draw failed")
+        with self.assertRaises(ValueError):
+            self.test_renderer.render(pygame.Surface((200, 120)), draw)
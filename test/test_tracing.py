@@ -0,0 +1,182 @@
+import io
+import json
+import threading
+import unittest
+import pygame
+from pygame_gridcalculator import GridCalculator, GridCalculatorException, \
+    ShapeFactory
+from pygame_gridcalculator.tilerenderer import TileRenderer
+from pygame_gridcalculator.tracing import FrameTracer
+
+
+class FakeClock:
+    """A clock that moves on by a millisecond every time it is read."""
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 0.001
+        return self.now
+
+
+class BlockingGridCalculator(GridCalculator):
+    """A GridCalculator whose left_point waits for an event once started is
+    set, so a call can be held part way through on another thread."""
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.block = False
+
+    def left_point(self, point: float) -> int:
+        if self.block:
+            self.block = False
+            self.started.set()
+            self.release.wait(5)
+        return super().left_point(point)
+
+
+class TestFrameTracer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.output = io.StringIO()
+        self.tracer = FrameTracer(self.output, clock=FakeClock())
+        self.grid = GridCalculator(100, 100, 10, 10)
+        self.shape_factory = ShapeFactory(self.grid)
+
+    def events(self) -> list:
+        """Closes the tracer and returns the events written."""
+        self.tracer.close()
+        return json.loads(self.output.getvalue())
+
+    def test_frames_and_spans(self) -> None:
+        """Test frames and phases are written as complete events"""
+        for _ in range(2):
+            with self.tracer.frame():
+                with self.tracer.span("events"):
+                    pass
+                with self.tracer.span("display", vsync=True):
+                    pass
+        self.assertEqual(self.tracer.frames, 2)
+        events = self.events()
+        self.assertEqual(events[0]["ph"], "M")
+        names = [event["name"] for event in events if event["ph"] == "X"]
+        self.assertEqual(names, ["events", "display", "frame 0",
+                                 "events", "display", "frame 1"])
+        display = events[2]
+        self.assertEqual(display["args"], {"vsync": True})
+        self.assertEqual(display["dur"], 1000)
+        frame = events[3]
+        self.assertLessEqual(frame["ts"], events[1]["ts"])
+        self.assertGreaterEqual(frame["ts"] + frame["dur"],
+                                display["ts"] + display["dur"])
+
+    def test_instrumented_calls(self) -> None:
+        """Test grid and shape factory calls are counted per frame, with
+        calls inside calls of the same category counted once"""
+        self.tracer.instrument(self.grid)
+        self.tracer.instrument(self.shape_factory)
+        surface = pygame.Surface((101, 101))
+        with self.tracer.frame():
+            self.grid.points_from_left(2)
+            self.shape_factory.draw_line(surface, (255, 0, 0), (0, 0),
+                                         (5, 5))
+            self.shape_factory.draw_circle(surface, (255, 0, 0), (5, 5), 3)
+        with self.tracer.frame():
+            pass
+        events = self.events()
+        frames = [event for event in events
+                  if event["name"].startswith("frame")]
+        self.assertEqual(frames[0]["args"]["points_from_left"]["calls"], 1)
+        self.assertEqual(frames[0]["args"]["draw_line"]["calls"], 1)
+        # The circle's centre is converted by the grid
+        self.assertEqual(frames[0]["args"]["position"]["calls"], 1)
+        self.assertNotIn("args", frames[1])
+        counters = {event["name"] for event in events if event["ph"] == "C"}
+        self.assertEqual(counters, {"conversion", "drawing"})
+
+    def test_calls_from_several_threads(self) -> None:
+        """Test calls are counted while another thread is part way through a
+        call of the same category, and counts from many threads add up"""
+        grid = BlockingGridCalculator(100, 100, 10, 10)
+        self.tracer.instrument(grid)
+        grid.block = True
+        with self.tracer.frame():
+            blocked = threading.Thread(target=grid.left_point, args=(1,))
+            blocked.start()
+            grid.started.wait(5)
+            grid.top_point(1)
+            grid.release.set()
+            blocked.join()
+            threads = [threading.Thread(
+                target=lambda: [grid.top_point(2) for _ in range(500)])
+                for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        frame = [event for event in self.events()
+                 if event["name"] == "frame 0"][0]
+        self.assertEqual(frame["args"]["left_point"]["calls"], 1)
+        self.assertEqual(frame["args"]["top_point"]["calls"], 2001)
+
+    def test_geometry_update_spans(self) -> None:
+        """Test geometry updates are written as their own spans"""
+        self.tracer.instrument(self.grid)
+        with self.tracer.frame():
+            self.grid.update_pixel_positions(200, 200)
+        self.assertEqual(self.grid.pixel_size, (200, 200))
+        events = self.events()
+        self.assertIn("update_pixel_positions",
+                      [event["name"] for event in events
+                       if event.get("cat") == "geometry"])
+
+    def test_bounded_buffer(self) -> None:
+        """Test events are written once the buffer is full"""
+        output = io.StringIO()
+        tracer = FrameTracer(output, max_buffered_events=3)
+        for _ in range(5):
+            with tracer.frame():
+                pass
+        self.assertGreaterEqual(tracer.events_written, 3)
+        tracer.close()
+        self.assertEqual(len(json.loads(output.getvalue())), 6)
+
+    def test_uninstrument(self) -> None:
+        """Test uninstrumenting and closing restore the original methods"""
+        self.tracer.instrument(self.grid)
+        self.assertIn("cell_at", vars(self.grid))
+        self.tracer.uninstrument(self.grid)
+        self.assertNotIn("cell_at", vars(self.grid))
+        self.tracer.instrument(self.shape_factory)
+        self.tracer.close()
+        self.assertNotIn("draw_line", vars(self.shape_factory))
+        with self.assertRaises(GridCalculatorException):
+            self.tracer.instrument(object())
+
+    def test_translated_grid_is_not_instrumented(self) -> None:
+        """Test grids translated from an instrumented grid have none of its
+        wrappers, so their calls aren't counted as calls on the grid"""
+        self.tracer.instrument(self.grid)
+        translated = self.grid.translated(10, 10)
+        self.assertEqual(vars(translated).keys(),
+                         {"_boundary_policy", "_geometry"})
+        with self.tracer.frame():
+            self.assertEqual(translated.left_point(2), 10)
+        frame = [event for event in self.events()
+                 if event["name"] == "frame 0"][0]
+        self.assertNotIn("args", frame)
+
+    def test_instrumented_grid_with_tile_renderer(self) -> None:
+        """Test an instrumented grid can still be drawn in tiles"""
+        surface = pygame.Surface((101, 101))
+        expected = pygame.Surface((101, 101))
+        self.grid.draw_grid_to_surface(expected, (255, 255, 255))
+        self.tracer.instrument(self.grid)
+        with TileRenderer(self.grid, (3, 3), max_workers=2) as renderer:
+            renderer.render(surface, grid_color=(255, 255, 255))
+        self.assertEqual(pygame.image.tobytes(surface, "RGB"),
+                         pygame.image.tobytes(expected, "RGB"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+from pygame_gridcalculator import BoundaryPolicy, GridCalculator, \
+    GridCalculatorException, WeightedGridCalculator
+
+
+class TestWeightedGridCalculator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_grid = WeightedGridCalculator(100, 60, [1, 2, 1], [1, 1])
+
+    def test_init_grid(self) -> None:
+        """Test initialising a weighted grid works as expected"""
+        self.assertEqual(self.test_grid.size, (3, 2))
+        self.assertEqual(self.test_grid.pixel_size, (100, 60))
+        self.assertEqual(self.test_grid.column_weights, [1.0, 2.0, 1.0])
+        self.assertEqual(self.test_grid.row_weights, [1.0, 1.0])
+
+    def test_init_grid_error_no_weights(self) -> None:
+        """Test initialising a weighted grid without weights errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            WeightedGridCalculator(100, 100, [], [1])
+        self.assertEqual(str(err.exception),
+                         "At least one column weight must be provided")
+
+    def test_init_grid_error_weight_too_low(self) -> None:
+        """Test initialising a weighted grid with a 0 weight errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            WeightedGridCalculator(100, 100, [1], [1, 0])
+        self.assertEqual(str(err.exception),
+                         "The row weights must be greater than 0")
+
+    def test_init_grid_error_fixed_pixels_too_big(self) -> None:
+        """Test initialising with fixed pixels bigger than the grid errors"""
+        with self.assertRaises(GridCalculatorException) as err:
+            WeightedGridCalculator(100, 100, [1, 1], [1],
+                                   fixed_column_pixels={0: 60, 1: 50})
+        self.assertEqual(str(err.exception),
+                         "The fixed column pixels (110) cannot be greater "
+                         "than the pixel range (100)")
+
+    def test_left_point_and_gaps(self) -> None:
+        """Test points are based on the column weights"""
+        self.assertEqual(self.test_grid.left_point(1), 25)
+        self.assertEqual(self.test_grid.left_point(2), 75)
+        self.assertEqual(self.test_grid.left_point(3), 100)
+        self.assertEqual(self.test_grid.left_point(1.5), 50)
+        self.assertEqual(self.test_grid.width_gap(1, 2), 50)
+        self.assertEqual(self.test_grid.position(2, 1), (75, 30))
+        self.assertEqual(self.test_grid.square(0, 0, 2, 2), (75, 60))
+        self.assertEqual(self.test_grid.points_from_right(1), 75)
+
+    def test_fixed_pixels(self) -> None:
+        """Test fixed columns keep their size and others share the rest"""
+        grid = WeightedGridCalculator(300, 100, [1, 1, 1], [1], 10, 0,
+                                      fixed_column_pixels={0: 90})
+        self.assertEqual(grid.left_point(1), 100)
+        self.assertEqual(grid.width_gap(1, 2), 100)
+        grid.update_pixel_positions(210, 100, 10, 0)
+        self.assertEqual(grid.width_gap(0, 1), 90)
+        self.assertEqual(grid.width_gap(1, 2), 55)
+
+    def test_cell_at(self) -> None:
+        """Test getting the cell containing a pixel position"""
+        self.assertEqual(self.test_grid.cell_at(0, 0), (0, 0))
+        self.assertEqual(self.test_grid.cell_at(24, 29), (0, 0))
+        self.assertEqual(self.test_grid.cell_at(25, 30), (1, 1))
+        self.assertEqual(self.test_grid.cell_at(100, 60), (2, 1))
+
+    def test_cell_at_matches_uniform_grid(self) -> None:
+        """Test equal weights match a uniform GridCalculator"""
+        weighted = WeightedGridCalculator(97, 53, [1] * 7, [1] * 6, 3, 2)
+        uniform = GridCalculator(97, 53, 7, 6, 3, 2)
+        for point in range(8):
+            self.assertEqual(weighted.left_point(point),
+                             uniform.left_point(point))
+        for pixel in range(3, 98):
+            self.assertEqual(weighted.cell_at(pixel, 2),
+                             uniform.cell_at(pixel, 2))
+
+    def test_translated(self) -> None:
+        """Test a translated weighted grid keeps its weights and fixed
+        sizes"""
+        grid = WeightedGridCalculator(300, 100, [1, 1, 1], [1], 10, 0,
+                                      fixed_column_pixels={0: 90})
+        translated = grid.translated(100, 0)
+        self.assertIs(type(translated), WeightedGridCalculator)
+        self.assertEqual(translated.column_weights, [1.0, 1.0, 1.0])
+        for point in (0, 1, 1.5, 3):
+            self.assertEqual(translated.left_point(point),
+                             grid.left_point(point) - 100)
+        self.assertEqual(translated.cell_at(0, 0), (1, 0))
+
+    def test_update_weights(self) -> None:
+        """Test updating the weights recalculates the grid"""
+        version = self.test_grid.geometry_version
+        self.test_grid.update_weights(column_weights=[1, 3])
+        self.assertEqual(self.test_grid.size, (2, 2))
+        self.assertEqual(self.test_grid.left_point(1), 25)
+        self.assertGreater(self.test_grid.geometry_version, version)
+
+    def test_update_weights_swaps_offsets_with_geometry(self) -> None:
+        """Test the offsets are replaced along with the rest of the
+        geometry, so a grid read before an update stays consistent"""
+        geometry = self.test_grid._geometry
+        self.test_grid.update_weights(column_weights=[1, 3])
+        self.assertEqual(len(geometry.tables[0]), 4)
+        self.assertEqual(len(self.test_grid._geometry.tables[0]), 3)
+        self.assertEqual(self.test_grid.cell_at(30, 0), (1, 0))
+
+    def test_update_grid(self) -> None:
+        """Test resizing the grid keeps the existing weights"""
+        self.test_grid.update_grid(4, 1)
+        self.assertEqual(self.test_grid.column_weights, [1, 2, 1, 1])
+        self.assertEqual(self.test_grid.row_weights, [1])
+        self.assertEqual(self.test_grid.left_point(1), 20)
+
+    def test_boundary_policy(self) -> None:
+        """Test the boundary policy applies to weighted grids"""
+        grid = WeightedGridCalculator(100, 60, [1, 2, 1], [1, 1],
+                                      boundary_policy=BoundaryPolicy.CLAMP)
+        self.assertEqual(grid.left_point(5), 100)
+        with self.assertRaises(GridCalculatorException):
+            self.test_grid.left_point(5)